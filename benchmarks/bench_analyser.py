@@ -0,0 +1,34 @@
+"""Time the suffix trie analyser per token, on first sight and repeated. Unseen tokens cost
+about in proportion to the parses found for them, so the mean is printed too.
+Run from the repository root with: python -m benchmarks.bench_analyser"""
+
+import time
+
+from kovol_language_tools.verbs import analyser
+from kovol_language_tools.verbs.stanley_predicted_verb import stanley_paradigm
+
+from benchmarks.bench_predict_many import random_roots
+
+
+def main(n=2000):
+    tokens = []
+    for r in random_roots(n):
+        tokens += stanley_paradigm(r + "ɔm", r + "gɔm")
+    tokens = list(dict.fromkeys(tokens))
+
+    start = time.perf_counter()
+    analyser._trie = analyser.build_trie()
+    print(f"trie build          {time.perf_counter() - start:8.2f} s")
+
+    for label in ("unseen tokens", "repeated tokens"):
+        start = time.perf_counter()
+        for t in tokens:
+            analyser.analyse(t)
+        per_token = (time.perf_counter() - start) / len(tokens)
+        print(f"{label:19} {per_token * 1e6:8.1f} us/token")
+    parses = sum(len(analyser.analyse(t)) for t in tokens) / len(tokens)
+    print(f"parses              {parses:8.1f} per token")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Time get_data_from_csv on the same lexicon plain and compressed with gzip, bz2 and xz.
+Run from the repository root with: python -m benchmarks.bench_compressed_csv"""
+
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import time
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv, iter_verbs_from_csv
+from kovol_language_tools.verbs.synthetic import write_synthetic_csv
+
+
+def main(n_verbs=20000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lexicon.csv")
+        write_synthetic_csv(path, n_verbs)
+        files = {"plain": path}
+        for module, ext in ((gzip, "gz"), (bz2, "bz2"), (lzma, "xz")):
+            files[ext] = f"{path}.{ext}"
+            with open(path, "rb") as f, module.open(files[ext], "wb") as out:
+                shutil.copyfileobj(f, out)
+
+        print(f"{'file':>6} {'MB':>6} {'read s':>7} {'stream s':>9}")
+        for name, file in files.items():
+            start = time.perf_counter()
+            get_data_from_csv(file)
+            read = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in iter_verbs_from_csv(file, grouped=True):
+                pass
+            stream = time.perf_counter() - start
+            size = os.path.getsize(file) / 2**20
+            print(f"{name:>6} {size:6.1f} {read:7.2f} {stream:9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Show get_data_from_csv scaling linearly with the number of rows.
+Run from the repository root with: python -m benchmarks.bench_csv_grouping"""
+
+import os
+import tempfile
+import time
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.synthetic import write_synthetic_csv
+
+rows_per_verb = 20
+
+
+def main(sizes=(10**3, 10**4, 10**5, 10**6)):
+    print(f"{'rows':>9} {'list s':>9} {'object s':>9} {'us/row':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            path = os.path.join(tmp, f"{rows}.csv")
+            write_synthetic_csv(path, rows // rows_per_verb)
+            start = time.perf_counter()
+            get_data_from_csv(path, format="list")
+            list_time = time.perf_counter() - start
+            start = time.perf_counter()
+            get_data_from_csv(path)
+            object_time = time.perf_counter() - start
+            print(
+                f"{rows:9} {list_time:9.2f} {object_time:9.2f} {object_time / rows * 1e6:7.1f}"
+            )
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Measure the import time of the package's modules with python -X importtime.
+Run from the repository root with: python -m benchmarks.bench_import_time"""
+
+import subprocess
+import sys
+
+modules = [
+    "kovol_language_tools",
+    "kovol_language_tools.verbs.kovol_verb",
+    "kovol_language_tools.verbs.csv_reader",
+    "kovol_language_tools.verbs.report",
+    "kovol_language_tools.verbs.analyser",
+    "kovol_language_tools.verbs.verb_store",
+]
+
+
+def import_time(module: str) -> int:
+    """Return the cumulative microseconds python -X importtime reports for a module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines()[1:]:  # after the column headings
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise ValueError(f"{module} wasn't imported")
+
+
+def main(repeat=5):
+    print(f"{'module':>40} {'best ms':>8}")
+    for m in modules:
+        best = min(import_time(m) for _ in range(repeat))
+        print(f"{m:>40} {best / 1000:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Compare loading a lexicon from its binary cache with parsing the csv.
+Run from the repository root with: python -m benchmarks.bench_lexicon_cache"""
+
+import os
+import tempfile
+import timeit
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.lexicon_cache import get_cached_data_from_csv
+from kovol_language_tools.verbs.synthetic import write_synthetic_csv
+
+
+def main(n_verbs=2000, repeat=3):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lexicon.csv")
+        write_synthetic_csv(path, n_verbs)
+        get_cached_data_from_csv(path)  # build the cache
+
+        csv_time = min(
+            timeit.repeat(lambda: get_data_from_csv(path), number=1, repeat=repeat)
+        )
+        cache_time = min(
+            timeit.repeat(
+                lambda: get_cached_data_from_csv(path), number=1, repeat=repeat
+            )
+        )
+    print(f"{n_verbs} verbs")
+    print(f"csv    {csv_time * 1000:10.1f} ms")
+    print(f"cache  {cache_time * 1000:10.1f} ms  ({csv_time / cache_time:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
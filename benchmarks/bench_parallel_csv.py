@@ -0,0 +1,36 @@
+"""Time get_data_from_csv_parallel across worker counts against the serial reader, checking
+the output is identical. Run from the repository root with: python -m benchmarks.bench_parallel_csv
+"""
+
+import os
+import tempfile
+import time
+
+from kovol_language_tools.verbs import csv_reader
+from kovol_language_tools.verbs.synthetic import write_synthetic_csv
+
+
+def main(n_verbs=50000, workers=(1, 2, 4, 8)):
+    csv_reader.parallel_csv_bytes = 0  # always use the pool when workers > 1
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lexicon.csv")
+        write_synthetic_csv(path, n_verbs)
+        print(
+            f"{n_verbs} verbs, {os.path.getsize(path) / 2**20:.1f} MB, {os.cpu_count()} cpus"
+        )
+        print(f"{'workers':>8} {'s':>7} {'speedup':>8}")
+
+        start = time.perf_counter()
+        expected = [vars(v) for v in csv_reader.get_data_from_csv(path)]
+        serial = time.perf_counter() - start
+        print(f"{'serial':>8} {serial:7.2f} {1:8.2f}")
+        for w in workers:
+            start = time.perf_counter()
+            verbs = csv_reader.get_data_from_csv_parallel(path, workers=w)
+            elapsed = time.perf_counter() - start
+            assert [vars(v) for v in verbs] == expected
+            print(f"{w:8} {elapsed:7.2f} {serial / elapsed:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare predict_many with building one predicted verb object per input.
+Run from the repository root with: python -m benchmarks.bench_predict_many"""
+
+import random
+import timeit
+
+from kovol_language_tools import facts
+from kovol_language_tools.verbs import hansen_predicted_verb, stanley_predicted_verb
+
+
+def random_roots(n, seed=0):
+    """Build n CV(C)-style roots. Duplicates are expected, as in a real lexicon."""
+    rng = random.Random(seed)
+    consonants = [c for c in facts.phonetic_consonants if c not in ("ʔ", "r")]
+    vowels = ("i", "ɛ", "u", "o", "a")
+    roots = []
+    for _ in range(n):
+        syllables = rng.choice((1, 1, 2))
+        root = "".join(
+            rng.choice(consonants) + rng.choice(vowels) for _ in range(syllables)
+        )
+        if rng.random() < 0.7:
+            root += rng.choice(consonants)
+        roots.append(root)
+    return roots
+
+
+def main(n=10000, repeat=3):
+    roots = random_roots(n)
+    stanley_inputs = [(r + "ɔm", r + "gɔm") for r in roots]
+    hansen_inputs = [r + "is" for r in roots]
+
+    cases = {
+        "stanley per object": lambda: [
+            stanley_predicted_verb.StanleyPredictedVerb(*i).get_all_conjugations()
+            for i in stanley_inputs
+        ],
+        "stanley predict_many": lambda: stanley_predicted_verb.predict_many(
+            stanley_inputs
+        ),
+        "hansen per object": lambda: [
+            hansen_predicted_verb.HansenPredictedVerb(i).get_all_conjugations()
+            for i in hansen_inputs
+        ],
+        "hansen predict_many": lambda: hansen_predicted_verb.predict_many(
+            hansen_inputs
+        ),
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:24} {n / best:12,.0f} verbs/s")
+
+
+if __name__ == "__main__":
+    main()
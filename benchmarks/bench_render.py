@@ -0,0 +1,33 @@
+"""Time rendering a book of paradigms with render_paradigms against print_paradigm per verb.
+Run from the repository root with: python -m benchmarks.bench_render"""
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.render import formats, render_paradigms
+from kovol_language_tools.verbs.synthetic import write_synthetic_csv
+
+
+def main(n_verbs=10000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lexicon.csv")
+        write_synthetic_csv(path, n_verbs)
+        verbs = get_data_from_csv(path)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for v in verbs:
+            v.print_paradigm()
+    print(f"{'print_paradigm':>16} {time.perf_counter() - start:7.2f} s")
+    for format in formats:
+        start = time.perf_counter()
+        render_paradigms(verbs, io.StringIO(), format)
+        print(f"{format:>16} {time.perf_counter() - start:7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare peak memory and time to the first verb of get_data_from_csv and iter_verbs_from_csv,
+for a grouped csv and the same rows shuffled.
+Run from the repository root with: python -m benchmarks.bench_streaming"""
+
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv, iter_verbs_from_csv
+from kovol_language_tools.verbs.synthetic import write_synthetic_csv
+
+
+def shuffle_csv(path, shuffled_path, seed=0) -> None:
+    with open(path, encoding="utf-8") as f:
+        header, *rows = f.read().splitlines()
+    random.Random(seed).shuffle(rows)
+    with open(shuffled_path, "w", encoding="utf-8") as f:
+        f.write("\n".join([header] + rows))
+
+
+def measure(read) -> tuple:
+    """Return (seconds to first verb, total seconds, peak MB) of consuming read()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    for _ in read():
+        if first is None:
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return first, total, peak
+
+
+def main(n_verbs=20000):
+    print(f"{'reader':>24} {'first s':>8} {'total s':>8} {'peak MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "grouped.csv")
+        shuffled = os.path.join(tmp, "shuffled.csv")
+        write_synthetic_csv(path, n_verbs)
+        shuffle_csv(path, shuffled)
+        readers = {
+            "get_data_from_csv": lambda: get_data_from_csv(path),
+            "iter grouped": lambda: iter_verbs_from_csv(path),
+            "iter shuffled": lambda: iter_verbs_from_csv(
+                shuffled, grouped=False, run_size=50000
+            ),
+        }
+        for name, read in readers.items():
+            first, total, peak = measure(read)
+            print(f"{name:>24} {first:8.2f} {total:8.2f} {peak:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
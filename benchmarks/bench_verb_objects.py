@@ -0,0 +1,34 @@
+"""Time turning grouped csv rows into KovolVerbs, separately from reading the file.
+Run from the repository root with: python -m benchmarks.bench_verb_objects"""
+
+import os
+import tempfile
+import time
+
+from kovol_language_tools.verbs.csv_reader import (
+    csv_data_to_verb_object,
+    get_data_from_csv,
+)
+from kovol_language_tools.verbs.synthetic import write_synthetic_csv
+
+
+def main(sizes=(10**3, 10**4, 10**5), repeat=3):
+    print(f"{'verbs':>7} {'rows':>8} {'best s':>8} {'us/row':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = os.path.join(tmp, f"{n}.csv")
+            write_synthetic_csv(path, n)
+            data = get_data_from_csv(path, format="list")
+            rows = sum(len(d) for d in data)
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                csv_data_to_verb_object(data)
+                times.append(time.perf_counter() - start)
+            best = min(times)
+            print(f"{n:7} {rows:8} {best:8.3f} {best / rows * 1e6:7.2f}")
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
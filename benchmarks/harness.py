@@ -0,0 +1,245 @@
+"""Time the verbs pipeline end to end: csv ingest, csv_data_to_verb_object, prediction,
+get_prediction_errors and rendering, for synthetic lexicons described by scenarios.
+Results can be saved as a baseline and later runs compared against it, exiting with status 1
+if any stage got slower or used more memory than the thresholds allow.
+Run from the repository root with: python -m benchmarks.harness [--save baseline.json]
+[--baseline baseline.json] [--scenario small]"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+
+from kovol_language_tools.verbs.csv_reader import (
+    csv_data_to_verb_object,
+    get_data_from_csv,
+)
+from kovol_language_tools.verbs.hansen_predicted_verb import HansenPredictedVerb
+from kovol_language_tools.verbs.predictors import predictors
+from kovol_language_tools.verbs.render import render_paradigms
+from kovol_language_tools.verbs.stanley_predicted_verb import StanleyPredictedVerb
+from kovol_language_tools.verbs.synthetic import write_synthetic_csv
+
+# options are passed to write_synthetic_csv
+Scenario = namedtuple("Scenario", ["verbs", "rules", "format", "options"])
+scenarios = {
+    "small": Scenario(1000, "stanley", "rst", {}),
+    "medium": Scenario(10000, "stanley", "rst", {}),
+    "noisy": Scenario(
+        10000, "stanley", "rst", {"irregularity": 0.1, "noise": 0.02, "short": 0.3}
+    ),
+    "hansen": Scenario(
+        10000, "hansen", "html", {"rules": "mixed", "irregularity": 0.1}
+    ),
+    "shuffled": Scenario(10000, "stanley", "markdown", {"shuffle": True}),
+}
+predicted_verbs = {"stanley": StanleyPredictedVerb, "hansen": HansenPredictedVerb}
+# a stage is a regression if it's slower than the baseline by more than this fraction
+time_threshold = 0.25
+memory_threshold = 0.10
+
+
+def _ingest(state: dict, scenario: Scenario) -> None:
+    state["data"] = get_data_from_csv(state["path"], format="list")
+
+
+def _objects(state: dict, scenario: Scenario) -> None:
+    state["verbs"] = csv_data_to_verb_object(state["data"])
+
+
+def _predict(state: dict, scenario: Scenario) -> None:
+    input_attrs = predictors[scenario.rules][0]
+    cls = predicted_verbs[scenario.rules]
+    pairs = []
+    for verb in state["verbs"]:
+        inputs = [getattr(verb, a) for a in input_attrs]
+        if not all(inputs):
+            continue
+        try:
+            pairs.append((cls(*inputs, verb.english), verb))
+        except IndexError:
+            continue
+    state["pairs"] = pairs
+
+
+def _errors(state: dict, scenario: Scenario) -> None:
+    state["errors"] = sum(bool(p.get_prediction_errors(v)) for (p, v) in state["pairs"])
+
+
+def _render(state: dict, scenario: Scenario) -> None:
+    render_paradigms(state["verbs"], io.StringIO(), scenario.format)
+
+
+# stage: function, run in this order, each using the state left by the ones before
+stages = {
+    "ingest": _ingest,
+    "objects": _objects,
+    "predict": _predict,
+    "errors": _errors,
+    "render": _render,
+}
+
+
+def run_stages(path: str, scenario: Scenario, memory=False) -> dict:
+    """Run each stage once, returning {stage: seconds}, or {stage: peak bytes} traced while
+    the stage ran if memory is True."""
+    state = {"path": path}
+    results = {}
+    if memory:
+        tracemalloc.start()
+    try:
+        for name, function in stages.items():
+            if memory:
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            function(state, scenario)
+            seconds = time.perf_counter() - start
+            results[name] = tracemalloc.get_traced_memory()[1] if memory else seconds
+    finally:
+        if memory:
+            tracemalloc.stop()
+    return results
+
+
+def run_scenario(name: str, scenario: Scenario, warmup=1, repeat=5) -> dict:
+    """Time a scenario's stages repeat times after warmup runs, then trace its memory in one
+    more run. Returns the median seconds, throughput and peak memory of each stage."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"{name}.csv")
+        write_synthetic_csv(path, scenario.verbs, **scenario.options)
+        for _ in range(warmup):
+            run_stages(path, scenario)
+        runs = [run_stages(path, scenario) for _ in range(repeat)]
+        # tracemalloc slows everything down, so memory is measured in a separate run
+        peaks = run_stages(path, scenario, memory=True)
+
+    result = {"verbs": scenario.verbs, "stages": {}}
+    for stage in stages:
+        seconds = statistics.median(r[stage] for r in runs)
+        result["stages"][stage] = {
+            "seconds": seconds,
+            "verbs_per_second": scenario.verbs / seconds if seconds else None,
+            "peak_bytes": peaks[stage],
+        }
+    total = statistics.median(sum(r.values()) for r in runs)
+    result["seconds"] = total
+    result["verbs_per_second"] = scenario.verbs / total if total else None
+    result["peak_bytes"] = max(peaks.values())
+    return result
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    time_limit=time_threshold,
+    memory_limit=memory_threshold,
+):
+    """Compare scenario results with a baseline of the same shape, returning a list of
+    (scenario, stage, measure, baseline, current, ratio) for each regression."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old_stages = baseline[name]["stages"]
+        for stage, new in result["stages"].items():
+            old = old_stages.get(stage)
+            if not old:
+                continue
+            for measure, limit in (
+                ("seconds", time_limit),
+                ("peak_bytes", memory_limit),
+            ):
+                if not old[measure]:
+                    continue
+                ratio = new[measure] / old[measure]
+                if ratio > 1 + limit:
+                    regressions.append(
+                        (name, stage, measure, old[measure], new[measure], ratio)
+                    )
+    return regressions
+
+
+def print_result(name: str, result: dict, baseline=None) -> None:
+    old_stages = baseline["stages"] if baseline else {}
+    print(
+        f"\n{name}: {result['verbs']} verbs, {result['verbs_per_second']:,.0f} verbs/s"
+    )
+    print(f"{'stage':>10} {'seconds':>9} {'verbs/s':>11} {'peak MB':>8} {'vs base':>8}")
+    for stage, r in result["stages"].items():
+        old = old_stages.get(stage)
+        change = (
+            f"{r['seconds'] / old['seconds']:8.2f}" if old and old["seconds"] else ""
+        )
+        print(
+            f"{stage:>10} {r['seconds']:9.3f} {r['verbs_per_second'] or 0:11,.0f}"
+            f" {r['peak_bytes'] / 2**20:8.1f} {change}"
+        )
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Time the verbs pipeline and compare it with a baseline."
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(scenarios),
+        help="scenario to run, can be repeated (default all)",
+    )
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs first")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs")
+    parser.add_argument("--baseline", help="json file of results to compare against")
+    parser.add_argument("--save", help="write the results to this json file")
+    parser.add_argument(
+        "--time-threshold",
+        type=float,
+        default=time_threshold,
+        help="fraction slower than the baseline that fails (default %(default)s)",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=memory_threshold,
+        help="fraction more memory than the baseline that fails (default %(default)s)",
+    )
+    args = parser.parse_args(args)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["scenarios"]
+    results = {}
+    for name in args.scenario or scenarios:
+        results[name] = run_scenario(name, scenarios[name], args.warmup, args.repeat)
+        print_result(name, results[name], baseline.get(name))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "warmup": args.warmup,
+                    "repeat": args.repeat,
+                    "scenarios": results,
+                },
+                f,
+                indent=2,
+            )
+    regressions = compare(results, baseline, args.time_threshold, args.memory_threshold)
+    for name, stage, measure, old, new, ratio in regressions:
+        print(
+            f"Regression in {name} {stage}: {measure} {old:.4g} -> {new:.4g} ({ratio:.2f}x)"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
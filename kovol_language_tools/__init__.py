@@ -1,4 +1,21 @@
-from ._version import get_versions
+def get_version(from_git=False) -> str:
+    """Return the package version setup.py froze into _build_version.py when the package was
+    built, or "0+unknown" in a source checkout that was never built. from_git=True asks git
+    through versioneer instead, for developers who need the exact checkout state."""
+    if not from_git:
+        try:
+            from ._build_version import version
+        except ImportError:
+            return "0+unknown"
+        return version
+    from ._version import get_versions
 
-__version__ = get_versions()["version"]
-del get_versions
+    return get_versions()["version"]
+
+
+def __getattr__(name):
+    # The version is only read when asked for
+    if name == "__version__":
+        version = globals()["__version__"] = get_version()
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,290 @@
+"""The kovol command line tool. Each subcommand reads files or stdin and writes to stdout, so
+they can be chained in shell pipelines. Modules are imported by the subcommand that needs
+them to keep start up fast."""
+
+import argparse
+import os
+import sys
+from collections import deque
+from functools import partial
+from itertools import islice
+
+batch_size = 2000  # lines sent to a worker at a time
+
+
+def _batches(items, size: int):
+    items = iter(items)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+def map_batches(function, items, workers=1, size=batch_size):
+    """Yield function(batch) for consecutive batches of items, in order. With more than one
+    worker the batches run in a process pool, with at most two per worker in flight so
+    input is read as fast as it's used."""
+    batches = _batches(items, size)
+    if workers == 1:
+        yield from map(function, batches)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.submit(function, batch))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _lines(files):
+    """Yield the lines of each file, or stdin if there are none, without line endings."""
+    for path in files or ["-"]:
+        if path == "-":
+            yield from (line.rstrip("\r\n") for line in sys.stdin)
+        else:
+            with open(path, encoding="utf-8") as f:
+                yield from (line.rstrip("\r\n") for line in f)
+
+
+def _convert_batch(lines: list) -> list:
+    from kovol_language_tools.phonemics import phonetics_to_orthography
+
+    results = []
+    for line in lines:
+        orthography, errors = phonetics_to_orthography(line, hard_fail=False)
+        results.append((line, orthography, list(dict.fromkeys(errors))))
+    return results
+
+
+def convert(args) -> int:
+    """Phonetic words, one per line, to orthography."""
+    status = 0
+    for results in map_batches(_convert_batch, _lines(args.files), args.workers):
+        for line, orthography, errors in results:
+            if errors:
+                status = 1
+                print(f"{line}: {'; '.join(errors)}", file=sys.stderr)
+        sys.stdout.write("".join(f"{r[1]}\n" for r in results))
+    return status
+
+
+def _predict_batch(rules: str, lines: list) -> list:
+    from kovol_language_tools.verbs.predictors import predictors
+
+    input_attrs, root_func, paradigm_func = predictors[rules]
+    results = []
+    for line in lines:
+        inputs = line.split()
+        if len(inputs) != len(input_attrs):
+            results.append((line, None))
+            continue
+        try:
+            root = root_func(*inputs)
+            results.append((line, (*inputs, root) + paradigm_func(root)))
+        except IndexError:
+            results.append((line, None))
+    return results
+
+
+def predict(args) -> int:
+    """Predict paradigms from input forms, one verb per line, separated by whitespace."""
+    from kovol_language_tools.verbs.kovol_verb import slots
+    from kovol_language_tools.verbs.predictors import predictors
+
+    input_attrs = predictors[args.rules][0]
+    if args.header:
+        print("\t".join(input_attrs + ("root",) + slots))
+    status = 0
+    function = partial(_predict_batch, args.rules)
+    for results in map_batches(function, _lines(args.files), args.workers):
+        out = []
+        for line, row in results:
+            if row is None:
+                status = 1
+                print(f"Can't predict from: {line!r}", file=sys.stderr)
+            else:
+                out.append("\t".join(row) + "\n")
+        sys.stdout.write("".join(out))
+    return status
+
+
+def validate(args) -> int:
+    """Check the kov cells of lexicon csv files, writing any issues as csv."""
+    import csv
+
+    from kovol_language_tools.verbs.csv_reader import csv_fields, open_csv
+    from kovol_language_tools.verbs.validation import validate_rows
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(["file", "row", "column", "kind", "detail"])
+    status = 0
+    for path in args.files or ["-"]:
+        file = sys.stdin if path == "-" else open_csv(path)
+        try:
+            reader = csv.DictReader(file, delimiter=",", fieldnames=csv_fields)
+            next(reader, None)  # Remove header
+            rows = ((reader.line_num, r) for r in reader)
+            for issue in validate_rows(rows, args.workers):
+                status = 1
+                writer.writerow([path, *issue])
+        finally:
+            if file is not sys.stdin:
+                file.close()
+    return status
+
+
+def _read_lexicon(args) -> list:
+    from kovol_language_tools.verbs.csv_reader import get_data_from_csv_parallel
+    from kovol_language_tools.verbs.lexicon import load_lexicon
+
+    if len(args.files) == 1:
+        return get_data_from_csv_parallel(args.files[0], workers=args.workers)
+    return load_lexicon(args.files, workers=args.workers).verbs
+
+
+def evaluate(args) -> int:
+    """Run a predictor over lexicon csv files and report its accuracy."""
+    from kovol_language_tools.verbs.report import prediction_report
+
+    verbs = _read_lexicon(args)
+    if args.trace:
+        from kovol_language_tools.verbs.rule_trace import RuleTracer
+
+        # prediction_report doesn't use a process pool while tracing
+        with RuleTracer() as tracer:
+            report = prediction_report(verbs, args.rules, workers=args.workers)
+        print(tracer.report(), file=sys.stderr)
+    else:
+        report = prediction_report(verbs, args.rules, workers=args.workers)
+    if args.format == "json":
+        report.to_json(sys.stdout, args.worst)
+        print()
+    elif args.format == "text":
+        print(report)
+        for slot, accuracy in report.slot_accuracy().items():
+            if accuracy is not None:
+                print(f"{slot:>22} {accuracy:7.1%}")
+    else:
+        report.to_csv(sys.stdout, args.format)
+    return 0
+
+
+def render(args) -> int:
+    """Write the paradigms of lexicon csv files as a book."""
+    from kovol_language_tools.verbs.render import render_paradigms
+
+    render_paradigms(_read_lexicon(args), sys.stdout, args.format)
+    return 0
+
+
+def generate(args) -> int:
+    """Write a synthetic lexicon csv for scale testing."""
+    from kovol_language_tools.verbs.synthetic import write_synthetic_csv
+
+    options = dict(
+        seed=args.seed,
+        shuffle=args.shuffle,
+        rules=args.rules,
+        irregularity=args.irregularity,
+        noise=args.noise,
+        short=args.short,
+    )
+    if args.output:
+        write_synthetic_csv(args.output, args.verbs, **options)
+    else:
+        write_synthetic_csv(sys.stdout, args.verbs, **options)
+    return 0
+
+
+def serve(args) -> int:
+    """Start the JSON service."""
+    from kovol_language_tools import service
+
+    files = [args.csv_file] if args.csv_file else []
+    service.main(files + ["--host", args.host, "--port", str(args.port)])
+    return 0
+
+
+def parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="kovol", description="Work with Kovol language data in shell pipelines."
+    )
+    commands = p.add_subparsers(dest="command", required=True)
+
+    def command(name, function, files="*", help_files="input files, stdin if none"):
+        c = commands.add_parser(
+            name, help=function.__doc__, description=function.__doc__
+        )
+        c.set_defaults(function=function)
+        if files:
+            c.add_argument("files", nargs=files, help=help_files)
+        c.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="processes for parallel batches, 0 for one per cpu (default 1)",
+        )
+        return c
+
+    command("convert", convert)
+    c = command("predict", predict)
+    c.add_argument("--rules", choices=("stanley", "hansen"), default="stanley")
+    c.add_argument("--header", action="store_true", help="write a header line first")
+    command("validate", validate)
+    c = command("evaluate", evaluate, "+", "lexicon csv files")
+    c.add_argument("--rules", choices=("stanley", "hansen"), default="stanley")
+    c.add_argument(
+        "--format",
+        choices=("text", "json", "slots", "signatures", "errors"),
+        default="text",
+    )
+    c.add_argument("--worst", type=int, default=10, help="worst offenders in json")
+    c.add_argument(
+        "--trace", action="store_true", help="write the rules that fired to stderr"
+    )
+    c = command("render", render, "+", "lexicon csv files")
+    c.add_argument(
+        "--format", choices=("rst", "markdown", "html", "plain"), default="rst"
+    )
+    c = commands.add_parser(
+        "generate", help=generate.__doc__, description=generate.__doc__
+    )
+    c.set_defaults(function=generate)
+    c.add_argument("verbs", type=int, help="number of verbs")
+    c.add_argument(
+        "-o", "--output", help="csv path, compressed if it ends .gz, .bz2 or .xz"
+    )
+    c.add_argument("--seed", type=int, default=0)
+    c.add_argument("--rules", choices=("stanley", "hansen", "mixed"), default="stanley")
+    c.add_argument("--irregularity", type=float, default=0.0, help="irregular verbs")
+    c.add_argument("--noise", type=float, default=0.0, help="chance of a bad form")
+    c.add_argument("--short", type=float, default=0.0, help="verbs with a short form")
+    c.add_argument("--shuffle", action="store_true", help="mix the rows of all verbs")
+    c = commands.add_parser("serve", help=serve.__doc__, description=serve.__doc__)
+    c.set_defaults(function=serve)
+    c.add_argument("csv_file", nargs="?", default=None, help="lexicon csv to load")
+    c.add_argument("--host", default="127.0.0.1")
+    c.add_argument("--port", type=int, default=8765)
+    return p
+
+
+def main(argv=None) -> int:
+    args = parser().parse_args(argv)
+    if getattr(args, "workers", 1) == 0:
+        args.workers = None  # one per cpu
+    try:
+        return args.function(args)
+    except BrokenPipeError:
+        # the reader went away, e.g. piped into head
+        sys.stderr.close()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
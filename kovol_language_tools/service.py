@@ -0,0 +1,314 @@
+"""A local HTTP service answering batches of JSON requests, keeping the lexicon, predictions
+and phonemic conversions warm between requests. Run with:
+python -m kovol_language_tools.service [lexicon.csv] [--port 8765]"""
+
+import argparse
+import json
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from kovol_language_tools.phonemics import phonetics_to_orthography
+from kovol_language_tools.verbs.form_index import FormIndex
+from kovol_language_tools.verbs.incremental import IncrementalLexicon
+from kovol_language_tools.verbs.kovol_verb import compare_conjugations, slots
+from kovol_language_tools.verbs.predictors import predictors
+
+max_request_bytes = 16 * 2**20
+latency_window = 1000  # recent requests kept per endpoint for the percentiles
+
+
+# item type: how it's named in error messages
+_type_names = {str: "strings", dict: "objects", list: "lists"}
+
+
+def _items(request: dict, key: str, item_type, required=True) -> list:
+    """Return request[key], raising ValueError unless it's a list of item_type."""
+    if not required and key not in request:
+        return []
+    items = request[key]
+    if not isinstance(items, list) or not all(isinstance(i, item_type) for i in items):
+        raise ValueError(f"{key} must be a list of {_type_names[item_type]}")
+    return items
+
+
+@lru_cache(maxsize=65536)
+def _orthography(word: str) -> tuple:
+    orthography, errors = phonetics_to_orthography(word, hard_fail=False)
+    return orthography, tuple(errors)
+
+
+# rules: lru cached paradigm function, the rules only look at the root
+_paradigms = {
+    rules: lru_cache(maxsize=65536)(paradigm_func)
+    for (rules, (_, _, paradigm_func)) in predictors.items()
+}
+
+
+class EndpointMetrics:
+    """Request count, items processed and latency of one endpoint."""
+
+    def __init__(self):
+        self.requests = 0
+        self.items = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.latencies = deque(maxlen=latency_window)
+
+    def add(self, seconds: float, items: int, error=False) -> None:
+        self.requests += 1
+        self.items += items
+        self.errors += error
+        self.seconds += seconds
+        self.latencies.append(seconds)
+
+    def to_dict(self) -> dict:
+        recent = sorted(self.latencies)
+
+        def percentile(p):
+            return recent[int(p * (len(recent) - 1))] * 1000 if recent else None
+
+        return {
+            "requests": self.requests,
+            "items": self.items,
+            "errors": self.errors,
+            "mean_ms": self.seconds / self.requests * 1000 if self.requests else None,
+            "p50_ms": percentile(0.5),
+            "p95_ms": percentile(0.95),
+            "max_ms": recent[-1] * 1000 if recent else None,
+            "items_per_second": self.items / self.seconds if self.seconds else None,
+        }
+
+
+class KovolService:
+    """The state and endpoints of the service, usable without the HTTP server.
+    Endpoints take and return dicts of plain types."""
+
+    def __init__(self, csv_file=None, rules=("stanley", "hansen")):
+        self.rules = tuple(rules)
+        self.started = time.time()
+        self.metrics = {}  # endpoint: EndpointMetrics
+        self._lock = threading.RLock()  # the lexicon and index change on reload
+        self.lexicon = None
+        self.index = FormIndex(rules=self.rules)
+        if csv_file:
+            self.lexicon = IncrementalLexicon(csv_file, self.rules)
+            self.index = FormIndex(self.lexicon.verbs(), self.rules)
+        self.endpoints = {
+            "orthography": self.orthography,
+            "predict": self.predict,
+            "lookup": self.lookup,
+            "compare": self.compare,
+            "reload": self.reload,
+        }
+
+    def handle(self, endpoint: str, request: dict) -> dict:
+        """Run an endpoint, recording its latency and the number of items it answered."""
+        try:
+            function = self.endpoints[endpoint]
+        except KeyError:
+            raise ValueError(f"Unknown endpoint: {endpoint}")
+        if not isinstance(request, dict):
+            raise ValueError("Requests must be JSON objects")
+        start = time.perf_counter()
+        error = False
+        response = {}
+        try:
+            response = function(request)
+            return response
+        except Exception:
+            error = True
+            raise
+        finally:
+            items = len(response.get("results", ()))
+            with self._lock:
+                metrics = self.metrics.setdefault(endpoint, EndpointMetrics())
+                metrics.add(time.perf_counter() - start, items, error)
+
+    def orthography(self, request: dict) -> dict:
+        """{"words": [phonetic, ...]} to the orthography of each word and any errors."""
+        results = []
+        for word in _items(request, "words", str):
+            orthography, errors = _orthography(word)
+            results.append({"orthography": orthography, "errors": list(errors)})
+        return {"results": results}
+
+    def predict(self, request: dict) -> dict:
+        """{"rules": "stanley", "verbs": [{input form: value}, ...]} to predicted paradigms.
+        Stanley rules need remote_past_1s and recent_past_1s, Hansen rules future_3p."""
+        rules = request.get("rules", "stanley")
+        if rules not in predictors:
+            raise ValueError(f"Unknown prediction rules: {rules}")
+        input_attrs, root_func, _ = predictors[rules]
+        paradigm_func = _paradigms[rules]
+        results = []
+        for inputs in _items(request, "verbs", dict):
+            values = [inputs.get(a) for a in input_attrs]
+            paradigm = None
+            if all(isinstance(v, str) for v in values):
+                try:
+                    root = root_func(*values)
+                    paradigm = paradigm_func(root)
+                except IndexError:
+                    pass
+            if paradigm is None:
+                results.append({"error": f"Needs {', '.join(input_attrs)}"})
+                continue
+            results.append({"root": root, "paradigm": dict(zip(slots, paradigm))})
+        return {"results": results}
+
+    def lookup(self, request: dict) -> dict:
+        """{"forms": [form, ...]} to the verbs, slots and sources each form is found in."""
+        results = []
+        with self._lock:
+            for form in _items(request, "forms", str):
+                results.append(
+                    [
+                        {"english": e.verb.english, "slot": e.slot, "source": e.source}
+                        for e in self.index.lookup(form)
+                    ]
+                )
+        return {"results": results}
+
+    def compare(self, request: dict) -> dict:
+        """Prediction errors as {slot: [actual, predicted]} for each of
+        {"pairs": [[predicted forms], [actual forms]]}, ordered as get_all_conjugations,
+        and for each lexicon verb in {"english": [...], "rules": "stanley"}."""
+        results = []
+        for pair in _items(request, "pairs", list, required=False):
+            if len(pair) != 2 or not all(
+                isinstance(forms, list) and all(isinstance(f, str) for f in forms)
+                for forms in pair
+            ):
+                raise ValueError("pairs must be [[predicted forms], [actual forms]]")
+            if any(len(forms) > len(slots) for forms in pair):
+                raise ValueError(f"pairs can't have more than {len(slots)} forms")
+            results.append(compare_conjugations(tuple(pair[0]), tuple(pair[1])))
+        english_list = _items(request, "english", str, required=False)
+        rules = request.get("rules", "stanley")
+        with self._lock:
+            for english in english_list:
+                verb = self.lexicon.get_verb(english) if self.lexicon else None
+                if verb is None:
+                    results.append({"error": f"Unknown verb: {english}"})
+                    continue
+                predicted = self.lexicon.prediction(english, rules)
+                if predicted is None:
+                    results.append({"error": f"Can't predict {english} with {rules}"})
+                    continue
+                results.append(
+                    compare_conjugations(predicted, verb.get_all_conjugations())
+                )
+        return {"results": results}
+
+    def reload(self, request: dict) -> dict:
+        """Re-read the lexicon if its file has changed, updating only the changed verbs."""
+        if self.lexicon is None:
+            raise ValueError("The service wasn't started with a lexicon")
+        with self._lock:
+            changes = self.lexicon.reload(force=request.get("force", False))
+            self.index.apply_changes(changes)
+        return {
+            "added": [v.english for v in changes.added],
+            "changed": [v.english for v in changes.changed],
+            "removed": changes.removed,
+        }
+
+    def status(self) -> dict:
+        """Uptime, lexicon size, cache use and the metrics of each endpoint."""
+        with self._lock:
+            return {
+                "uptime_seconds": time.time() - self.started,
+                "verbs": len(self.lexicon) if self.lexicon else 0,
+                "indexed_forms": len(self.index),
+                "caches": {
+                    "orthography": _orthography.cache_info()._asdict(),
+                    **{
+                        f"{rules}_paradigms": f.cache_info()._asdict()
+                        for (rules, f) in _paradigms.items()
+                    },
+                },
+                "endpoints": {e: m.to_dict() for (e, m) in self.metrics.items()},
+            }
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """POST /<endpoint> with a JSON body, GET /metrics for the status of the service."""
+
+    service = None  # set by make_server
+
+    def do_GET(self):
+        if self.path in ("/metrics", "/status"):
+            self._send(200, self.service.status())
+        else:
+            self._send(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        header = self.headers.get("Content-Length")
+        if header is None:
+            self._send(411, {"error": "Content-Length is required"})
+            return
+        length = int(header) if header.strip().isdecimal() else -1
+        if length < 0:
+            self._send(400, {"error": f"Invalid Content-Length: {header}"})
+            return
+        if length > max_request_bytes:
+            self._send(413, {"error": "Request too large"})
+            return
+        endpoint = self.path.strip("/")
+        if endpoint not in self.service.endpoints:
+            self._send(404, {"error": f"Unknown endpoint: {endpoint}"})
+            return
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+            response = self.service.handle(endpoint, request)
+        except (ValueError, KeyError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+            return
+        except Exception as e:
+            # always answer, a dropped connection tells the client nothing
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self._send(200, response)
+
+    def _send(self, status: int, body: dict) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # the metrics endpoint replaces the access log
+
+
+def make_server(service: KovolService, host="127.0.0.1", port=8765):
+    """Return a ThreadingHTTPServer for a service, call serve_forever to start it.
+    Port 0 picks a free port, see server.server_address."""
+    handler = type("KovolRequestHandler", (RequestHandler,), {"service": service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Answer JSON requests about Kovol verbs and phonemics."
+    )
+    parser.add_argument("csv_file", nargs="?", help="lexicon csv to keep loaded")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(args)
+    server = make_server(KovolService(args.csv_file), args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
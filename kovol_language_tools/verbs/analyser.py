@@ -0,0 +1,268 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from kovol_language_tools import facts
+from kovol_language_tools.verbs import hansen_predicted_verb, stanley_predicted_verb
+from kovol_language_tools.verbs.kovol_verb import KovolVerb
+
+Parse = namedtuple("Parse", ["root", "tense", "actor", "rules"])
+
+# slot position: (tense, actor), in the order of get_all_conjugations
+slot_parses = [(t, a) for t in KovolVerb.tenses for a in KovolVerb.actors] + [
+    ("imperative", "2s"),
+    ("imperative", "2p"),
+]
+
+# Vowel changes the rules make across a root, as (root vowel, form vowel)
+vowel_changes = (("ɛ", "o"), ("ɛ", "a"), ("ɔ", "a"), ("ɛ", "u"))
+# what probe roots start with: nothing, a syllable with each vowel the rules tell apart (they
+# treat the others like a) or tɛtu, putting a vowel that changes before a u
+probe_prefixes = ("", "ti", "tɛ", "tu", "tɔ", "ta", "tɛtu")
+_non_vowels = re.compile(f"[^{''.join(facts.phonetic_vowels)}]+")
+
+
+@lru_cache(maxsize=1024)
+def _vowels(removed: str) -> str:
+    return _non_vowels.sub("", removed)
+
+
+def rule_class(root: str, vowels=None) -> tuple:
+    """A description of the root features the rules branch on: its ending, its last vowel,
+    whether the vowel before that is u and whether it has one syllable. Roots of a rule class
+    are all conjugated the same way. vowels are the root's vowels, if already known."""
+    last = root[-1]
+    last_two = root[-2:]
+    if vowels is None:
+        vowels = _non_vowels.sub("", root)
+    last_vowel = vowels[-1:]
+    return (
+        last if last in ("a", "l", "u", "m", "g") else last in facts.phonetic_vowels,
+        last_two if last_two in ("um", "ɛm", "ɛl") else "",
+        last_vowel if last_vowel in ("ɛ", "u", "i") else "",
+        vowels[-2:-1] == "u",
+        len(vowels) == 1,
+    )
+
+
+def root_class(root: str) -> tuple:
+    """The coarser class of just the root endings the rules single out. A suffix found for one
+    probe root only needs checking against candidate roots of the same class."""
+    return rule_class(root)[:3]
+
+
+def _unchanged(stem: str, change: tuple) -> list:
+    """Undo a vowel change in a stem, either everywhere or at a single position, since a root
+    may have had the changed vowel to begin with."""
+    if change is None:
+        return [stem]
+    old, new = change
+    stems = [stem.replace(new, old)]
+    i = stem.find(new)
+    while i != -1:
+        candidate = stem[:i] + old + stem[i + 1 :]
+        if candidate not in stems:
+            stems.append(candidate)
+        i = stem.find(new, i + 1)
+    return stems
+
+
+class SuffixTrie:
+    """A trie of reversed suffixes, for finding every stored suffix a word ends with."""
+
+    def __init__(self):
+        self.root = {}
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def setdefault(self, suffix: str, default):
+        """Return the value stored against a suffix, storing default first if there isn't one."""
+        node = self.root
+        for c in reversed(suffix):
+            node = node.setdefault(c, {})
+        if None not in node:
+            node[None] = default
+            self.size += 1
+        return node[None]
+
+    def matches(self, word: str):
+        """Yield (suffix length, value) for each stored suffix of word, shortest first."""
+        node = self.root
+        if None in node:
+            yield 0, node[None]
+        for i, c in enumerate(reversed(word), 1):
+            node = node.get(c)
+            if node is None:
+                return
+            if None in node:
+                yield i, node[None]
+
+
+predictor_modules = {"stanley": stanley_predicted_verb, "hansen": hansen_predicted_verb}
+
+
+@lru_cache(maxsize=4096)
+def _paradigm(rules: str, root: str) -> tuple or None:
+    """The forward predictor's paradigm of a candidate root, or None if it rejects the root."""
+    try:
+        return predictor_modules[rules].paradigm_from_root(root)
+    except IndexError:
+        return None
+
+
+def probe_roots() -> list:
+    """Roots covering every final two characters, preceded by each of probe_prefixes. These are
+    the features the rules branch on."""
+    alphabet = facts.phonetic_consonants + facts.phonetic_vowels
+    tails = list(alphabet) + [a + b for a in alphabet for b in alphabet]
+    return [p + t for p in probe_prefixes for t in tails]
+
+
+def _split(root: str, form: str) -> tuple:
+    """Find where the root stops being carried through into the form. Returns the suffix added,
+    the root characters it replaced and any vowel change made across the root."""
+    change = None
+    i = 0
+    for r, f in zip(root, form):
+        if r != f:
+            if change is None and (r, f) in vowel_changes:
+                change = (r, f)
+            elif change != (r, f):
+                break
+        i += 1
+    return form[i:], root[i:], change
+
+
+def _apply(root: str, transform: tuple) -> str:
+    """Make a form from a root by a (cut, vowel change, last only, suffix) transform: cut
+    characters come off the end, the vowel change is made everywhere or only to the last
+    such vowel and the suffix is added."""
+    cut, change, last, suffix = transform
+    stem = root[:-cut] if cut else root
+    if change is not None:
+        old, new = change
+        if last:
+            i = stem.rfind(old)
+            if i != -1:
+                stem = stem[:i] + new + stem[i + 1 :]
+        else:
+            stem = stem.replace(old, new)
+    return stem + suffix
+
+
+def _transforms(root: str, form: str) -> list:
+    """Every transform _apply could use to make form from root, simplest first."""
+    transforms = []
+    for cut in range(3):
+        kept = root[:-cut] if cut else root
+        for change in (None,) + vowel_changes:
+            if change is not None and change[0] not in kept:
+                continue
+            for last in (False, True) if change else (False,):
+                stem = _apply(kept, (0, change, last, ""))
+                if form.startswith(stem):
+                    transforms.append((cut, change, last, form[len(stem) :]))
+    return transforms
+
+
+def _class_transform(probes: list, slot: int) -> tuple or None:
+    """Return the simplest transform making the slot's form from every (root, paradigm) probe,
+    or None if none does and the forms have to be regenerated by the predictors."""
+    root, paradigm = probes[0]
+    for transform in _transforms(root, paradigm[slot]):
+        if all(_apply(r, transform) == p[slot] for (r, p) in probes):
+            return transform
+    return None
+
+
+def build_trie(rules=("stanley", "hansen")) -> SuffixTrie:
+    """Run the probe roots through the forward predictors and store each suffix in reverse,
+    with what's needed to rebuild the root. Each suffix stores
+    {(removed root characters, vowel change): {root class: {(rules, slot): cell}}}, a cell
+    being ((tense, actor, rules), {rule class: transform}). A transform reproduces what the
+    predictor does to every probe root of the rule class, or is None if none does, and is
+    used to rule out candidates before they're regenerated."""
+    probes = {}  # (rules, rule class): [(probe root, paradigm), ...]
+    # (rules, rule class, the _split of each form), most probes share theirs with others
+    splits = set()
+    for r in rules:
+        paradigm_from_root = predictor_modules[r].paradigm_from_root
+        for root in probe_roots():
+            try:
+                paradigm = paradigm_from_root(root)
+            except IndexError:
+                continue
+            probe_rule_class = rule_class(root)
+            probes.setdefault((r, probe_rule_class), []).append((root, paradigm))
+            # usually the whole root is carried through
+            n = len(root)
+            split = tuple(
+                (form[n:], "", None) if form.startswith(root) else _split(root, form)
+                for form in paradigm
+            )
+            splits.add((r, probe_rule_class, split))
+
+    transforms = {
+        (r, c, slot): _class_transform(p, slot)
+        for ((r, c), p) in probes.items()
+        for slot in range(len(slot_parses))
+    }
+    found = {}  # suffix: entries, inserted into the trie once all are known
+    for r, probe_rule_class, split in splits:
+        for slot, (suffix, removed, change) in enumerate(split):
+            entries = found.setdefault(suffix, {}).setdefault((removed, change), {})
+            cells = entries.setdefault(probe_rule_class[:3], {})
+            cell = cells.setdefault((r, slot), (slot_parses[slot] + (r,), {}))
+            cell[1][probe_rule_class] = transforms[r, probe_rule_class, slot]
+    trie = SuffixTrie()
+    for suffix, entries in found.items():
+        trie.setdefault(suffix, entries)
+    return trie
+
+
+_trie = None
+
+
+@lru_cache(maxsize=65536)
+def analyse(form: str) -> tuple:
+    """Return a tuple of candidate Parse(root, tense, actor, rules) for an inflected form.
+    Every candidate has been checked by making the form again from the root with the
+    predictor, roots it rejects aren't returned."""
+    global _trie
+    if _trie is None:
+        _trie = build_trie()
+    parses = {}
+    for length, entries in _trie.matches(form):
+        stem = form[: len(form) - length]
+        stems = {}  # vowel change: [(stem root, its vowels)], shared by the entries
+        for (removed, change), classes in entries.items():
+            candidates = stems.get(change)
+            if candidates is None:
+                unchanged = []
+                if change is None or change[1] in stem:
+                    unchanged = _unchanged(stem, change)
+                candidates = stems[change] = [
+                    (s, _non_vowels.sub("", s)) for s in unchanged
+                ]
+            removed_vowels = _vowels(removed)
+            for stem_root, stem_vowels in candidates:
+                root = stem_root + removed
+                if not root:
+                    continue
+                root_rule_class = rule_class(root, stem_vowels + removed_vowels)
+                cells = classes.get(root_rule_class[:3])
+                if not cells:
+                    continue
+                for (rules, slot), (parse, transforms) in cells.items():
+                    # the class's transform cheaply rules out most candidates, the rest
+                    # are made again by the predictor
+                    transform = transforms.get(root_rule_class)
+                    if transform is not None and _apply(root, transform) != form:
+                        continue
+                    paradigm = _paradigm(rules, root)
+                    if paradigm is None or paradigm[slot] != form:
+                        continue
+                    parses[Parse(root, *parse)] = None
+    return tuple(parses)
@@ -1,25 +1,79 @@
 import csv
+import heapq
+import importlib
+import io
+import marshal
+import os
+from itertools import groupby
+from operator import itemgetter
 
 from kovol_language_tools.verbs.kovol_verb import KovolVerb
 
+csv_fields = ["actor", "tense", "mode", "kov", "eng", "checked"]
+# magic bytes: module that opens them, for compressed csv files
+compressions = {b"\x1f\x8b": "gzip", b"BZh": "bz2", b"\xfd7zXZ\x00": "lzma"}
+# files smaller than this are read in process, a pool costs more than it saves
+parallel_csv_bytes = 16 * 2**20
 
-def get_data_from_csv(csv_file, format="object") -> list:
+
+def compression(csv_file) -> str or None:
+    """Return 'gzip', 'bz2' or 'lzma' if a file is compressed, or None for a plain file."""
+    with open(csv_file, "rb") as f:
+        start = f.read(6)
+    for magic, module in compressions.items():
+        if start.startswith(magic):
+            return module
+    return None
+
+
+def open_csv(csv_file):
+    """Open a plain, .gz, .bz2 or .xz csv file for reading as text. Compression is detected
+    from the file's contents, not its name."""
+    module = compression(csv_file)
+    # the compression modules are only imported when needed
+    opener = importlib.import_module(module).open if module else open
+    return opener(csv_file, "rt", newline="", encoding="utf-8")
+
+
+def get_data_from_csv(csv_file, format="object", validate=None) -> list:
     """reads a csv file and outputs a list of KovolVerb objects.
-    Can accept 'list' as format to return a list of listed dict entries instead"""
-    with open(csv_file, newline="", encoding="utf-8") as file:
+    Can accept 'list' as format to return a list of listed dict entries instead.
+    validate can be a function to call with each ValidationIssue in the kov cells"""
+    with open_csv(csv_file) as file:
         reader = csv.DictReader(
             file,
             delimiter=",",
-            fieldnames=["actor", "tense", "mode", "kov", "eng", "checked"],
+            fieldnames=csv_fields,
         )
-        data = [r for r in reader]
+        # the line each row ended on, kept to validate. Blank lines are skipped
+        lines = []
+        if validate is None:
+            data = [r for r in reader]
+        else:
+            data = []
+            for r in reader:
+                data.append(r)
+                lines.append(reader.line_num)
         if "actor" in data[0]:
             data.pop(0)  # Remove header
+            lines = lines[1:]
+
+    if validate is not None:
+        # imported here, the validation module imports this one
+        from kovol_language_tools.verbs.validation import validate_rows
 
-    # Get a list of the unique verbs (identified by English translation)
-    eng = set([v["eng"] for v in data])
-    # Get list of all data where each index is a list of dict items for each translation
-    verb_data = [[d for d in data if d["eng"] == e] for e in eng]
+        for issue in validate_rows(zip(lines, data)):
+            validate(issue)
+
+    # Get list of all data where each index is a list of dict items for each translation,
+    # grouped in a single pass, in order of first appearance
+    verb_data = {}
+    for d in data:
+        if d["eng"] in verb_data:
+            verb_data[d["eng"]].append(d)
+        else:
+            verb_data[d["eng"]] = [d]
+    verb_data = list(verb_data.values())
 
     if format == "list":
         return verb_data
@@ -27,69 +81,232 @@ def get_data_from_csv(csv_file, format="object") -> list:
         return csv_data_to_verb_object(verb_data)
 
 
+# csv tense: KovolVerb attribute prefix
+tense_attributes = {
+    "future": "future",
+    "recent past": "recent_past",
+    "remote past": "remote_past",
+}
+
+
+def _row_attributes(tense: str, actor: str, mode: str) -> tuple:
+    """Work out which KovolVerb attributes a csv row fills in from its tense, actor and mode."""
+    attributes = []
+    actor = actor.lower()
+    tense = tense.lower()
+    if tense in tense_attributes and actor in KovolVerb.actors:
+        # future 2s and 2p imperatives aren't future tense data
+        if not (tense == "future" and actor in ("2s", "2p") and mode == "imperative"):
+            attributes.append(f"{tense_attributes[tense]}_{actor}")
+    if mode:
+        if actor == "2s":
+            attributes.append("singular_imperative")
+        elif actor == "2p":
+            attributes.append("plural_imperative")
+        elif mode.lower() == "short":
+            attributes.append("short")
+    return tuple(attributes)
+
+
+# (tense, actor, mode): attributes, precomputed for the spellings used in the csv files.
+# Other spellings are worked out and added the first time they're seen.
+row_attributes = {
+    (t, a, m): _row_attributes(t, a, m)
+    for t in list(tense_attributes) + [""]
+    for a in KovolVerb.actors + ("",)
+    for m in ("", "imperative", "short")
+}
+
+
+_row_key = itemgetter("tense", "actor", "mode", "kov")
+
+
+def _add_rows(values: dict, rows) -> dict:
+    """Set the KovolVerb attributes filled by csv rows in a dict of attribute: value."""
+    for tense, actor, mode, kov in map(_row_key, rows):
+        try:
+            attributes = row_attributes[tense, actor, mode]
+        except KeyError:
+            attributes = row_attributes[tense, actor, mode] = _row_attributes(
+                tense, actor, mode
+            )
+        for a in attributes:
+            values[a] = kov  # later rows overwrite earlier ones
+    return values
+
+
+def _values_to_verb(english: str, values: dict) -> KovolVerb:
+    v = KovolVerb("", english)
+    v.__dict__.update(values)
+    return v
+
+
+def rows_to_verb(rows: list) -> KovolVerb:
+    """Take the list of csv row dicts of one verb and return a KovolVerb."""
+    # every row item contains the English
+    return _values_to_verb(rows[0]["eng"], _add_rows({}, rows))
+
+
 def csv_data_to_verb_object(verb_data: list) -> list:
     """Take a list of dicts representing a verb and return a list of Verb objects instead."""
-    verbs = []
-    for d in verb_data:
-        eng = d[0]["eng"]  # every row item contains this info
-        v = KovolVerb("", eng)  # init obj with temp 1s_future
-
-        future_tense = [v for v in d if v["tense"].lower() == "future"]
-        for t in future_tense:
-            if t["actor"].lower() == "1s":
-                v.future_1s = t["kov"]
-            elif t["actor"].lower() == "2s":
-                if not t["mode"] == "imperative":
-                    v.future_2s = t["kov"]
-            elif t["actor"].lower() == "3s":
-                v.future_3s = t["kov"]
-            elif t["actor"].lower() == "1p":
-                v.future_1p = t["kov"]
-            elif t["actor"].lower() == "2p":
-                if not t["mode"] == "imperative":
-                    v.future_2p = t["kov"]
-            elif t["actor"].lower() == "3p":
-                v.future_3p = t["kov"]
-
-        recent_past_tense = [v for v in d if v["tense"].lower() == "recent past"]
-        for t in recent_past_tense:
-            if t["actor"].lower() == "1s":
-                v.recent_past_1s = t["kov"]
-            elif t["actor"].lower() == "2s":
-                v.recent_past_2s = t["kov"]
-            elif t["actor"].lower() == "3s":
-                v.recent_past_3s = t["kov"]
-            elif t["actor"].lower() == "1p":
-                v.recent_past_1p = t["kov"]
-            elif t["actor"].lower() == "2p":
-                v.recent_past_2p = t["kov"]
-            elif t["actor"].lower() == "3p":
-                v.recent_past_3p = t["kov"]
-
-        remote_past_tense = [v for v in d if v["tense"].lower() == "remote past"]
-        for t in remote_past_tense:
-            if t["actor"].lower() == "1s":
-                v.remote_past_1s = t["kov"]
-            elif t["actor"].lower() == "2s":
-                v.remote_past_2s = t["kov"]
-            elif t["actor"].lower() == "3s":
-                v.remote_past_3s = t["kov"]
-            elif t["actor"].lower() == "1p":
-                v.remote_past_1p = t["kov"]
-            elif t["actor"].lower() == "2p":
-                v.remote_past_2p = t["kov"]
-            elif t["actor"].lower() == "3p":
-                v.remote_past_3p = t["kov"]
-
-        imperatives = [v for v in d if v["mode"]]
-        for t in imperatives:
-            if t["actor"].lower() == "2s":
-                v.singular_imperative = t["kov"]
-            elif t["actor"].lower() == "2p":
-                v.plural_imperative = t["kov"]
-            elif t["mode"].lower() == "short":
-                v.short = t["kov"]
-
-        verbs.append(v)
+    verbs = [rows_to_verb(d) for d in verb_data]
     verbs = sorted(verbs, key=lambda x: x.future_1s)
     return verbs
+
+
+def _csv_rows(file):
+    """Yield the row dicts of an open csv file, without the header row."""
+    reader = csv.DictReader(file, delimiter=",", fieldnames=csv_fields)
+    next(reader, None)  # Remove header
+    return reader
+
+
+def _grouped_verbs(csv_file):
+    """Yield a KovolVerb for each run of rows with the same English, raising ValueError if a
+    verb's rows turn up again after another verb's."""
+    seen = set()
+    with open_csv(csv_file) as file:
+        # groupby only compares each row's English with the row before
+        for eng, rows in groupby(_csv_rows(file), key=itemgetter("eng")):
+            if eng in seen:
+                raise ValueError(
+                    f"The rows of {eng!r} aren't together, read the file with grouped=False"
+                )
+            seen.add(eng)
+            yield rows_to_verb(list(rows))
+
+
+def iter_verbs_from_csv(csv_file, grouped=True, run_size=100000):
+    """A generator version of get_data_from_csv that yields each KovolVerb as soon as its rows
+    have been read, instead of reading the whole file first. Verbs come in file order, not
+    sorted by future 1s, and only one verb is held in memory at a time, with the English of
+    those before it. This needs each verb's rows to be next to each other, ValueError is
+    raised when a verb's rows turn up again after another's.
+    With grouped=False the rows can be in any order. They're sorted by English in runs of
+    run_size rows on disk, and the verbs come in English order."""
+    if grouped:
+        return _grouped_verbs(csv_file)
+    return _iter_sorted_verbs(csv_file, run_size)
+
+
+def _write_run(rows: list):
+    """Sort a run of (english, row number, row values) tuples and spill it to a temp file."""
+    import tempfile
+
+    rows.sort(key=itemgetter(0, 1))
+    run = tempfile.TemporaryFile()
+    for i in range(0, len(rows), 1000):
+        marshal.dump(rows[i : i + 1000], run)  # in blocks, one row at a time is slow
+    run.seek(0)
+    return run
+
+
+def _read_run(run):
+    while True:
+        try:
+            yield from marshal.load(run)
+        except EOFError:
+            run.close()
+            return
+
+
+def _iter_sorted_verbs(csv_file, run_size: int):
+    """External merge sort of the rows by English, yielding a KovolVerb for each English.
+    Row numbers keep each verb's rows in file order, so later rows still win."""
+    runs = []
+    rows = []
+    values = itemgetter(*csv_fields)
+    try:
+        with open_csv(csv_file) as file:
+            for n, r in enumerate(_csv_rows(file)):
+                rows.append((r["eng"] or "", n, values(r)))
+                if len(rows) == run_size:
+                    runs.append(_write_run(rows))
+                    rows = []
+        if rows:
+            runs.append(_write_run(rows))
+        rows = None
+
+        merged = heapq.merge(*[_read_run(run) for run in runs], key=itemgetter(0, 1))
+        for eng, group in groupby(merged, key=itemgetter(0)):
+            yield rows_to_verb([dict(zip(csv_fields, r[2])) for r in group])
+    finally:
+        for run in runs:
+            run.close()
+
+
+def _chunk_ranges(csv_file, n_chunks: int) -> list:
+    """Split a csv file into (start, end) byte ranges that begin and end on line boundaries,
+    skipping the header line. Assumes no field contains a line break."""
+    size = os.path.getsize(csv_file)
+    with open(csv_file, "rb") as f:
+        f.readline()  # Remove header
+        start = f.tell()
+        ranges = []
+        step = -(-(size - start) // n_chunks)  # ceiling division
+        while start < size:
+            f.seek(min(start + step, size))
+            f.readline()  # carry on to the end of the line
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _read_chunk(csv_file, start: int, end: int) -> list:
+    """Return [(english, {attribute: value}), ...] for the rows in a byte range of a csv file,
+    in order of first appearance. Module level so it can run in a worker process."""
+    with open(csv_file, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    reader = csv.DictReader(
+        io.StringIO(text, newline=""), delimiter=",", fieldnames=csv_fields
+    )
+    return _group_values(reader)
+
+
+def _group_values(rows) -> list:
+    verb_values = {}
+    for eng, group in groupby(rows, key=itemgetter("eng")):
+        _add_rows(verb_values.setdefault(eng, {}), group)
+    return list(verb_values.items())
+
+
+def read_verb_values(csv_file) -> list:
+    """Return [(english, {KovolVerb attribute: value}), ...] for a whole csv file, in order of
+    first appearance. Only the attributes the rows fill in are included."""
+    with open_csv(csv_file) as file:
+        return _group_values(_csv_rows(file))
+
+
+def get_data_from_csv_parallel(csv_file, workers=None) -> list:
+    """A drop in for get_data_from_csv that parses a large file in chunks over a process pool,
+    returning the same sorted list of KovolVerbs. workers sets the pool size, 1 disables it.
+    Compressed files can't be split, so they're read in process."""
+    if (
+        workers == 1
+        or os.path.getsize(csv_file) < parallel_csv_bytes
+        or compression(csv_file) is not None
+    ):
+        return get_data_from_csv(csv_file)
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count()
+    ranges = _chunk_ranges(csv_file, workers * 4)
+    verb_values = {}
+    with ProcessPoolExecutor(workers) as pool:
+        chunks = pool.map(
+            _read_chunk,
+            [csv_file] * len(ranges),
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+        )
+        # chunks are merged in file order so later rows still overwrite earlier ones
+        for chunk in chunks:
+            for eng, values in chunk:
+                if eng in verb_values:
+                    verb_values[eng].update(values)
+                else:
+                    verb_values[eng] = values
+    verbs = [_values_to_verb(eng, values) for (eng, values) in verb_values.items()]
+    return sorted(verbs, key=lambda x: x.future_1s)
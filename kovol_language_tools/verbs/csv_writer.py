@@ -0,0 +1,53 @@
+import csv
+import importlib
+
+from kovol_language_tools.verbs.kovol_verb import KovolVerb
+
+header = ["Actor", "Tense", "Mode", "Kovol word", "English", "Checked"]
+# file extension: module that writes it, matching the compression the reader detects
+compressions = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma"}
+# (actor, tense, mode, attribute) for each row written, in the order written
+verb_rows = [
+    (a, t.replace("_", " "), "", f"{t}_{a}")
+    for t in KovolVerb.tenses
+    for a in KovolVerb.actors
+] + [
+    ("2s", "future", "imperative", "singular_imperative"),
+    ("2p", "future", "imperative", "plural_imperative"),
+    ("", "", "short", "short"),
+]
+
+
+def verb_to_rows(verb: KovolVerb) -> list:
+    """Return the csv rows for a KovolVerb (or PredictedVerb), leaving out blank forms."""
+    english = verb.english
+    rows = []
+    for actor, tense, mode, attribute in verb_rows:
+        form = getattr(verb, attribute)
+        if form:
+            rows.append((actor, tense, mode, form, english, ""))
+    return rows
+
+
+def create_csv(path: str):
+    """Open a path for writing csv text, compressed if it ends .gz, .bz2 or .xz."""
+    module = next((m for (ext, m) in compressions.items() if path.endswith(ext)), None)
+    opener = importlib.import_module(module).open if module else open
+    return opener(path, "wt", newline="", encoding="utf-8")
+
+
+def write_csv(verbs, csv_file) -> int:
+    """Write KovolVerbs or PredictedVerbs to a path or file-like object in the format
+    get_data_from_csv reads, one verb at a time. Paths ending .gz, .bz2 or .xz are
+    compressed. Returns the number of verbs written."""
+    if isinstance(csv_file, str):
+        with create_csv(csv_file) as f:
+            return write_csv(verbs, f)
+
+    writer = csv.writer(csv_file)
+    writer.writerow(header)
+    count = 0
+    for v in verbs:
+        writer.writerows(verb_to_rows(v))
+        count += 1
+    return count
@@ -0,0 +1,167 @@
+from collections import namedtuple
+
+from kovol_language_tools.verbs.kovol_verb import KovolVerb, slots
+from kovol_language_tools.verbs.predictors import predict_paradigm
+
+FormEntry = namedtuple("FormEntry", ["verb", "slot", "source"])
+
+index_slots = slots + ("short",)
+sources = ("attested", "stanley", "hansen")
+
+# Entries are packed into one int: verb position, source and slot
+_slot_bits = 5
+_source_bits = 2
+
+
+def _pack(position: int, source: int, slot: int) -> int:
+    return (((position << _source_bits) | source) << _slot_bits) | slot
+
+
+def _unpack(code: int) -> tuple:
+    slot = code & ((1 << _slot_bits) - 1)
+    code >>= _slot_bits
+    source = code & ((1 << _source_bits) - 1)
+    return code >> _source_bits, source, slot
+
+
+class FormIndex:
+    """An index from inflected forms to the verbs and paradigm slots they belong to.
+    Attested forms are indexed along with the forms predicted by each of rules. Data with
+    " ig" on the end is findable both with and without it."""
+
+    def __init__(self, verbs=(), rules=("stanley", "hansen")):
+        self.rules = tuple(rules)
+        self._verbs = []  # position: verb, None once removed
+        self._english = []  # position: the English the verb was indexed under
+        self._positions = {}  # english: position
+        self._verb_positions = {}  # id(verb): position, the index keeps the verb alive
+        self._verb_forms = []  # position: tuple of forms the verb added
+        self._free = []  # positions of removed verbs, reused before new ones
+        self._forms = {}  # form: code, or list of codes if shared
+        for v in verbs:
+            self.add(v)
+
+    def __str__(self):
+        return f"Form index: {len(self._positions)} verbs, {len(self._forms)} forms"
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __len__(self):
+        return len(self._forms)
+
+    def __contains__(self, form):
+        return form in self._forms
+
+    def verbs(self) -> list:
+        """Return a list of the indexed verbs."""
+        return [self._verbs[p] for p in self._positions.values()]
+
+    def lookup(self, form: str) -> list:
+        """Return a list of FormEntry(verb, slot, source) for a form, empty if it's unknown."""
+        codes = self._forms.get(form, ())
+        if isinstance(codes, int):
+            codes = (codes,)
+        entries = []
+        for code in codes:
+            position, source, slot = _unpack(code)
+            entries.append(
+                FormEntry(self._verbs[position], index_slots[slot], sources[source])
+            )
+        return entries
+
+    def add(self, verb: KovolVerb) -> None:
+        """Index a verb. A verb with the same English replaces the one already indexed, and
+        a verb that's already indexed is re-indexed, even if its English has changed."""
+        if id(verb) in self._verb_positions:
+            self._remove_position(self._verb_positions[id(verb)])
+        if verb.english in self._positions:
+            self._remove_position(self._positions[verb.english])
+        if self._free:
+            position = self._free.pop()
+            self._verbs[position] = verb
+            self._english[position] = verb.english
+        else:
+            position = len(self._verbs)
+            self._verbs.append(verb)
+            self._english.append(verb.english)
+            self._verb_forms.append(())
+        self._positions[verb.english] = position
+        self._verb_positions[id(verb)] = position
+
+        attested = verb.get_all_conjugations() + (verb.short,)
+        cells = [(0, attested)]
+        for rules in self.rules:
+            predicted = predict_paradigm(verb, rules)
+            if predicted:
+                cells.append((sources.index(rules), predicted))
+
+        added = {}  # form: codes, built locally so a form is only added once per entry
+        for source, forms in cells:
+            base = _pack(position, source, 0)
+            for slot, form in enumerate(forms):
+                if not form:
+                    continue
+                if source:
+                    # predictions matching the data are already indexed as attested
+                    actual = attested[slot]
+                    if form == actual or form + " ig" == actual:
+                        continue
+                if form in added:
+                    added[form].append(base | slot)
+                else:
+                    added[form] = [base | slot]
+                if form.endswith(" ig"):
+                    added.setdefault(form[:-3], []).append(base | slot)
+
+        forms = self._forms
+        for form, codes in added.items():
+            existing = forms.get(form)
+            if existing is None:
+                forms[form] = codes[0] if len(codes) == 1 else codes
+            elif isinstance(existing, int):
+                forms[form] = [existing] + codes
+            else:
+                existing.extend(codes)
+        self._verb_forms[position] = tuple(added)
+
+    def remove(self, verb) -> None:
+        """Remove a verb, given as a KovolVerb or its English, from the index."""
+        if isinstance(verb, str):
+            position = self._positions[verb]
+        else:
+            position = self._verb_positions.get(id(verb))
+            if position is None:
+                position = self._positions[verb.english]
+        self._remove_position(position)
+
+    def _remove_position(self, position: int) -> None:
+        del self._positions[self._english[position]]
+        del self._verb_positions[id(self._verbs[position])]
+        for form in self._verb_forms[position]:
+            codes = self._forms[form]
+            if isinstance(codes, int):
+                codes = (codes,)
+            codes = [c for c in codes if _unpack(c)[0] != position]
+            if not codes:
+                del self._forms[form]
+            elif len(codes) == 1:
+                self._forms[form] = codes[0]
+            else:
+                self._forms[form] = codes
+        self._verbs[position] = None
+        self._english[position] = None
+        self._verb_forms[position] = ()
+        self._free.append(position)
+
+    def update(self, verb: KovolVerb) -> None:
+        """Re-index a verb after its data, including its English, has changed."""
+        self.add(verb)
+
+    def apply_changes(self, changes) -> None:
+        """Bring the index up to date with a ChangeSet from IncrementalLexicon.reload."""
+        for english in changes.removed:
+            if english in self._positions:
+                self.remove(english)
+        for v in changes.added + changes.changed:
+            self.add(v)
@@ -1,4 +1,238 @@
-from kovol_language_tools.verbs.kovol_verb import PredictedVerb
+from kovol_language_tools.verbs.kovol_verb import (
+    KovolVerb,
+    PredictedVerb,
+    hansen_root,
+    last_root_character,
+    last_root_vowel,
+    vowel_n,
+)
+from kovol_language_tools.verbs.rule_trace import active, fire, traced
+
+actors = KovolVerb.actors
+
+# Suffixes, keyed by actor
+remote_past_suffixes = {
+    "1s": "om",
+    "2s": "oŋ",
+    "3s": "ot",
+    "1p": "omuŋg",
+    "2p": "omwa",
+    "3p": "ɛmind",
+}
+recent_past_suffixes = {
+    "1s": "ogom",
+    "2s": "ogoŋ",
+    "3s": "ɛge",
+    "1p": "oŋg",
+    "2p": "agama",
+    "3p": "ogond",
+}
+# roots ending in "ɛl" preceded by "u"
+recent_past_ul_suffixes = {
+    "1s": "ugam",
+    "2s": "ugoŋ",
+    "3s": "uga",
+    "1p": "aŋg",
+    "2p": "uguma",
+    "3p": "ugand",
+}
+# other roots ending in "ɛl"
+recent_past_el_suffixes = {
+    "1s": "agam",
+    "2s": "ogoŋ",
+    "3s": "aga",
+    "1p": "aŋg",
+    "2p": "agama",
+    "3p": "agand",
+}
+recent_past_u_suffixes = {
+    "1s": "ugum",
+    "2s": "ugoŋ",
+    "3s": "uge",
+    "1p": "uŋg",
+    "2p": "uguma",
+    "3p": "ugund",
+}
+recent_past_i_suffixes = {
+    "1s": "igom",
+    "2s": "igoŋ",
+    "3s": "ige",
+    "1p": "oŋg",
+    "2p": "igima",
+    "3p": "igond",
+}
+future_suffixes = {
+    "1s": "ɛnim",
+    "2s": "ɛniŋ",
+    "3s": "iŋ",
+    "1p": "ug",
+    "2p": "wa",
+    "3p": "is",
+}
+# singular, plural
+imperative_suffixes = ("ɛ", "as")
+imperative_g_suffixes = ("u", "was")
+# branches reported to rule_trace when tracing
+traced_rules = (
+    "remote past: uɛl root",
+    "remote past: ɛ→o in root",
+    "remote past: u assimilation",
+    "recent past: uɛl root",
+    "recent past: ɛl root",
+    "recent past: ɛ→o and ɛ→a in root",
+    "recent past: u assimilation",
+    "recent past: i assimilation",
+    "recent past: um or ɛm root reduces",
+    "recent past: m→ŋ assimilation",
+    "recent past: g-final root",
+    "future: i, u or m-final root",
+    "future: ɛl root",
+    "future: ɛ→o in 1p and 2p",
+    "imperative: g-final root",
+    "imperative: ɛ→a before g",
+)
+
+
+@traced("hansen")
+def remote_past_tense(root: str) -> tuple:
+    """Return a tuple of remote past conjugations predicted from the root."""
+    stem = root
+    suffixes = remote_past_suffixes
+
+    last_vowel = last_root_vowel(root)
+    if last_vowel == "ɛ":
+        if root[-2:] == "ɛl" and vowel_n(root, -2) == "u":
+            fire("remote past: uɛl root")
+            stem = root.replace("ɛl", "ul")
+        else:
+            fire("remote past: ɛ→o in root")
+            stem = root.replace("ɛ", "o")
+    elif last_vowel == "u":
+        fire("remote past: u assimilation")
+        suffixes = {k: v.replace("o", "u") for (k, v) in suffixes.items()}
+
+    return tuple(stem + suffixes[a] for a in actors)
+
+
+@traced("hansen")
+def recent_past_tense(root: str) -> tuple:
+    """Return a tuple of recent past conjugations predicted from the root."""
+    suffixes = dict(recent_past_suffixes)
+    roots = {k: root for k in actors}
+    last_vowel = last_root_vowel(root)
+    last_character = last_root_character(root)
+
+    if last_vowel == "ɛ":
+        if root[-2:] == "ɛl":
+            # shorten root by two
+            roots = {k: v[:-2] for (k, v) in roots.items()}
+            if vowel_n(root, -2) == "u":
+                fire("recent past: uɛl root")
+                suffixes = dict(recent_past_ul_suffixes)
+            else:
+                fire("recent past: ɛl root")
+                for r in ("1s", "3s", "1p", "2p", "3p"):
+                    roots[r] = roots[r].replace("ɛ", "a")
+                roots["2s"] = roots["2s"].replace("ɛ", "o")
+                suffixes = dict(recent_past_el_suffixes)
+        else:
+            fire("recent past: ɛ→o and ɛ→a in root")
+            for r in ("1s", "2s", "1p", "3p"):
+                roots[r] = roots[r].replace("ɛ", "o")
+            roots["2p"] = root.replace("ɛ", "a")
+
+    elif last_vowel == "u":
+        fire("recent past: u assimilation")
+        suffixes = dict(recent_past_u_suffixes)
+        if last_character == "m":
+            suffixes["1s"] = "ogom"
+
+    elif last_vowel == "i":
+        fire("recent past: i assimilation")
+        suffixes = dict(recent_past_i_suffixes)
+
+    if last_character == "m":
+        if root[-2:] == "um" or root[-2:] == "ɛm":
+            fire("recent past: um or ɛm root reduces")
+            suffixes = {k: v[1:] for (k, v) in suffixes.items()}
+            roots = {k: v[:-1] for (k, v) in roots.items()}
+            roots["1p"] = root
+            if root[-2:] == "um":
+                suffixes["1p"] = "uŋg"
+            else:
+                suffixes["1p"] = "oŋg"
+        elif root[-2] == "u" or root[-2] == "ɛ":
+            pass
+        else:
+            fire("recent past: m→ŋ assimilation")
+            roots = {k: v[:-1] + "ŋ" for (k, v) in roots.items()}
+            roots["1p"] = root
+            suffixes = {k: v[1:] for (k, v) in suffixes.items()}
+            suffixes["1p"] = "oŋg"
+
+    elif last_character == "g":
+        fire("recent past: g-final root")
+        suffixes = {k: v[2:] for (k, v) in suffixes.items()}
+        suffixes["1p"] = "oŋg"
+
+    return tuple(roots[a] + suffixes[a] for a in actors)
+
+
+@traced("hansen")
+def future_tense(root: str) -> tuple:
+    """Return a tuple of future tense conjugations predicted from the root."""
+    suffixes = future_suffixes
+    roots = {k: root for k in actors}
+
+    last_vowel = last_root_vowel(root)
+    last_character = last_root_character(root)
+
+    if last_vowel == "i" or last_vowel == "u" or last_character == "m":
+        fire("future: i, u or m-final root")
+        suffixes = dict(suffixes)
+        suffixes["1s"] = "inim"
+        suffixes["2s"] = "iniŋ"
+    elif root[-2:] == "ɛl":
+        fire("future: ɛl root")
+        suffixes = dict(suffixes)
+        suffixes["1s"] = suffixes["1s"][2:]
+        suffixes["2s"] = suffixes["2s"][2:]
+        suffixes["3s"] = "aŋ"
+    elif last_vowel == "ɛ":
+        fire("future: ɛ→o in 1p and 2p")
+        roots["1p"] = roots["2p"] = root.replace("ɛ", "o")
+
+    return tuple(roots[a] + suffixes[a] for a in actors)
+
+
+@traced("hansen")
+def imperatives(root: str) -> tuple:
+    """Return a tuple of the singular and plural imperative predicted from the root."""
+    stem = root
+    suffixes = imperative_suffixes
+    if last_root_character(root) == "g":
+        fire("imperative: g-final root")
+        suffixes = imperative_g_suffixes
+        if last_root_vowel(root) == "ɛ":
+            fire("imperative: ɛ→a before g")
+            stem = root.replace("ɛ", "a")
+    return tuple(stem + sfx for sfx in suffixes)
+
+
+def paradigm_from_root(root: str) -> tuple:
+    """Return the predicted paradigm of a root, in the order of get_all_conjugations."""
+    return (
+        remote_past_tense(root)
+        + recent_past_tense(root)
+        + future_tense(root)
+        + imperatives(root)
+    )
+
+
+def hansen_paradigm(future_3p: str) -> tuple:
+    """Predict an entire paradigm from the future 3p without building a verb object.
+    Returns a tuple in the order of get_all_conjugations."""
+    return paradigm_from_root(hansen_root(future_3p))
 
 
 class HansenPredictedVerb(PredictedVerb):
@@ -11,156 +245,30 @@ class HansenPredictedVerb(PredictedVerb):
         self.predict_verb()
 
     def predict_remote_past_tense(self):
-        root = self.root  # save a copy of the root so we can alter it
-
-        suffixes = {
-            "1s": "om",
-            "2s": "oŋ",
-            "3s": "ot",
-            "1p": "omuŋg",
-            "2p": "omwa",
-            "3p": "ɛmind",
-        }
-        last_vowel = self.get_last_root_vowel()
-        if last_vowel == "ɛ":
-            if (
-                self.get_last_two_root_characters() == "ɛl"
-                and self.get_vowel_n(-2) == "u"
-            ):
-                root = root.replace("ɛl", "ul")
-            else:
-                root = root.replace("ɛ", "o")
-        elif last_vowel == "u":
-            suffixes = {k: v.replace("o", "u") for (k, v) in suffixes.items()}
-
-        for a in self.actors:
-            setattr(self, f"remote_past_{a}", root + suffixes[a])
+        self.set_tense("remote_past", remote_past_tense(self.root))
 
     def predict_recent_past_tense(self):
-        suffixes = {
-            "1s": "ogom",
-            "2s": "ogoŋ",
-            "3s": "ɛge",
-            "1p": "oŋg",
-            "2p": "agama",
-            "3p": "ogond",
-        }
-        roots = {k: self.root for k in ["1s", "2s", "3s", "1p", "2p", "3p"]}
-        last_vowel = self.get_last_root_vowel()
-        last_character = self.get_last_root_character()
-
-        if last_vowel == "ɛ":
-            if self.get_last_two_root_characters() == "ɛl":
-                # shorten root by two
-                roots = {k: v[:-2] for (k, v) in roots.items()}
-                if self.get_vowel_n(-2) == "u":
-                    suffixes = {
-                        "1s": "ugam",
-                        "2s": "ugoŋ",
-                        "3s": "uga",
-                        "1p": "aŋg",
-                        "2p": "uguma",
-                        "3p": "ugand",
-                    }
-                else:
-                    for r in ("1s", "3s", "1p", "2p", "3p"):
-                        roots[r] = roots[r].replace("ɛ", "a")
-                    roots["2s"] = roots["2s"].replace("ɛ", "o")
-
-                    suffixes = {
-                        "1s": "agam",
-                        "2s": "ogoŋ",
-                        "3s": "aga",
-                        "1p": "aŋg",
-                        "2p": "agama",
-                        "3p": "agand",
-                    }
-            else:
-                for r in ("1s", "2s", "1p", "3p"):
-                    roots[r] = roots[r].replace("ɛ", "o")
-                roots["2p"] = self.root.replace("ɛ", "a")
-
-        elif last_vowel == "u":
-            suffixes["1s"] = "ugum"
-            suffixes["2s"] = "ugoŋ"
-            suffixes["3s"] = "uge"
-            suffixes["1p"] = "uŋg"
-            suffixes["2p"] = "uguma"
-            suffixes["3p"] = "ugund"
-            if last_character == "m":
-                suffixes["1s"] = "ogom"
-
-        elif last_vowel == "i":
-            suffixes["1s"] = "igom"
-            suffixes["2s"] = "igoŋ"
-            suffixes["3s"] = "ige"
-            suffixes["2p"] = "igima"
-            suffixes["3p"] = "igond"
-
-        if last_character == "m":
-            if (
-                self.get_last_two_root_characters() == "um"
-                or self.get_last_two_root_characters() == "ɛm"
-            ):
-                suffixes = {k: v[1:] for (k, v) in suffixes.items()}
-                suffixes["1p"] = "oŋg"
-                roots = {k: v[:-1] for (k, v) in roots.items()}
-                roots["1p"] = self.root
-                if self.get_last_two_root_characters() == "um":
-                    suffixes["1p"] = "uŋg"
-                elif self.get_last_two_root_characters() == "ɛm":
-                    suffixes["1p"] = "oŋg"
-            elif self.root[-2] == "u" or self.root[-2] == "ɛ":
-                pass
-            else:
-                roots = {k: v[:-1] + "ŋ" for (k, v) in roots.items()}
-                roots["1p"] = self.root
-                suffixes = {k: v[1:] for (k, v) in suffixes.items()}
-                suffixes["1p"] = "oŋg"
-
-        elif last_character == "g":
-            suffixes = {k: v[2:] for (k, v) in suffixes.items()}
-            suffixes["1p"] = "oŋg"
-
-        for a in self.actors:
-            setattr(self, f"recent_past_{a}", roots[a] + suffixes[a])
+        self.set_tense("recent_past", recent_past_tense(self.root))
 
     def predict_future_tense(self):
-        suffixes = {
-            "1s": "ɛnim",
-            "2s": "ɛniŋ",
-            "3s": "iŋ",
-            "1p": "ug",
-            "2p": "wa",
-            "3p": "is",
-        }
-        roots = {k: self.root for k in ["1s", "2s", "3s", "1p", "2p", "3p"]}
-
-        last_vowel = self.get_last_root_vowel()
-        last_character = self.get_last_root_character()
-
-        if last_vowel == "i" or last_vowel == "u" or last_character == "m":
-            suffixes["1s"] = "inim"
-            suffixes["2s"] = "iniŋ"
-        elif self.get_last_two_root_characters() == "ɛl":
-            suffixes["1s"] = suffixes["1s"][2:]
-            suffixes["2s"] = suffixes["2s"][2:]
-            suffixes["3s"] = "aŋ"
-        elif last_vowel == "ɛ":
-            roots["1p"] = roots["2p"] = self.root.replace("ɛ", "o")
-
-        for a in self.actors:
-            setattr(self, f"future_{a}", roots[a] + suffixes[a])
+        self.set_tense("future", future_tense(self.root))
 
     def predict_imperative(self):
-        suffixes = {"sing_imp": "ɛ", "pl_imp": "as"}
-        root = self.root
-        if self.get_last_root_vowel() == "ɛ":
-            root = root.replace("ɛ", "a")
-        if self.get_last_root_character() == "g":
-            suffixes["sing_imp"] = "u"
-            suffixes["pl_imp"] = "was"
-        else:
-            root = self.root
-        self.singular_imperative = root + suffixes["sing_imp"]
-        self.plural_imperative = root + suffixes["pl_imp"]
+        self.singular_imperative, self.plural_imperative = imperatives(self.root)
+
+
+def predict_many(inputs) -> list:
+    """Predict paradigms for an iterable of future 3p forms.
+    Returns a list of tuples in the order of get_all_conjugations, one per input.
+    The rules only look at the root, so inputs are grouped by root and each group is
+    predicted once."""
+    groups = {}
+    results = []
+    # a rule tracer counts each input predicted, so roots aren't reused while tracing
+    tracing = active() is not None
+    for future_3p in inputs:
+        root = hansen_root(future_3p)
+        if root not in groups or tracing:
+            groups[root] = paradigm_from_root(root)
+        results.append(groups[root])
+    return results
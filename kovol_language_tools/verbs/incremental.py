@@ -0,0 +1,103 @@
+import csv
+import hashlib
+import os
+from collections import namedtuple
+
+from kovol_language_tools.verbs.csv_reader import csv_fields, open_csv, rows_to_verb
+from kovol_language_tools.verbs.predictors import predict_paradigm
+
+# added and changed are lists of KovolVerbs, removed is a list of English
+ChangeSet = namedtuple("ChangeSet", ["added", "changed", "removed"])
+
+
+def _hash_rows(rows: list) -> bytes:
+    return hashlib.sha1("\x1e".join(["\x1f".join(r) for r in rows]).encode()).digest()
+
+
+def _row_dict(row: list) -> dict:
+    """The dict csv.DictReader would make of a row, less any extra fields."""
+    d = dict(zip(csv_fields, row))
+    if len(row) < len(csv_fields):
+        d.update(dict.fromkeys(csv_fields[len(row) :]))
+    return d
+
+
+class IncrementalLexicon:
+    """A lexicon read from a csv file that can be reloaded after the file changes, only
+    rebuilding the verbs (and predictions) whose rows were added or edited."""
+
+    def __init__(self, csv_file, rules=("stanley", "hansen")):
+        self.csv_file = csv_file
+        self.rules = tuple(rules)
+        self._verbs = {}  # english: KovolVerb, in order of first appearance in the file
+        self._hashes = {}  # english: hash of the verb's rows
+        self._predictions = {}  # english: {rules: paradigm or None}
+        self._stat = None
+        self.reload()
+
+    def __str__(self):
+        return f"Incremental lexicon: {self.csv_file}, {len(self)} verbs"
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __len__(self):
+        return len(self._verbs)
+
+    def verbs(self) -> list:
+        """Return the KovolVerbs sorted by future 1s, like get_data_from_csv."""
+        return sorted(self._verbs.values(), key=lambda x: x.future_1s)
+
+    def get_verb(self, english: str):
+        return self._verbs.get(english)
+
+    def prediction(self, english: str, rules="stanley") -> tuple or None:
+        """Return the paradigm rules predicts for a verb, None if it can't be predicted."""
+        predictions = self._predictions[english]
+        if rules not in predictions:
+            predictions[rules] = predict_paradigm(self._verbs[english], rules)
+        return predictions[rules]
+
+    def reload(self, force=False) -> ChangeSet:
+        """Re-read the csv file and return a ChangeSet of what changed since the last load.
+        An unchanged size and modification time skip reading, unless force."""
+        stat = os.stat(self.csv_file)
+        stat = (stat.st_size, stat.st_mtime_ns)
+        if stat == self._stat and not force:
+            return ChangeSet([], [], [])
+
+        with open_csv(self.csv_file) as file:
+            reader = csv.reader(file, delimiter=",")
+            next(reader, None)  # Remove header
+            groups = {}
+            for r in reader:
+                if not r:
+                    continue  # blank lines, as csv.DictReader skips them
+                eng = r[4] if len(r) > 4 else None
+                if eng in groups:
+                    groups[eng].append(r)
+                else:
+                    groups[eng] = [r]
+
+        added, changed = [], []
+        verbs, hashes = {}, {}
+        for english, rows in groups.items():
+            digest = _hash_rows(rows)
+            old = self._hashes.get(english)
+            if old == digest:
+                verbs[english] = self._verbs[english]
+            else:
+                verbs[english] = v = rows_to_verb([_row_dict(r) for r in rows])
+                self._predictions[english] = {
+                    rules: predict_paradigm(v, rules) for rules in self.rules
+                }
+                (added if old is None else changed).append(v)
+            hashes[english] = digest
+        removed = [english for english in self._verbs if english not in verbs]
+        for english in removed:
+            del self._predictions[english]
+
+        self._verbs = verbs
+        self._hashes = hashes
+        self._stat = stat
+        return ChangeSet(added, changed, removed)
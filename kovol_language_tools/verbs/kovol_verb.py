@@ -1,8 +1,66 @@
-from tabulate import tabulate
+from operator import attrgetter
 
 from kovol_language_tools.facts import phonetic_vowels
 
 
+def stanley_root(remote_past_1s: str, recent_past_1s: str) -> str:
+    """Find the verb root from the remote past 1s and recent past 1s."""
+    remote_past_tense = remote_past_1s[0:-2]  # strip -om
+    past_tns = recent_past_1s[0:-3]  # strip -gom
+
+    if len(past_tns) > len(remote_past_tense):
+        return past_tns
+    else:
+        return remote_past_tense
+
+
+def hansen_root(future_3p: str) -> str:
+    """Find the verb root from the future 3p."""
+    return future_3p[:-2]
+
+
+# Functions describing a root string. The prediction rules are built on these so they
+# can run without a verb object, the KovolVerb methods of the same name wrap them.
+def root_vowels(root: str) -> str:
+    """Returns a string containing just the vowels of the root."""
+    return "".join([c for c in root if c in phonetic_vowels])
+
+
+def vowel_n(root: str, n: int) -> str or None:
+    """Return the nth vowel of the root, or None"""
+    try:
+        return root_vowels(root)[n]
+    except IndexError:
+        return None
+
+
+def last_root_vowel(root: str) -> str or None:
+    """Returns last vowel of root, or None"""
+    return vowel_n(root, -1)
+
+
+def last_root_character(root: str) -> str or None:
+    """Returns last character of root, or None"""
+    try:
+        return root[-1]
+    except IndexError:
+        return None
+
+
+def root_ending(root: str) -> str:
+    """Returns whether the root ends in a Vowel "V" or Consonant "C"."""
+    if root[-1] in phonetic_vowels:
+        return "V"
+    else:
+        return "C"
+
+
+def root_signature(root: str) -> str:
+    """Summarise the root features the prediction rules branch on: the last two vowels and
+    the last two characters, e.g. "u/ɛ/ɛl". Signatures share the same rules."""
+    return "/".join((vowel_n(root, -2) or "", last_root_vowel(root) or "", root[-2:]))
+
+
 class KovolVerb:
     """A class to represent a Kovol verb defining the conjugations of it as attributes with methods for retrieving
     those conjugations and printing to screen."""
@@ -50,53 +108,34 @@ class KovolVerb:
         """Find the verb root. Can take a keyword argument to change how it's predicted."""
 
         if rules == "hansen":
-            self.root = self.future_3p[:-2]
+            self.root = hansen_root(self.future_3p)
         else:
-            remote_past_tense = self.remote_past_1s[0:-2]  # strip -om
-            past_tns = self.recent_past_1s[0:-3]  # strip -gom
-
-            if len(past_tns) > len(remote_past_tense):
-                self.root = past_tns
-            elif len(past_tns) == len(remote_past_tense):
-                self.root = remote_past_tense
-            else:
-                self.root = remote_past_tense
+            self.root = stanley_root(self.remote_past_1s, self.recent_past_1s)
 
     def verb_vowels(self) -> str:
         """Returns a string containing just the vowels of the root."""
         try:
-            v = [c for c in self.root if c in self.vowels]
+            return root_vowels(self.root)
         except AttributeError:
             self.predict_root()
-            v = [c for c in self.root if c in self.vowels]
-        v = "".join(v)
-        return v
+            return root_vowels(self.root)
 
     def get_vowel_n(self, n) -> str or None:
         """Return the nth vowel, or None"""
-        v = self.verb_vowels()
-        if not v:
-            return None
-        else:
-            try:
-                return v[n]
-            except IndexError:
-                return None
+        try:
+            return vowel_n(self.root, n)
+        except AttributeError:
+            self.predict_root()
+            return vowel_n(self.root, n)
 
     def get_last_root_vowel(self) -> str or None:
         """Returns last vowel of root, or None"""
-        v = self.verb_vowels()
-        if not v:
-            return None
-        else:
-            return v[-1]
+        return self.get_vowel_n(-1)
 
     def get_last_root_character(self) -> str or None:
         """Returns last character of root, or None"""
         try:
-            return self.root[-1]
-        except IndexError:
-            return None
+            return last_root_character(self.root)
         except AttributeError:
             self.predict_root()
             return self.root[-1]
@@ -113,31 +152,28 @@ class KovolVerb:
 
     def get_remote_past_tense(self) -> tuple:
         """Return a tuple of remote past conjugations."""
-        return tuple([getattr(self, f"remote_past_{a}") for a in self.actors])
+        return _get_remote_past_tense(self)
 
     def get_recent_past_tense(self) -> None:
         """Return a tuple of recent past tense conjugations."""
-        return tuple([getattr(self, f"recent_past_{a}") for a in self.actors])
+        return _get_recent_past_tense(self)
 
     def get_future_tense(self) -> tuple:
         """Return a tuple of future tense conjugations."""
-        return tuple([getattr(self, f"future_{a}") for a in self.actors])
+        return _get_future_tense(self)
 
     def get_imperatives(self) -> tuple:
         """Return a tuple of imperative conjugations."""
         return (self.singular_imperative, self.plural_imperative)
 
     def get_all_conjugations(self) -> tuple:
-        """Return a tuple of all conjugations for easily comparing verbs."""
-        return (
-            self.get_remote_past_tense()
-            + self.get_recent_past_tense()
-            + self.get_future_tense()
-            + self.get_imperatives()
-        )
+        """Return a tuple of all conjugations for easily comparing verbs. The labels are in slots."""
+        return _get_all_conjugations(self)
 
     def print_paradigm(self) -> None:
         """Use tabulate to print a nice paradigm table to the terminal."""
+        from tabulate import tabulate  # only loaded when printing
+
         table = [
             ["1s", self.remote_past_1s, self.recent_past_1s, self.future_1s, ""],
             [
@@ -170,6 +206,60 @@ class KovolVerb:
         print("Short form: {short}".format(short=self.short))
 
 
+# Labels of the conjugations in the order of KovolVerb.get_all_conjugations
+slots = tuple(f"{t}_{a}" for t in KovolVerb.tenses for a in KovolVerb.actors) + (
+    "singular_imperative",
+    "plural_imperative",
+)
+# Positions in slots where users sometimes enter data with " ig" on the end
+ig_slots = (slots.index("future_2s"), slots.index("future_2p"))
+_zero_row = bytes(len(slots))
+
+_get_remote_past_tense = attrgetter(*slots[0:6])
+_get_recent_past_tense = attrgetter(*slots[6:12])
+_get_future_tense = attrgetter(*slots[12:18])
+_get_all_conjugations = attrgetter(*slots)
+
+
+def compare_conjugations(predicted: tuple, actual: tuple) -> dict:
+    """Compare two tuples in the order of KovolVerb.get_all_conjugations, returning a dict of
+    differences keyed by the slot label with (actual data, predicted data) as values."""
+    if predicted == actual:
+        return {}
+    diff = {}
+    for i, (p, a) in enumerate(zip(predicted, actual)):
+        if a != p:
+            if i in ig_slots and a.endswith(" ig"):
+                # ignore data that has " ig" on the end, sometimes entered by users
+                a = a[:-3]  # strip ig off of the comparison
+                if a == p:
+                    continue
+            # add non matching prediction to errors
+            diff[slots[i]] = (a, p)
+    return diff
+
+
+def mismatch_matrix(pairs, out=None) -> bytearray:
+    """Compare a sequence of (predicted, actual) conjugation tuples in one go. Returns a flat,
+    row major len(pairs) x len(slots) matrix with 1 marking a mismatching cell, following the
+    same rules as compare_conjugations. A preallocated bytearray can be given as out."""
+    width = len(slots)
+    if out is None:
+        out = bytearray(len(pairs) * width)
+    for row, (predicted, actual) in enumerate(pairs):
+        row *= width
+        if predicted == actual:
+            out[row : row + width] = _zero_row
+            continue
+        for i in range(width):
+            p = predicted[i]
+            a = actual[i]
+            if a != p and i in ig_slots and a.endswith(" ig"):
+                a = a[:-3]
+            out[row + i] = a != p
+    return out
+
+
 class PredictedVerb(KovolVerb):
     def __str__(self):
         string = self.get_string_repr()
@@ -188,10 +278,12 @@ class PredictedVerb(KovolVerb):
     def root_ending(self) -> str:
         """Returns whether the root ends in a Vowel "V" or Consonant "C".
         Called during __init__."""
-        if self.root[-1] in self.vowels:
-            return "V"
-        else:
-            return "C"
+        return root_ending(self.root)
+
+    def set_tense(self, tense: str, forms: tuple) -> None:
+        """Assign a tuple of conjugations, ordered as self.actors, to a tense."""
+        for a, form in zip(self.actors, forms):
+            setattr(self, f"{tense}_{a}", form)
 
     def print_with_kovol_verb(self, kovol_verb: KovolVerb) -> None:
         """Use the parent class' print_paradigm method to print both predicted and actual paradigm."""
@@ -204,24 +296,8 @@ class PredictedVerb(KovolVerb):
         """Compare predicted Kovol verb to the actual one, returning a dict of differences. The key for the dict
         is the tense and actor (as a string) and the value is the tuple (actual data, predicted data).
         Also asigns this return value to self.errors."""
-        diff = {}
-        # explicitly define order of conjugations
-        order = [f"{t}_{a}" for t in self.tenses for a in self.actors] + [
-            "singular_imperative",
-            "plural_imperative",
-        ]
-
         predicted = self.get_all_conjugations()
         actual = kovol_verb.get_all_conjugations()
-
-        for o, p, a in zip(order, predicted, actual):
-            # o=order (label), p=predicted, a=actual
-            if o == "future_2s" or o == "future_2p":
-                # ignore data that has " ig" on the end, sometimes entered by users
-                if a.endswith(" ig"):
-                    a = a[:-3]  # strip ig off of the comparison
-            if a != p:
-                # add non matching prediction to errors
-                diff[o] = (a, p)
+        diff = compare_conjugations(predicted, actual)
         self.errors = diff
         return self.errors
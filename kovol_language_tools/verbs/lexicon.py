@@ -0,0 +1,77 @@
+import os
+from collections import namedtuple
+
+from kovol_language_tools.verbs.csv_reader import read_verb_values
+from kovol_language_tools.verbs.kovol_verb import KovolVerb
+
+# verbs is a list of KovolVerbs sorted by future 1s,
+# provenance is a dict of english: {attribute: author}
+MergedLexicon = namedtuple("MergedLexicon", ["verbs", "provenance"])
+
+# What to do when two files give different forms for the same verb and slot
+conflict_rules = ("first", "last", "error")
+
+
+def file_author(path) -> str:
+    """The default author of a csv file, its name without extensions: 'steve' for steve.csv.gz"""
+    return os.path.basename(path).split(".")[0]
+
+
+def load_lexicon(paths, conflict="first", authors=None, workers=None) -> MergedLexicon:
+    """Read several lexicon csv files and merge their verbs by English.
+    Where files disagree on a form, conflict chooses whether the first or last file wins, or
+    'error' raises a ValueError. Blank cells never override a form. authors is an optional dict
+    of path: author, otherwise each file's name is used. Every verb's author lists the authors
+    that contributed to it and the provenance gives the author of every form.
+    The files are parsed concurrently in a process pool, workers sets its size (1 disables it).
+    A file listed more than once is only read once."""
+    if conflict not in conflict_rules:
+        raise ValueError(f"Unknown conflict rule: {conflict}")
+    authors = {os.path.realpath(p): a for (p, a) in (authors or {}).items()}
+    paths = list(dict.fromkeys(os.path.realpath(p) for p in paths))
+
+    if workers == 1 or len(paths) < 2:
+        files = [read_verb_values(p) for p in paths]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(workers or os.cpu_count(), len(paths))
+        with ProcessPoolExecutor(workers) as pool:
+            files = list(pool.map(read_verb_values, paths))
+
+    file_authors = [authors.get(p) or file_author(p) for p in paths]
+    merged = {}  # english: {attribute: value}
+    provenance = {}  # english: {attribute: author}
+    for author, verb_values in zip(file_authors, files):
+        for english, values in verb_values:
+            if english not in merged:
+                merged[english] = {a: v for (a, v) in values.items() if v}
+                provenance[english] = dict.fromkeys(merged[english], author)
+                continue
+            forms = merged[english]
+            sources = provenance[english]
+            for a, v in values.items():
+                if not v:
+                    continue
+                if a not in forms:
+                    forms[a] = v
+                    sources[a] = author
+                elif forms[a] != v:
+                    if conflict == "error":
+                        raise ValueError(
+                            f"'{english}' {a} is '{forms[a]}' from {sources[a]}"
+                            f" but '{v}' from {author}"
+                        )
+                    if conflict == "last":
+                        forms[a] = v
+                        sources[a] = author
+
+    verbs = []
+    for english, forms in merged.items():
+        v = KovolVerb("", english)
+        v.__dict__.update(forms)
+        contributed = set(provenance[english].values())
+        v.author = ", ".join(dict.fromkeys(a for a in file_authors if a in contributed))
+        verbs.append(v)
+    verbs.sort(key=lambda x: x.future_1s)
+    return MergedLexicon(verbs, provenance)
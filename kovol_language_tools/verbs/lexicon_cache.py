@@ -0,0 +1,108 @@
+import hashlib
+import marshal
+import os
+import struct
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.kovol_verb import KovolVerb
+
+# A cache file is a header followed by a marshalled (attribute names, [attribute values, ...])
+magic = b"KVLC"
+format_version = 1  # bump whenever the payload or the objects the reader builds change
+# magic, format, marshal version, csv size, csv mtime, csv sha256
+header = struct.Struct("<4sHHQQ32s")
+
+
+def _hash_file(path) -> bytes:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.digest()
+
+
+def _source_header(csv_file, digest=None, stat=None) -> bytes:
+    """The cache header describing csv_file as it is now, or as stat and digest found it."""
+    stat = stat or os.stat(csv_file)
+    return header.pack(
+        magic,
+        format_version,
+        marshal.version,
+        stat.st_size,
+        stat.st_mtime_ns,
+        digest or _hash_file(csv_file),
+    )
+
+
+def save_cache(verbs: list, cache_file, csv_file, source=None) -> None:
+    """Write a list of KovolVerbs parsed from csv_file to a binary cache file. source is the
+    _source_header of csv_file taken before it was parsed, so the cache can't describe
+    newer content than it holds. Without it the file is fingerprinted now."""
+    names = list(vars(verbs[0])) if verbs else []
+    records = [tuple([getattr(v, n) for n in names]) for v in verbs]
+    tmp = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(source or _source_header(csv_file))
+        marshal.dump((names, records), f)
+    os.replace(tmp, cache_file)  # never leave a half written cache behind
+
+
+def load_cache(cache_file, csv_file) -> list or None:
+    """Read a list of KovolVerbs from a binary cache file, or None if the cache is missing,
+    from another version or csv_file has changed since it was written."""
+    try:
+        with open(cache_file, "rb") as f:
+            head = f.read(header.size)
+            if len(head) != header.size:
+                return None
+            name, version, marshal_version, size, mtime, digest = header.unpack(head)
+            if (name, version, marshal_version) != (
+                magic,
+                format_version,
+                marshal.version,
+            ):
+                return None
+            stat = os.stat(csv_file)
+            if (size, mtime) != (stat.st_size, stat.st_mtime_ns):
+                # touched or copied files keep their content, only the hash can tell
+                if size != stat.st_size or digest != _hash_file(csv_file):
+                    return None
+                stale_header = True
+            else:
+                stale_header = False
+            names, records = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if stale_header:
+        try:
+            with open(cache_file, "r+b") as f:
+                f.write(_source_header(csv_file, digest, stat))
+        except OSError:
+            pass
+
+    verbs = []
+    new = KovolVerb.__new__
+    for r in records:
+        v = new(KovolVerb)
+        v.__dict__.update(zip(names, r))
+        verbs.append(v)
+    return verbs
+
+
+def get_cached_data_from_csv(csv_file, cache_file=None) -> list:
+    """A drop in for get_data_from_csv that keeps the parsed verbs in a binary cache next to the
+    csv (or at cache_file). The cache is rebuilt whenever the csv changes."""
+    if cache_file is None:
+        cache_file = f"{csv_file}.cache"
+    verbs = load_cache(cache_file, csv_file)
+    if verbs is None:
+        source = _source_header(csv_file)
+        verbs = get_data_from_csv(csv_file)
+        if source != _source_header(csv_file, source[-32:]):
+            return verbs  # changed while it was read, don't cache a mix of versions
+        try:
+            save_cache(verbs, cache_file, csv_file, source)
+        except OSError:
+            pass  # a read only location just means no cache
+    return verbs
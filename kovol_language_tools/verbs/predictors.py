@@ -0,0 +1,32 @@
+from kovol_language_tools.verbs import hansen_predicted_verb, stanley_predicted_verb
+from kovol_language_tools.verbs.kovol_verb import KovolVerb, hansen_root, stanley_root
+
+# rules: (attributes used as input, root function, paradigm function)
+predictors = {
+    "stanley": (
+        ("remote_past_1s", "recent_past_1s"),
+        stanley_root,
+        stanley_predicted_verb.paradigm_from_root,
+    ),
+    "hansen": (
+        ("future_3p",),
+        hansen_root,
+        hansen_predicted_verb.paradigm_from_root,
+    ),
+}
+
+
+def predict_paradigm(verb: KovolVerb, rules="stanley") -> tuple or None:
+    """Predict the paradigm of a verb from its own data, in the order of get_all_conjugations.
+    Returns None if the verb is missing the forms the rules need."""
+    try:
+        input_attrs, root_func, paradigm_func = predictors[rules]
+    except KeyError:
+        raise ValueError(f"Unknown prediction rules: {rules}")
+    inputs = [getattr(verb, a) for a in input_attrs]
+    if not all(inputs):
+        return None
+    try:
+        return paradigm_func(root_func(*inputs))
+    except IndexError:
+        return None
@@ -0,0 +1,122 @@
+from html import escape
+from operator import attrgetter
+
+from kovol_language_tools.verbs.kovol_verb import KovolVerb
+
+headers = ["", "Remote past tense", "Recent past tense", "Future tense", "Imperative"]
+formats = ("rst", "markdown", "html", "plain")
+batch_size = 500  # verbs rendered between writes
+
+# actor: getter for the row of that actor in a paradigm table
+_row_getters = {
+    a: attrgetter(
+        f"remote_past_{a}",
+        f"recent_past_{a}",
+        f"future_{a}",
+        {"2s": "singular_imperative", "2p": "plural_imperative"}.get(a, "short"),
+    )
+    for a in KovolVerb.actors
+}
+
+
+def paradigm_table(verb: KovolVerb) -> list:
+    """Return the rows of the table print_paradigm shows, one per actor."""
+    table = []
+    for actor, getter in _row_getters.items():
+        remote, recent, future, imperative = getter(verb)
+        if actor not in ("2s", "2p"):
+            imperative = ""  # only 2s and 2p have imperatives
+        table.append([actor, remote, recent, future, imperative])
+    return table
+
+
+def column_widths(tables: list, format="rst") -> list:
+    """Work out column widths wide enough for every table, laid out like tabulate does with at
+    least two spaces beside each header."""
+    names = _headers(format)
+    widths = [len(h) + 2 for h in names]
+    for table in tables:
+        for row in table:
+            for i, cell in enumerate(row):
+                if len(cell) > widths[i]:
+                    widths[i] = len(cell)
+    return widths
+
+
+def _headers(format: str) -> list:
+    # an empty rst heading needs '..' to be valid
+    return [".."] + headers[1:] if format == "rst" else headers
+
+
+def _simple_lines(table: list, widths: list, format: str) -> list:
+    def line(cells):
+        return "  ".join([c.ljust(w) for (c, w) in zip(cells, widths)]).rstrip()
+
+    if format == "plain":
+        return [line(headers)] + [line(row) for row in table]
+    rule = "  ".join(["=" * w for w in widths])
+    return [rule, line(_headers(format)), rule] + [line(r) for r in table] + [rule]
+
+
+def _markdown_lines(table: list, widths: list) -> list:
+    def line(cells):
+        return "| " + " | ".join([c.ljust(w) for (c, w) in zip(cells, widths)]) + " |"
+
+    rule = "|" + "|".join(["-" * (w + 2) for w in widths]) + "|"
+    return [line(headers), rule] + [line(row) for row in table]
+
+
+def _html_lines(table: list, widths: list) -> list:
+    def line(cells, tag):
+        cells = [
+            f"<{tag}>{escape(c.ljust(w))}</{tag}>" for (c, w) in zip(cells, widths)
+        ]
+        return "<tr>" + "".join(cells) + "</tr>"
+
+    return (
+        ["<table>", "<thead>", line(headers, "th"), "</thead>", "<tbody>"]
+        + [line(row, "td") for row in table]
+        + ["</tbody>", "</table>"]
+    )
+
+
+def render_paradigm(verb: KovolVerb, table: list, widths: list, format="rst") -> list:
+    """Return the lines of one verb's paradigm, the rst layout matches print_paradigm."""
+    title = f'{verb.future_1s}, "{verb.english}"'
+    short = f"Short form: {verb.short}"
+    if format == "markdown":
+        return [f"### {title}", ""] + _markdown_lines(table, widths) + ["", short, ""]
+    elif format == "html":
+        return (
+            [f"<h3>{escape(title)}</h3>"]
+            + _html_lines(table, widths)
+            + [f"<p>{escape(short)}</p>"]
+        )
+    return ["", f" {title}"] + _simple_lines(table, widths, format) + [short]
+
+
+def render_paradigms(verbs, file, format="rst", uniform=True) -> int:
+    """Write the paradigms of many verbs to a path or file-like object as 'rst', 'markdown',
+    'html' or 'plain' text. Column widths are worked out once for the whole book if uniform,
+    otherwise for each table. Returns the number of verbs written."""
+    if format not in formats:
+        raise ValueError(f"Unknown paradigm format: {format}")
+    if isinstance(file, str):
+        with open(file, "w", encoding="utf-8") as f:
+            return render_paradigms(verbs, f, format, uniform)
+
+    verbs = list(verbs)
+    tables = [paradigm_table(v) for v in verbs]
+    if uniform:
+        widths = column_widths(tables, format)
+    lines = []
+    for i, (v, table) in enumerate(zip(verbs, tables), 1):
+        if not uniform:
+            widths = column_widths([table], format)
+        lines += render_paradigm(v, table, widths, format)
+        if i % batch_size == 0:
+            file.write("\n".join(lines) + "\n")
+            lines = []
+    if lines:
+        file.write("\n".join(lines) + "\n")
+    return len(verbs)
@@ -0,0 +1,194 @@
+import csv
+import json
+import os
+
+from kovol_language_tools.verbs import rule_trace
+from kovol_language_tools.verbs.kovol_verb import (
+    compare_conjugations,
+    root_signature,
+    slots,
+)
+from kovol_language_tools.verbs.predictors import predictors
+
+# lexicons smaller than this are evaluated in process, a pool costs more than it saves
+parallel_threshold = 5000
+
+
+class PredictionReport:
+    """Aggregated results of running a predictor over a lexicon."""
+
+    def __init__(self, rules: str):
+        self.rules = rules
+        self.verbs = 0
+        self.skipped = []  # english of verbs that couldn't be predicted
+        # slot: [compared, correct], only slots with actual data are compared
+        self.slots = {s: [0, 0] for s in slots}
+        # signature: [verbs, verbs with errors, errors]
+        self.signatures = {}
+        # (english, signature, errors) for every verb with errors
+        self.verb_errors = []
+
+    def __str__(self):
+        return f"Prediction report ({self.rules}): {self.verbs} verbs, {self.accuracy():.1%} accurate"
+
+    def __repr__(self):
+        return self.__str__()
+
+    def add(self, english: str, signature: str, predicted: tuple, actual: tuple):
+        """Add the predicted and actual conjugations of one verb to the report. Blank actual
+        cells have nothing to compare with, so they aren't counted anywhere."""
+        errors = compare_conjugations(predicted, actual)
+        if errors:
+            errors = {s: e for (s, e) in errors.items() if e[0]}
+        self.verbs += 1
+        for s, a in zip(slots, actual):
+            if a:
+                counts = self.slots[s]
+                counts[0] += 1
+                if s not in errors:
+                    counts[1] += 1
+        counts = self.signatures.setdefault(signature, [0, 0, 0])
+        counts[0] += 1
+        if errors:
+            counts[1] += 1
+            counts[2] += len(errors)
+            self.verb_errors.append((english, signature, errors))
+
+    def merge(self, other):
+        """Fold another report for the same rules into this one."""
+        self.verbs += other.verbs
+        self.skipped += other.skipped
+        for s, (compared, correct) in other.slots.items():
+            self.slots[s][0] += compared
+            self.slots[s][1] += correct
+        for sig, counts in other.signatures.items():
+            mine = self.signatures.setdefault(sig, [0, 0, 0])
+            for i, c in enumerate(counts):
+                mine[i] += c
+        self.verb_errors += other.verb_errors
+
+    def accuracy(self) -> float:
+        """Proportion of compared cells that were predicted correctly."""
+        compared = sum(c[0] for c in self.slots.values())
+        correct = sum(c[1] for c in self.slots.values())
+        return correct / compared if compared else 0.0
+
+    def slot_accuracy(self) -> dict:
+        """Return a dict of slot: proportion of verbs with data for that slot predicted correctly."""
+        return {s: (c[1] / c[0] if c[0] else None) for (s, c) in self.slots.items()}
+
+    def worst_offenders(self, n=10) -> list:
+        """Return the n verbs with the most errors as (english, signature, errors) tuples."""
+        return sorted(self.verb_errors, key=lambda v: len(v[2]), reverse=True)[:n]
+
+    def to_dict(self, n=10) -> dict:
+        """Return the report as a dict of plain types, n sets the number of worst offenders."""
+        return {
+            "rules": self.rules,
+            "verbs": self.verbs,
+            "skipped": self.skipped,
+            "accuracy": self.accuracy(),
+            "slots": {
+                s: {"compared": c[0], "correct": c[1], "accuracy": acc}
+                for ((s, c), acc) in zip(
+                    self.slots.items(), self.slot_accuracy().values()
+                )
+            },
+            "signatures": {
+                sig: {"verbs": c[0], "verbs_with_errors": c[1], "errors": c[2]}
+                for (sig, c) in sorted(self.signatures.items())
+            },
+            "worst_offenders": [
+                {"english": e, "signature": sig, "errors": errors}
+                for (e, sig, errors) in self.worst_offenders(n)
+            ],
+        }
+
+    def to_json(self, file, n=10) -> None:
+        """Write the report as JSON to a path or file-like object."""
+        if isinstance(file, str):
+            with open(file, "w", encoding="utf-8") as f:
+                return self.to_json(f, n)
+        json.dump(self.to_dict(n), file, ensure_ascii=False, indent=2)
+
+    def to_csv(self, file, table="slots") -> None:
+        """Write one table of the report as csv to a path or file-like object.
+        table can be 'slots', 'signatures' or 'errors'."""
+        if isinstance(file, str):
+            with open(file, "w", newline="", encoding="utf-8") as f:
+                return self.to_csv(f, table)
+        writer = csv.writer(file)
+        if table == "slots":
+            writer.writerow(["slot", "compared", "correct"])
+            writer.writerows([s] + c for (s, c) in self.slots.items())
+        elif table == "signatures":
+            writer.writerow(["signature", "verbs", "verbs_with_errors", "errors"])
+            writer.writerows([s] + c for (s, c) in sorted(self.signatures.items()))
+        elif table == "errors":
+            writer.writerow(["english", "signature", "slot", "actual", "predicted"])
+            for english, signature, errors in self.verb_errors:
+                for s, (a, p) in errors.items():
+                    writer.writerow([english, signature, s, a, p])
+        else:
+            raise ValueError(f"Unknown report table: {table}")
+
+
+def _report_rows(rules: str, rows: list) -> PredictionReport:
+    """Build a report from (english, inputs, actual conjugations) rows.
+    Module level so it can run in a worker process."""
+    _, root_func, paradigm_func = predictors[rules]
+    report = PredictionReport(rules)
+    roots = {}  # root: (predicted, signature), the rules only look at the root
+    # a rule tracer counts each verb evaluated, so roots aren't reused while tracing
+    tracing = rule_trace.active() is not None
+    for english, inputs, actual in rows:
+        root = root_func(*inputs) if all(inputs) else ""
+        if root not in roots or tracing:
+            try:
+                roots[root] = (paradigm_func(root), root_signature(root))
+            except IndexError:
+                roots[root] = None
+        if not root or roots[root] is None:
+            # missing input forms leave nothing to predict from
+            report.skipped.append(english)
+            continue
+        predicted, signature = roots[root]
+        report.add(english, signature, predicted, actual)
+    return report
+
+
+def prediction_report(verbs, rules="stanley", workers=None) -> PredictionReport:
+    """Run the chosen predictor ('stanley' or 'hansen') over a list of KovolVerbs, for example
+    from get_data_from_csv, and aggregate the errors. Large lexicons are split over a process
+    pool, workers sets its size (1 disables it). There's no pool while a rule tracer is
+    enabled, it only sees predictions made in this process."""
+    try:
+        input_attrs = predictors[rules][0]
+    except KeyError:
+        raise ValueError(f"Unknown prediction rules: {rules}")
+    rows = [
+        (
+            v.english,
+            tuple(getattr(v, a) for a in input_attrs),
+            v.get_all_conjugations(),
+        )
+        for v in verbs
+    ]
+
+    if (
+        workers == 1
+        or len(rows) < parallel_threshold
+        or rule_trace.active() is not None
+    ):
+        return _report_rows(rules, rows)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count()
+    chunk = -(-len(rows) // (workers * 4))  # ceiling division
+    chunks = [rows[i : i + chunk] for i in range(0, len(rows), chunk)]
+    report = PredictionReport(rules)
+    with ProcessPoolExecutor(workers) as pool:
+        for partial in pool.map(_report_rows, [rules] * len(chunks), chunks):
+            report.merge(partial)
+    return report
@@ -0,0 +1,183 @@
+"""Opt-in tracing of which Stanley and Hansen rule branches fire, for rule coverage and a
+profile of where prediction time goes. Tracing is off until enabled and then costs each
+prediction function a timer. While it's off each function only checks the context's tracer.
+
+    with RuleTracer() as tracer:
+        prediction_report(verbs, workers=1)
+    print(tracer.report())
+
+The tracer is held in a context variable, so tracing in one thread or asyncio task doesn't
+see predictions made in another. Predictions made in other processes aren't traced, so
+prediction_report doesn't use a process pool while tracing. It and predict_many predict
+each verb again instead of reusing a root's paradigm, so counts are per verb."""
+
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from functools import wraps
+
+# traced function: the tense its rules are named after
+traced_functions = {
+    "remote_past_tense": "remote past",
+    "recent_past_tense": "recent past",
+    "future_tense": "future",
+    "imperatives": "imperative",
+}
+_active = ContextVar("rule_tracer", default=None)  # the enabled RuleTracer
+# rules fired so far in the prediction function being traced, None when not tracing
+_fired_rules = ContextVar("fired_rules", default=None)
+
+
+def _modules() -> dict:
+    from kovol_language_tools.verbs import hansen_predicted_verb, stanley_predicted_verb
+
+    return {"stanley": stanley_predicted_verb, "hansen": hansen_predicted_verb}
+
+
+def known_rules() -> list:
+    """Return every (rules, rule) a tracer can record, including the tenses' defaults."""
+    known = []
+    for rules, module in _modules().items():
+        known += [(rules, r) for r in module.traced_rules]
+        known += [(rules, f"{t}: no special rule") for t in traced_functions.values()]
+    return known
+
+
+def fire(rule: str) -> None:
+    """Record a rule branch taken by the prediction function being traced, if there is one."""
+    fired = _fired_rules.get()
+    if fired is not None:
+        fired.append(rule)
+
+
+def traced(rules: str):
+    """Decorate one of traced_functions of a rules module, so its calls are timed and the
+    rules it fires counted while a tracer is enabled. The function records each branch it
+    takes with fire."""
+
+    def decorator(function):
+        tense = traced_functions[function.__name__]
+
+        @wraps(function)
+        def wrapper(root):
+            tracer = _active.get()
+            if tracer is None:
+                return function(root)
+            return tracer._call(rules, tense, function, root)
+
+        return wrapper
+
+    return decorator
+
+
+class RuleTracer:
+    """Counts how often each rule branch fires and the time spent in the predictions it
+    fired in. Keys are (rules, rule) pairs, e.g. ("stanley", "future: l-final root").
+    It can be enabled in several threads at once, its counts are kept under a lock."""
+
+    def __init__(self):
+        self.counts = Counter()  # (rules, rule): times fired
+        self.seconds = Counter()  # (rules, rule): seconds in calls it fired in
+        self.calls = Counter()  # (rules, tense): calls of the tense's function
+        self.call_seconds = Counter()  # (rules, tense): seconds in its function
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        return (
+            f"Rule tracer: {sum(self.calls.values())} calls, {len(self.counts)} rules"
+        )
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __enter__(self):
+        return enable(self)
+
+    def __exit__(self, *exc):
+        disable()
+
+    def _call(self, rules: str, tense: str, function, root: str):
+        fired = []
+        token = _fired_rules.set(fired)
+        start = time.perf_counter()
+        try:
+            result = function(root)
+        finally:
+            seconds = time.perf_counter() - start
+            _fired_rules.reset(token)
+        with self._lock:
+            self.calls[rules, tense] += 1
+            self.call_seconds[rules, tense] += seconds
+            for rule in fired or [f"{tense}: no special rule"]:
+                self.counts[rules, rule] += 1
+                self.seconds[rules, rule] += seconds
+        return result
+
+    def unfired(self) -> list:
+        """Return the known (rules, rule) pairs of the rules traced that haven't fired."""
+        used = {rules for (rules, _) in self.calls}
+        return [r for r in known_rules() if r[0] in used and r not in self.counts]
+
+    def to_dict(self) -> dict:
+        """The counts and times as plain types, e.g. for json."""
+        return {
+            "rules": [
+                {
+                    "rules": rules,
+                    "rule": rule,
+                    "count": n,
+                    "seconds": self.seconds[rules, rule],
+                }
+                for ((rules, rule), n) in sorted(self.counts.items())
+            ],
+            "calls": [
+                {
+                    "rules": rules,
+                    "tense": tense,
+                    "count": n,
+                    "seconds": self.call_seconds[rules, tense],
+                }
+                for ((rules, tense), n) in sorted(self.calls.items())
+            ],
+            "unfired": [
+                {"rules": rules, "rule": rule} for (rules, rule) in self.unfired()
+            ],
+        }
+
+    def report(self) -> str:
+        """Return a table of each rule with how often it fired, the share of its tense's
+        calls and the time spent in those calls, then the rules that never fired."""
+        lines = [f"{'rules':<8} {'rule':<44} {'fired':>8} {'share':>7} {'ms':>9}"]
+        for (rules, rule), n in sorted(self.counts.items()):
+            calls = self.calls[rules, rule.split(":")[0]]
+            share = n / calls if calls else 0
+            ms = self.seconds[rules, rule] * 1000
+            lines.append(f"{rules:<8} {rule:<44} {n:8} {share:7.1%} {ms:9.2f}")
+        unfired = self.unfired()
+        if unfired:
+            lines.append("Never fired:")
+            lines += [f"{rules:<8} {rule}" for (rules, rule) in unfired]
+        return "\n".join(lines)
+
+
+def active() -> RuleTracer or None:
+    """Return the tracer enabled in the current context, or None."""
+    return _active.get()
+
+
+def enable(tracer=None) -> RuleTracer:
+    """Start tracing predictions made in the current context with a tracer, a new one if
+    None, and return it."""
+    if _active.get() is not None:
+        raise RuntimeError("Rule tracing is already enabled")
+    tracer = tracer or RuleTracer()
+    _active.set(tracer)
+    return tracer
+
+
+def disable() -> RuleTracer or None:
+    """Stop tracing in the current context, returning the tracer that was enabled."""
+    tracer = _active.get()
+    _active.set(None)
+    return tracer
@@ -1,4 +1,220 @@
-from kovol_language_tools.verbs.kovol_verb import PredictedVerb
+from kovol_language_tools.verbs.kovol_verb import (
+    KovolVerb,
+    PredictedVerb,
+    last_root_character,
+    last_root_vowel,
+    root_ending,
+    root_vowels,
+    stanley_root,
+)
+from kovol_language_tools.verbs.rule_trace import active, fire, traced
+
+actors = KovolVerb.actors
+
+# Suffixes, keyed by actor
+future_suffixes = {
+    "1s": "inim",
+    "2s": "iniŋ",
+    "3s": "iŋ",
+    "1p": "ug",
+    "2p": "wa",
+    "3p": "is",
+}
+# roots ending in "l" have unique suffixes
+future_l_suffixes = {
+    "1s": "ɛnim",
+    "2s": "ɛniŋ",
+    "3s": "aŋ",
+    "1p": "olug",
+    "2p": "wa",
+    "3p": "ɛlis",
+}
+recent_past_suffixes = {
+    "1s": "gɔm",
+    "2s": "gɔŋ",
+    "3s": "ge",
+    "1p": "ɔŋg",
+    "2p": "gɔma",
+    "3p": "gɔnd",
+}
+# roots ending in "a" or "l" cause assimilation
+recent_past_a_suffixes = {
+    "1s": "gam",
+    "2s": "gɔŋ",
+    "3s": "ga",
+    "1p": "aŋg",
+    "2p": "gama",
+    "3p": "gand",
+}
+remote_past_suffixes = {
+    "1s": "ɔm",
+    "2s": "ɔŋ",
+    "3s": "ɔt",
+    "1p": "omuŋg",
+    "2p": "omwa",
+    "3p": "ɛmind",
+}
+# singular, plural
+imperative_suffixes = ("e", "as")
+imperative_g_suffixes = ("u", "as")
+# branches reported to rule_trace when tracing
+traced_rules = (
+    "remote past: u assimilation",
+    "remote past: um weak assimilation",
+    "remote past: V-final root reduces",
+    "recent past: u assimilation",
+    "recent past: i assimilation",
+    "recent past: a or l assimilation",
+    "recent past: single syllable l-final root",
+    "recent past: m→ŋ assimilation",
+    "recent past: C-final root reduces",
+    "recent past: l-final 1p reduces",
+    "future: a assimilation",
+    "future: l-final root",
+    "future: V-final root reduces",
+    "imperative: g-final root",
+    "imperative: V-final root reduces",
+)
+
+
+@traced("stanley")
+def future_tense(root: str) -> tuple:
+    """Return a tuple of future tense conjugations predicted from the root."""
+    stem = root
+    suffixes = future_suffixes
+
+    if last_root_character(root) == "a":
+        # "a" causes assimilation
+        fire("future: a assimilation")
+        suffixes = dict(suffixes)
+        for a in ("1s", "2s", "3s"):
+            suffixes[a] = "a" + suffixes[a].lstrip("i")
+
+    elif last_root_character(root) == "l":
+        # special rule, roots ending in "l" have unique suffixes and vowel replacement
+        fire("future: l-final root")
+        stem = root[:-2]
+        suffixes = future_l_suffixes
+
+    if root_ending(root) == "V":
+        # roots ending in V reduce
+        fire("future: V-final root reduces")
+        stem = root[:-1]
+
+    # no modification to 2sf
+    return tuple((root if a == "2s" else stem) + suffixes[a] for a in actors)
+
+
+@traced("stanley")
+def recent_past_tense(root: str) -> tuple:
+    """Return a tuple of recent past conjugations predicted from the root."""
+    stem = stem_1p = root
+    suffixes = recent_past_suffixes
+
+    if last_root_character(root) == "u" or root[-2:] == "um":
+        # "u" causes assimilation
+        fire("recent past: u assimilation")
+        suffixes = dict(suffixes)
+        for a in ("1s", "1p", "2p", "3p"):
+            suffixes[a] = suffixes[a].replace("ɔ", "u")
+
+    elif last_root_vowel(root) == "i":
+        # "i" causes assimilation, stretches over morpheme boundary
+        fire("recent past: i assimilation")
+        suffixes = dict(suffixes)
+        suffixes["2p"] = "gima"
+
+    elif last_root_character(root) == "a" or last_root_character(root) == "l":
+        # "a" causes assimilation
+        fire("recent past: a or l assimilation")
+        suffixes = recent_past_a_suffixes
+        if last_root_character(root) == "l" and len(root_vowels(root)) == 1:
+            # special rule, single syllable roots ending in "l" cause vowel replacement in root
+            fire("recent past: single syllable l-final root")
+            stem = root.replace("ɔ", "a")
+
+    if root_ending(root) == "C":
+        if last_root_character(root) == "m":
+            # special rule, "m" assimilates to "ŋ"
+            fire("recent past: m→ŋ assimilation")
+            stem = stem[:-1] + "ŋ"
+            stem_1p = root
+
+        else:
+            # roots ending in C reduce
+            fire("recent past: C-final root reduces")
+            stem = stem[:-1]
+            if last_root_character(root) == "l":
+                # special rule for "l", root is reduced for "-ɔŋg" use reduced root for 1p
+                fire("recent past: l-final 1p reduces")
+                stem_1p = root[:-2]
+            else:
+                # no assimilation or reduction for "-ɔŋg"  use normal root for 1p
+                stem_1p = root
+
+    return tuple((stem_1p if a == "1p" else stem) + suffixes[a] for a in actors)
+
+
+@traced("stanley")
+def remote_past_tense(root: str) -> tuple:
+    """Return a tuple of remote past conjugations predicted from the root."""
+    stem = root
+    suffixes = remote_past_suffixes
+
+    # 'u' in the root can cause assimilation
+    if last_root_character(root) == "u":
+        # if the root ends in 'u' there is assimilation
+        fire("remote past: u assimilation")
+        suffixes = {k: "u" + v[1:] for (k, v) in suffixes.items()}
+
+    elif root[-2:] == "um":
+        # if the root ends in 'uC' there is weak assimilation
+        fire("remote past: um weak assimilation")
+        suffixes = dict(suffixes)
+        for a in ("1s", "2s", "3s"):
+            suffixes[a] = "u" + suffixes[a][1:]
+
+    if root_ending(root) == "V":
+        # roots ending in V reduce
+        fire("remote past: V-final root reduces")
+        stem = root[:-1]
+
+    return tuple(stem + suffixes[a] for a in actors)
+
+
+@traced("stanley")
+def imperatives(root: str) -> tuple:
+    """Return a tuple of the singular and plural imperative predicted from the root."""
+    if root[-1] == "g":
+        # special rule, "g" has it's own suffixes
+        fire("imperative: g-final root")
+        suffixes = imperative_g_suffixes
+    else:
+        suffixes = imperative_suffixes
+
+    if root_ending(root) == "V":
+        # roots ending in V reduce
+        fire("imperative: V-final root reduces")
+        return tuple(root[0:-1] + sfx for sfx in suffixes)
+    else:
+        # roots ending in C just add suffix to root
+        return tuple(root + sfx for sfx in suffixes)
+
+
+def paradigm_from_root(root: str) -> tuple:
+    """Return the predicted paradigm of a root, in the order of get_all_conjugations."""
+    return (
+        remote_past_tense(root)
+        + recent_past_tense(root)
+        + future_tense(root)
+        + imperatives(root)
+    )
+
+
+def stanley_paradigm(remote_past_1s: str, recent_past_1s: str) -> tuple:
+    """Predict an entire paradigm from the remote past 1s and recent past 1s without
+    building a verb object. Returns a tuple in the order of get_all_conjugations."""
+    return paradigm_from_root(stanley_root(remote_past_1s, recent_past_1s))
 
 
 class StanleyPredictedVerb(PredictedVerb):
@@ -16,162 +232,33 @@ class StanleyPredictedVerb(PredictedVerb):
 
     def predict_future_tense(self) -> None:
         """Assign future tense attributes. Called during __init__"""
-        root = self.root
-        suffixes = {
-            "1s": "inim",
-            "2s": "iniŋ",
-            "3s": "iŋ",
-            "1p": "ug",
-            "2p": "wa",
-            "3p": "is",
-        }
-
-        # 1.
-        if self.get_last_root_character() == "a":
-            # "a" causes assimilation
-            for a in ("1s", "2s", "3s"):
-                suffixes[a] = "a" + suffixes[a].lstrip("i")
-
-        elif self.get_last_root_character() == "l":
-            # special rule, roots ending in "l" have unique suffixes and vowel replacement
-            root = self.root[:-2]
-            suffixes = {
-                "1s": "ɛnim",
-                "2s": "ɛniŋ",
-                "3s": "aŋ",
-                "1p": "olug",
-                "2p": "wa",
-                "3p": "ɛlis",
-            }
-
-        if self.root_ending() == "V":
-            # roots ending in V reduce
-            root = self.root[:-1]
-
-        for a in self.actors:
-            setattr(self, f"future_{a}", root + suffixes[a])
-        # no modification to 2sf
-        setattr(self, "future_2s", self.root + suffixes["2s"])
+        self.set_tense("future", future_tense(self.root))
 
     def predict_recent_past_tense(self) -> None:
         """Assign recent past tense attributes. Called during __init__."""
-        root = root_1p = self.root
-        suffixes = {
-            "1s": "gɔm",
-            "2s": "gɔŋ",
-            "3s": "ge",
-            "1p": "ɔŋg",
-            "2p": "gɔma",
-            "3p": "gɔnd",
-        }
-
-        if (
-            self.get_last_root_character() == "u"
-            or self.get_last_two_root_characters() == "um"
-        ):
-            # "u" causes assimilation
-            for a in ("1s", "1p", "2p", "3p"):
-                suffixes[a] = suffixes[a].replace("ɔ", "u")
-
-        elif self.get_last_root_vowel() == "i":
-            # "i" causes assimilation, stretches over morpheme boundary
-            suffixes["2p"] = "gima"
-
-        elif (
-            self.get_last_root_character() == "a"
-            or self.get_last_root_character() == "l"
-        ):
-            # "a" causes assimilation
-            suffixes = {
-                "1s": "gam",
-                "2s": "gɔŋ",
-                "3s": "ga",
-                "1p": "aŋg",
-                "2p": "gama",
-                "3p": "gand",
-            }
-            if self.get_last_root_character() == "l" and len(self.verb_vowels()) == 1:
-                # special rule, single syllable roots ending in "l" cause vowel replacement in root
-                root = self.root.replace("ɔ", "a")
-
-        if self.root_ending() == "C":
-            # roots ending in C reduce
-            if (
-                self.get_last_root_character() == "m"
-                and self.get_last_root_character() != "um"
-            ):
-                # special rule, "m" assimilates to "ŋ"
-                # unless root ends in "um", then it doesn't
-                root = root[:-1] + "ŋ"
-                root_1p = self.root
-
-            else:
-                # roots ending in C reduce
-                root = root[:-1]
-                if self.get_last_root_character() == "l":
-                    # special rule for "l", root is reduced for "-ɔŋg" use reduced root for 1p
-                    root_1p = self.root[:-2]
-                else:
-                    # no assimilation or reduction for "-ɔŋg"  use normal root for 1p
-                    root_1p = self.root
-
-        # Assign recent past attributes
-        for a in self.actors:
-            if a == "1p":
-                setattr(self, f"recent_past_{a}", root_1p + suffixes[a])
-            else:
-                setattr(self, f"recent_past_{a}", root + suffixes[a])
+        self.set_tense("recent_past", recent_past_tense(self.root))
 
     def predict_remote_past_tense(self) -> None:
         """Assign remote past tense attributes. Called during __init__"""
-        root = self.root
-        suffixes = {
-            "1s": "ɔm",
-            "2s": "ɔŋ",
-            "3s": "ɔt",
-            "1p": "omuŋg",
-            "2p": "omwa",
-            "3p": "ɛmind",
-        }
-
-        # 'u' in the root can cause assimilation
-        if self.get_last_root_character() == "u":
-            # if the root ends in 'u' there is assimilation
-            suffixes = {k: "u" + v[1:] for (k, v) in suffixes.items()}
-
-        elif self.get_last_two_root_characters() == "um":
-            # if the root ends in 'uC' there is weak assimilation
-            for a in ("1s", "2s", "3s"):
-                suffixes[a] = "u" + suffixes[a][1:]
-
-        if self.root_ending() == "V":
-            # roots ending in V reduce
-            root = root[:-1]
-
-        for a in self.actors:
-            setattr(self, f"remote_past_{a}", root + suffixes[a])
+        self.set_tense("remote_past", remote_past_tense(self.root))
 
     def predict_imperative(self) -> None:
-        """Assign imperative attributes. Called during __init__.
-        The two stages are:
-        1. figure out suffixes to use
-        2. add them to root."""
-        # 1.
-        if self.root[-1] == "g":
-            # special rule, "g" has it's own suffixes
-            suffixes = ["u", "as"]
-        else:
-            # standard suffixes
-            suffixes = ["e", "as"]
+        """Assign imperative attributes. Called during __init__."""
+        self.singular_imperative, self.plural_imperative = imperatives(self.root)
 
-        # 2.
-        if self.root_ending() == "V":
-            # roots ending in V reduce
-            imperatives = [self.root[0:-1] + sfx for sfx in suffixes]
-        else:
-            # roots ending in C just add suffix to root
-            imperatives = [self.root + sfx for sfx in suffixes]
 
-        # Assign imperative attributes
-        self.singular_imperative = imperatives[0]
-        self.plural_imperative = imperatives[1]
+def predict_many(inputs) -> list:
+    """Predict paradigms for an iterable of (remote_past_1s, recent_past_1s) pairs.
+    Returns a list of tuples in the order of get_all_conjugations, one per input.
+    The rules only look at the root, so inputs are grouped by root and each group is
+    predicted once."""
+    groups = {}
+    results = []
+    # a rule tracer counts each input predicted, so roots aren't reused while tracing
+    tracing = active() is not None
+    for remote_past_1s, recent_past_1s in inputs:
+        root = stanley_root(remote_past_1s, recent_past_1s)
+        if root not in groups or tracing:
+            groups[root] = paradigm_from_root(root)
+        results.append(groups[root])
+    return results
@@ -0,0 +1,131 @@
+"""Generate lexicons of any size for scale testing. Roots are built from the phonemes in facts
+and conjugated by the Stanley or Hansen rules, with optional irregular verbs and data entry
+noise so the output looks more like a real lexicon."""
+
+import csv
+import random
+
+from kovol_language_tools import facts
+from kovol_language_tools.verbs.csv_writer import (
+    create_csv,
+    header,
+    verb_to_rows,
+    write_csv,
+)
+from kovol_language_tools.verbs.kovol_verb import KovolVerb, ig_slots, slots
+from kovol_language_tools.verbs.predictors import predictors
+
+# phonemes roots are built from, the glottal stop and r are left out as they're rare in roots
+consonants = tuple(c for c in facts.phonetic_consonants if c not in ("ʔ", "r"))
+vowels = ("i", "ɛ", "u", "o", "a")
+rule_names = tuple(predictors)
+# blank: the cell is left empty, vowel: one vowel is misspelt, ig: " ig" is added to a
+# future 2s or 2p form
+noise_kinds = ("blank", "vowel", "ig")
+
+
+def random_root(rng: random.Random) -> str:
+    """Return a root of one or two CV syllables, usually with a final consonant. Two syllable
+    roots sometimes start with their vowel. CCC clusters can't occur."""
+    syllables = rng.choice((1, 1, 2))
+    root = "".join(
+        rng.choice(consonants) + rng.choice(vowels) for _ in range(syllables)
+    )
+    if syllables == 2 and rng.random() < 0.1:
+        root = root[1:]
+    if rng.random() < 0.7:
+        root += rng.choice(consonants)
+    return root
+
+
+def _paradigm(paradigms: dict, rules: str, root: str) -> tuple:
+    try:
+        return paradigms[rules, root]
+    except KeyError:
+        paradigm = paradigms[rules, root] = predictors[rules][2](root)
+        return paradigm
+
+
+def _irregular(paradigms: dict, paradigm: tuple, rules: str, root: str, rng) -> tuple:
+    """Replace one tense with the other rules' forms of the root with its last vowel changed."""
+    other = rng.choice([r for r in rule_names if r != rules] or rule_names)
+    i = max(i for (i, c) in enumerate(root) if c in vowels)
+    changed = root[:i] + rng.choice([v for v in vowels if v != root[i]]) + root[i + 1 :]
+    t = rng.randrange(len(KovolVerb.tenses)) * len(KovolVerb.actors)
+    forms = _paradigm(paradigms, other, changed)
+    return paradigm[:t] + forms[t : t + 6] + paradigm[t + 6 :]
+
+
+def _with_noise(form: str, slot: int, rng, kinds) -> str:
+    kinds = [k for k in kinds if k != "ig" or slot in ig_slots]
+    if not kinds:
+        return form
+    kind = rng.choice(kinds)
+    if kind == "blank":
+        return ""
+    elif kind == "ig":
+        return form + " ig"
+    positions = [i for (i, c) in enumerate(form) if c in facts.phonetic_vowels]
+    if not positions:
+        return form
+    i = rng.choice(positions)
+    vowel = rng.choice([v for v in facts.phonetic_vowels if v != form[i]])
+    return form[:i] + vowel + form[i + 1 :]
+
+
+def synthetic_verbs(
+    n: int,
+    seed=0,
+    rules="stanley",
+    irregularity=0.0,
+    noise=0.0,
+    short=0.0,
+    kinds=noise_kinds,
+):
+    """Yield n KovolVerbs, "to verb 0" onwards, with random roots conjugated by 'stanley' or
+    'hansen' rules, or 'mixed' to pick per verb. irregularity is the fraction of verbs with a
+    tense conjugated from a changed root by the other rules, noise the chance of each form
+    having one of kinds of mistake and short the fraction with a short form.
+    The same arguments always give the same verbs."""
+    if rules != "mixed" and rules not in predictors:
+        raise ValueError(f"Unknown prediction rules: {rules}")
+    unknown = set(kinds) - set(noise_kinds)
+    if unknown:
+        raise ValueError(f"Unknown noise kinds: {', '.join(sorted(unknown))}")
+    rng = random.Random(seed)
+    paradigms = {}  # (rules, root): paradigm, roots repeat as they do in a real lexicon
+    for i in range(n):
+        root = random_root(rng)
+        verb_rules = rng.choice(rule_names) if rules == "mixed" else rules
+        paradigm = _paradigm(paradigms, verb_rules, root)
+        if irregularity and rng.random() < irregularity:
+            paradigm = _irregular(paradigms, paradigm, verb_rules, root, rng)
+        if noise:
+            paradigm = tuple(
+                _with_noise(form, s, rng, kinds) if rng.random() < noise else form
+                for (s, form) in enumerate(paradigm)
+            )
+        verb = KovolVerb(paradigm[12], f"to verb {i}")
+        verb.__dict__.update(zip(slots, paradigm))
+        if short and rng.random() < short:
+            verb.short = root
+        yield verb
+
+
+def write_synthetic_csv(csv_file, n: int, seed=0, shuffle=False, **options) -> int:
+    """Write n synthetic_verbs to a path or file-like object in the format get_data_from_csv
+    reads, compressed if the path ends .gz, .bz2 or .xz. options are passed on to
+    synthetic_verbs. With shuffle the rows of all the verbs are mixed together, which holds
+    them all in memory. Returns the number of verbs written."""
+    if not shuffle:
+        return write_csv(synthetic_verbs(n, seed, **options), csv_file)
+    if isinstance(csv_file, str):
+        with create_csv(csv_file) as f:
+            return write_synthetic_csv(f, n, seed, shuffle, **options)
+
+    rows = [row for v in synthetic_verbs(n, seed, **options) for row in verb_to_rows(v)]
+    random.Random(seed).shuffle(rows)
+    writer = csv.writer(csv_file)
+    writer.writerow(header)
+    writer.writerows(rows)
+    return n
@@ -0,0 +1,68 @@
+import csv
+import os
+from collections import namedtuple
+from itertools import islice
+
+from kovol_language_tools.phonemics import check_phonetic_inventory
+from kovol_language_tools.verbs.csv_reader import csv_fields, open_csv
+
+# row is the line number in the csv file, the header being row 1
+ValidationIssue = namedtuple("ValidationIssue", ["row", "column", "kind", "detail"])
+
+# check_phonetic_inventory error message start: issue kind
+error_kinds = {"Unexpected character": "character", "CCC cluster": "ccc"}
+batch_size = 10000  # rows read between validating their new forms
+# batches with fewer new forms than this are validated in process
+parallel_threshold = 2000
+
+
+def check_form(form: str) -> tuple:
+    """Return a tuple of (kind, detail) for each problem check_phonetic_inventory finds in
+    a form. Module level so it can run in a worker process."""
+    issues = []
+    for error in dict.fromkeys(check_phonetic_inventory(form, hard_fail=False)):
+        kind = next((k for (e, k) in error_kinds.items() if error.startswith(e)), "")
+        issues.append((kind, error))
+    return tuple(issues)
+
+
+def validate_rows(rows, workers=None):
+    """Check the kov cell of (row number, row dict) pairs, yielding a ValidationIssue for each
+    problem found. Each unique form is only checked once, batches with many new forms are
+    checked in a process pool. workers sets its size (1 disables it)."""
+    # form: issues, there's nothing to check in a blank cell
+    checked = {None: (), "": ()}
+    pool = None
+    rows = iter(rows)
+    try:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            new = list(
+                dict.fromkeys(r["kov"] for (_, r) in batch if r["kov"] not in checked)
+            )
+            if workers != 1 and len(new) >= parallel_threshold:
+                if pool is None:
+                    from concurrent.futures import ProcessPoolExecutor
+
+                    pool = ProcessPoolExecutor(workers or os.cpu_count())
+                results = pool.map(check_form, new, chunksize=500)
+            else:
+                results = map(check_form, new)
+            checked.update(zip(new, results))
+            for n, r in batch:
+                for kind, detail in checked[r["kov"]]:
+                    yield ValidationIssue(n, "kov", kind, detail)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def validate_csv(csv_file, workers=None):
+    """Yield a ValidationIssue for every problem found in the kov cells of a csv file."""
+    with open_csv(csv_file) as file:
+        reader = csv.DictReader(file, delimiter=",", fieldnames=csv_fields)
+        next(reader, None)  # Remove header
+        # the line the row ended on, assumes no line breaks inside fields
+        yield from validate_rows(((reader.line_num, r) for r in reader), workers)
@@ -0,0 +1,243 @@
+import sqlite3
+
+from kovol_language_tools.verbs.csv_reader import iter_verbs_from_csv
+from kovol_language_tools.verbs.kovol_verb import KovolVerb, slots, stanley_root
+from kovol_language_tools.verbs.predictors import predict_paradigm
+
+schema_version = 1
+
+schema = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS verbs (
+    id INTEGER PRIMARY KEY,
+    english TEXT NOT NULL UNIQUE,
+    tpi TEXT NOT NULL DEFAULT '',
+    author TEXT NOT NULL DEFAULT '',
+    future_1s TEXT NOT NULL DEFAULT '',
+    root TEXT
+);
+CREATE INDEX IF NOT EXISTS verbs_root ON verbs (root);
+CREATE INDEX IF NOT EXISTS verbs_future_1s ON verbs (future_1s, id);
+-- source is 'attested' for data, or the rules that predicted the form
+CREATE TABLE IF NOT EXISTS forms (
+    verb_id INTEGER NOT NULL REFERENCES verbs (id) ON DELETE CASCADE,
+    source TEXT NOT NULL,
+    slot TEXT NOT NULL,
+    form TEXT NOT NULL,
+    PRIMARY KEY (verb_id, source, slot)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS forms_form ON forms (form);
+"""
+
+form_slots = slots + ("short",)
+
+
+class VerbStore:
+    """Keep a lexicon of KovolVerbs, and the predictions made from them, in an sqlite database.
+    Use ':memory:' as the path for a throwaway store."""
+
+    def __init__(self, path=":memory:", rules=("stanley", "hansen")):
+        self.path = path
+        self.rules = tuple(rules)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            # readers don't block the writer, for several users sharing a file
+            self.connection.execute("PRAGMA journal_mode = WAL")
+        with self.connection:
+            self.connection.executescript(schema)
+            self.connection.execute(
+                "INSERT OR IGNORE INTO meta VALUES ('schema_version', ?)",
+                (str(schema_version),),
+            )
+
+    def __str__(self):
+        return f"Verb store: {self.path}, {len(self)} verbs"
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM verbs").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add_verbs(self, verbs, batch_size=1000) -> int:
+        """Insert or replace verbs, keyed by English, committing in batches. Returns the count."""
+        count = 0
+        batch = []
+        for v in verbs:
+            batch.append(v)
+            if len(batch) == batch_size:
+                count += self._add_batch(batch)
+                batch = []
+        if batch:
+            count += self._add_batch(batch)
+        return count
+
+    def add_verb(self, verb: KovolVerb) -> None:
+        self._add_batch([verb])
+
+    def import_csv(self, csv_file, batch_size=1000, grouped=False) -> int:
+        """Import a csv in the format read by csv_reader.get_data_from_csv, streamed by
+        iter_verbs_from_csv so only a batch of verbs is held in memory. grouped=True skips
+        sorting the rows first, for files with each verb's rows together. Returns the
+        count."""
+        return self.add_verbs(iter_verbs_from_csv(csv_file, grouped), batch_size)
+
+    def _add_batch(self, verbs: list) -> int:
+        count = len(verbs)
+        # a repeated English replaces the verb before it, as it would added one at a time
+        verbs = list({v.english: v for v in verbs}.values())
+        rows = []
+        for v in verbs:
+            if v.remote_past_1s and v.recent_past_1s:
+                root = stanley_root(v.remote_past_1s, v.recent_past_1s)
+            else:
+                root = None
+            rows.append((v.english, v.tpi, v.author, v.future_1s, root))
+
+        with self.connection as c:
+            c.executemany(
+                """INSERT INTO verbs (english, tpi, author, future_1s, root)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (english) DO UPDATE SET tpi = excluded.tpi,
+                author = excluded.author, future_1s = excluded.future_1s,
+                root = excluded.root""",
+                rows,
+            )
+            ids = {}
+            for chunk in _chunks([v.english for v in verbs]):
+                marks = ", ".join("?" * len(chunk))
+                ids.update(
+                    c.execute(
+                        f"SELECT english, id FROM verbs WHERE english IN ({marks})",
+                        chunk,
+                    )
+                )
+            c.executemany(
+                "DELETE FROM forms WHERE verb_id = ?", [(i,) for i in ids.values()]
+            )
+            forms = []
+            for v in verbs:
+                verb_id = ids[v.english]
+                attested = v.get_all_conjugations() + (v.short,)
+                forms += [
+                    (verb_id, "attested", s, f)
+                    for (s, f) in zip(form_slots, attested)
+                    if f
+                ]
+                for rules in self.rules:
+                    predicted = predict_paradigm(v, rules)
+                    if predicted:
+                        forms += [
+                            (verb_id, rules, s, f) for (s, f) in zip(slots, predicted)
+                        ]
+            c.executemany("INSERT INTO forms VALUES (?, ?, ?, ?)", forms)
+        return count
+
+    def remove_verb(self, english: str) -> None:
+        with self.connection as c:
+            c.execute("DELETE FROM verbs WHERE english = ?", (english,))
+
+    def apply_changes(self, changes, batch_size=1000) -> None:
+        """Bring the store up to date with a ChangeSet from IncrementalLexicon.reload."""
+        with self.connection as c:
+            c.executemany(
+                "DELETE FROM verbs WHERE english = ?", [(e,) for e in changes.removed]
+            )
+        self.add_verbs(changes.added + changes.changed, batch_size)
+
+    def get_verb(self, english: str) -> KovolVerb or None:
+        """Return the verb with this English, or None."""
+        verbs = self._load("WHERE english = ?", (english,))
+        return verbs[0] if verbs else None
+
+    def get_page(self, page=0, page_size=100) -> list:
+        """Return a page of verbs sorted by future 1s, like get_data_from_csv."""
+        return self._load(
+            "ORDER BY future_1s, id LIMIT ? OFFSET ?", (page_size, page * page_size)
+        )
+
+    def iter_verbs(self, page_size=500):
+        """Yield every verb sorted by future 1s, reading a page at a time. Pages continue from
+        the last verb seen, so they stay fast deep into a large store."""
+        last = ("", -1)
+        while True:
+            page = self._load(
+                "WHERE (future_1s, id) > (?, ?) ORDER BY future_1s, id LIMIT ?",
+                (*last, page_size),
+                with_id=True,
+            )
+            if not page:
+                return
+            for verb_id, v in page:
+                yield v
+            last = (v.future_1s, verb_id)
+
+    def find_root(self, root: str) -> list:
+        """Return the verbs with this (Stanley) root."""
+        return self._load("WHERE root = ? ORDER BY future_1s, id", (root,))
+
+    def find_form(self, form: str) -> list:
+        """Return a list of (english, slot, source) for every verb that has or predicts form."""
+        return self.connection.execute(
+            """SELECT verbs.english, forms.slot, forms.source FROM forms
+            JOIN verbs ON verbs.id = forms.verb_id WHERE forms.form = ?
+            ORDER BY verbs.english, forms.source, forms.slot""",
+            (form,),
+        ).fetchall()
+
+    def get_prediction(self, english: str, rules="stanley") -> tuple or None:
+        """Return a stored prediction in the order of get_all_conjugations, or None."""
+        rows = self.connection.execute(
+            """SELECT forms.slot, forms.form FROM forms JOIN verbs ON verbs.id = forms.verb_id
+            WHERE verbs.english = ? AND forms.source = ?""",
+            (english, rules),
+        ).fetchall()
+        if not rows:
+            return None
+        cells = dict(rows)
+        return tuple(cells.get(s, "") for s in slots)
+
+    def _load(self, where: str, params: tuple, with_id=False) -> list:
+        """Build KovolVerbs from the verbs matching an sql clause, keeping the clause's order."""
+        c = self.connection
+        rows = c.execute(
+            f"SELECT id, english, tpi, author FROM verbs {where}", params
+        ).fetchall()
+        if not rows:
+            return []
+        verbs = {}
+        for verb_id, english, tpi, author in rows:
+            v = KovolVerb("", english)
+            v.tpi = tpi
+            v.author = author
+            verbs[verb_id] = v
+        for chunk in _chunks(list(verbs)):
+            marks = ", ".join("?" * len(chunk))
+            forms = c.execute(
+                f"""SELECT verb_id, slot, form FROM forms
+                WHERE source = 'attested' AND verb_id IN ({marks})""",
+                chunk,
+            )
+            for verb_id, slot, form in forms:
+                setattr(verbs[verb_id], slot, form)
+        if with_id:
+            return list(verbs.items())
+        return list(verbs.values())
+
+
+def _chunks(values: list, size=500) -> list:
+    # older sqlite builds allow at most 999 parameters in a statement
+    return [values[i : i + size] for i in range(0, len(values), size)]
@@ -9,11 +9,35 @@ HERE = pathlib.Path(__file__).parent
 # The text of the README file
 README = (HERE / "README.md").read_text()
 
+cmdclass = versioneer.get_cmdclass()
+
+
+def write_build_version(directory, version):
+    """Freeze the version into the _build_version.py of a build or sdist tree, it's read by
+    kovol_language_tools.get_version() so installed copies never need git."""
+    path = pathlib.Path(directory) / "kovol_language_tools" / "_build_version.py"
+    path.write_text(f'# Written by setup.py, do not edit\nversion = "{version}"\n')
+
+
+class build_py(cmdclass["build_py"]):
+    def run(self):
+        super().run()
+        write_build_version(self.build_lib, self.distribution.get_version())
+
+
+class sdist(cmdclass["sdist"]):
+    def make_release_tree(self, base_dir, files):
+        super().make_release_tree(base_dir, files)
+        write_build_version(base_dir, self.distribution.get_version())
+
+
+cmdclass.update(build_py=build_py, sdist=sdist)
+
 # This call to setup() does all the work
 setup(
     name="kovol_language_tools",
     version=versioneer.get_version(),
-    cmdclass=versioneer.get_cmdclass(),
+    cmdclass=cmdclass,
     description="Classes and functions for manipulating data in the Kovol langauge of Papua New Guinea.",
     long_description=README,
     long_description_content_type="text/markdown",
@@ -26,7 +50,8 @@ setup(
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.9",
     ],
-    packages=["kovol_language_tools"],
+    packages=["kovol_language_tools", "kovol_language_tools.verbs"],
     include_package_data=True,
     install_requires=["tabulate", "versioneer"],
+    entry_points={"console_scripts": ["kovol=kovol_language_tools.cli:main"]},
 )
@@ -0,0 +1,76 @@
+import random
+
+from kovol_language_tools.verbs.analyser import (
+    Parse,
+    SuffixTrie,
+    analyse,
+    predictor_modules,
+    slot_parses,
+)
+from kovol_language_tools.verbs.hansen_predicted_verb import HansenPredictedVerb as HV
+from kovol_language_tools.verbs.stanley_predicted_verb import StanleyPredictedVerb as SV
+from kovol_language_tools.verbs.synthetic import random_root
+
+
+def test_suffix_trie():
+    trie = SuffixTrie()
+    trie.setdefault("ɔm", []).append("remote")
+    trie.setdefault("gɔm", []).append("recent")
+    assert len(trie) == 2
+    assert list(trie.matches("pigɔm")) == [(2, ["remote"]), (3, ["recent"])]
+    assert list(trie.matches("pigis")) == []
+
+
+def test_analyse():
+    assert Parse("pig", "recent_past", "1s", "stanley") in analyse("pigɔm")
+    assert Parse("pig", "future", "3p", "hansen") in analyse("pigis")
+    # Hansen changes the root vowel
+    assert Parse("tɛl", "remote_past", "1s", "hansen") in analyse("tolom")
+    assert analyse("xyz") == ()
+    # a vowel before the u of a uɛl root doesn't change
+    assert Parse("dɛsuŋɛl", "recent_past", "1p", "hansen") in analyse("dɛsuŋaŋg")
+    assert not [p for p in analyse("dasuŋaŋg") if p.root == "dɛsuŋɛl"]
+    # the Hansen rules can't conjugate the root m
+    for form in ("mis", "minim", "ŋge"):
+        assert not [p for p in analyse(form) if p.rules == "hansen" and p.root == "m"]
+
+
+def test_analysed_parses_regenerate():
+    for form in ("aŋgɔm", "tagam", "pigwas"):
+        for p in analyse(form):
+            if p.rules == "stanley":
+                v = SV(p.root + "ɔm", p.root + "gɔm")
+            else:
+                v = HV(p.root + "is")
+            assert v.root == p.root
+            if p.tense == "imperative":
+                slot = "singular_imperative" if p.actor == "2s" else "plural_imperative"
+            else:
+                slot = f"{p.tense}_{p.actor}"
+            assert getattr(v, slot) == form
+
+
+def _regenerate(p: Parse) -> str:
+    paradigm = predictor_modules[p.rules].paradigm_from_root(p.root)
+    return paradigm[slot_parses.index((p.tense, p.actor))]
+
+
+def test_analyse_random_roots():
+    # every form of a root's paradigm is analysed back to the root, and only to parses the
+    # predictors agree with. Longer roots are only checked for the second, a root that had
+    # some of its vowels changed and not others isn't always found
+    rng = random.Random(0)
+    roots = [(random_root(rng), True) for _ in range(100)]
+    roots += [(random_root(rng) + random_root(rng), False) for _ in range(100)]
+    for root, complete in roots:
+        for rules, module in predictor_modules.items():
+            try:
+                paradigm = module.paradigm_from_root(root)
+            except IndexError:
+                continue
+            for slot, form in enumerate(paradigm):
+                parses = analyse(form)
+                if complete:
+                    assert Parse(root, *slot_parses[slot], rules) in parses
+                for p in parses:
+                    assert _regenerate(p) == form
@@ -0,0 +1,38 @@
+import json
+
+from benchmarks import harness
+
+
+def test_run_scenario():
+    scenario = harness.Scenario(50, "hansen", "plain", {"noise": 0.05})
+    result = harness.run_scenario("tiny", scenario, warmup=0, repeat=1)
+    assert list(result["stages"]) == list(harness.stages)
+    assert all(r["seconds"] > 0 and r["peak_bytes"] > 0 for r in result["stages"].values())
+    assert result["peak_bytes"] == max(r["peak_bytes"] for r in result["stages"].values())
+
+
+def test_compare():
+    def result(seconds, peak):
+        return {"stages": {"ingest": {"seconds": seconds, "peak_bytes": peak}}}
+
+    baseline = {"a": result(1.0, 100), "b": result(1.0, 100)}
+    results = {"a": result(1.2, 105), "b": result(1.5, 120), "c": result(9.0, 900)}
+    assert harness.compare(results, baseline) == [
+        ("b", "ingest", "seconds", 1.0, 1.5, 1.5),
+        ("b", "ingest", "peak_bytes", 100, 120, 1.2),
+    ]
+    assert harness.compare(results, baseline, time_limit=0.6, memory_limit=0.3) == []
+
+
+def test_main_fails_on_regression(tmp_path, monkeypatch):
+    monkeypatch.setitem(harness.scenarios, "small", harness.Scenario(50, "stanley", "rst", {}))
+    path = str(tmp_path / "baseline.json")
+    args = ["--scenario", "small", "--warmup", "0", "--repeat", "1"]
+    assert harness.main(args + ["--save", path]) == 0
+    with open(path, encoding="utf-8") as f:
+        saved = json.load(f)
+    for stage in saved["scenarios"]["small"]["stages"].values():
+        stage["seconds"] /= 100
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(saved, f)
+    assert harness.main(args + ["--baseline", path]) == 1
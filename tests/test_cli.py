@@ -0,0 +1,55 @@
+import io
+import json
+
+from kovol_language_tools.cli import main, map_batches
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+
+test_csv = "tests/test_data.csv"
+
+
+def test_map_batches():
+    items = range(10)
+    for workers in (1, 2):
+        batches = list(map_batches(sum, items, workers=workers, size=3))
+        assert batches == [3, 12, 21, 9]
+
+
+def test_convert(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("pigɔm\npigɔx\n"))
+    assert main(["convert"]) == 1
+    out, err = capsys.readouterr()
+    assert out == "pigom\npigox\n"
+    assert "pigɔx" in err
+
+
+def test_predict(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("pigis\n"))
+    assert main(["predict", "--rules", "hansen", "--header"]) == 0
+    header, row = capsys.readouterr()[0].splitlines()
+    assert header.split("\t")[:3] == ["future_3p", "root", "remote_past_1s"]
+    assert row.split("\t")[:2] == ["pigis", "pig"]
+    assert len(row.split("\t")) == 22
+
+
+def test_validate_evaluate_render(capsys):
+    assert main(["validate", test_csv]) == 0
+    assert capsys.readouterr()[0].strip() == "file,row,column,kind,detail"
+    assert main(["evaluate", test_csv, "--format", "json"]) == 0
+    assert json.loads(capsys.readouterr()[0])["verbs"] == 3
+    assert main(["render", test_csv, "--format", "html"]) == 0
+    assert capsys.readouterr()[0].count("<table>") == 3
+
+
+def test_generate(tmp_path, capsys):
+    path = str(tmp_path / "lexicon.csv")
+    assert main(["generate", "20", "-o", path, "--rules", "hansen", "--shuffle"]) == 0
+    assert len(get_data_from_csv(path)) == 20
+    assert main(["generate", "2"]) == 0
+    assert len(capsys.readouterr()[0].splitlines()) == 41
+
+
+def test_evaluate_trace(capsys):
+    assert main(["evaluate", test_csv, "--trace"]) == 0
+    err = capsys.readouterr()[1]
+    assert "stanley  future: l-final root" in err
+    assert "Never fired:" in err
@@ -0,0 +1,31 @@
+import io
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.csv_writer import write_csv
+from kovol_language_tools.verbs.stanley_predicted_verb import StanleyPredictedVerb as SV
+
+test_csv = "tests/test_data.csv"
+
+
+def test_write_csv_round_trip(tmp_path):
+    verbs = get_data_from_csv(test_csv)
+    verbs[0].short = "pigi"
+    for name in ("lexicon.csv", "lexicon.csv.gz"):
+        path = str(tmp_path / name)
+        assert write_csv(verbs, path) == 3
+        assert [vars(v) for v in get_data_from_csv(path)] == [vars(v) for v in verbs]
+
+
+def test_write_csv_predicted_verbs(tmp_path):
+    predicted = [SV("pigɔm", "pigɔm", "to put"), SV("tɔlɔm", "tɔlagɔm", "to throw")]
+    f = io.StringIO()
+    write_csv(iter(predicted), f)
+    assert f.getvalue().splitlines()[1] == "1s,remote past,,pigɔm,to put,"
+
+    path = tmp_path / "predicted.csv"
+    path.write_text(f.getvalue(), encoding="utf-8")
+    verbs = get_data_from_csv(str(path))
+    expected = sorted(predicted, key=lambda v: v.future_1s)
+    assert [v.get_all_conjugations() for v in verbs] == [
+        p.get_all_conjugations() for p in expected
+    ]
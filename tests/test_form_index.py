@@ -0,0 +1,57 @@
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.form_index import FormEntry, FormIndex
+from kovol_language_tools.verbs.kovol_verb import KovolVerb
+
+test_csv = "tests/test_data.csv"
+
+
+def test_form_index_lookup():
+    verbs = get_data_from_csv(test_csv)
+    index = FormIndex(verbs)
+    v = verbs[0]
+    assert FormEntry(v, "remote_past_1s", "attested") in index.lookup("pigɔm")
+    assert FormEntry(v, "recent_past_1s", "attested") in index.lookup("pigɔm")
+    assert index.lookup("not a verb") == []
+    # " ig" variants can be found with and without it
+    assert index.lookup("piginiŋ ig") == index.lookup("piginiŋ")
+    # predictions that differ from the data are indexed too
+    assert FormEntry(v, "remote_past_1s", "hansen") in index.lookup("pigom")
+
+
+def test_form_index_short_form():
+    v = KovolVerb("asinim", "to jab")
+    v.short = "asɛ"
+    index = FormIndex([v], rules=())
+    assert index.lookup("asɛ") == [FormEntry(v, "short", "attested")]
+    assert index.lookup("asinim") == [FormEntry(v, "future_1s", "attested")]
+
+
+def test_form_index_update():
+    verbs = get_data_from_csv(test_csv)
+    index = FormIndex(verbs, rules=())
+    v = verbs[0]
+    v.remote_past_1s = "pigɔmɔm"
+    index.update(v)
+    assert index.lookup("pigɔmɔm") == [FormEntry(v, "remote_past_1s", "attested")]
+    assert index.lookup("pigɔm") == [FormEntry(v, "recent_past_1s", "attested")]
+    index.remove(v)
+    assert "pigɔmɔm" not in index
+    assert len(index.verbs()) == len(verbs) - 1
+
+
+def test_form_index_update_english():
+    verbs = get_data_from_csv(test_csv)
+    index = FormIndex(verbs, rules=())
+    v = verbs[0]
+    v.english = "to place"
+    index.update(v)
+    assert [x.english for x in index.verbs()].count("to place") == 1
+    assert "to put" not in [x.english for x in index.verbs()]
+    assert index.lookup("pigɔm")[0].verb is v
+    # removed verbs' positions are reused rather than left empty
+    for _ in range(10):
+        index.update(v)
+        index.remove(v)
+        index.add(v)
+    assert len(index._verbs) == len(verbs)
+    assert len(index.verbs()) == len(verbs)
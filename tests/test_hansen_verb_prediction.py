@@ -1,5 +1,5 @@
 from kovol_language_tools.verbs.csv_reader import get_data_from_csv
-from kovol_language_tools.verbs.hansen_predicted_verb import HansenPredictedVerb as HV
+from kovol_language_tools.verbs.hansen_predicted_verb import HansenPredictedVerb as HV, predict_many, hansen_paradigm
 test_csv = "tests/test_data.csv"
 
 def verb1():
@@ -38,3 +38,16 @@ def test_hansen_verb_errors():
     # always gonna be wrong compared to this test data
     assert hv.get_prediction_errors(v) == {'remote_past_1s': ('pigɔm', 'pigom'), 'remote_past_2s': ('pigɔŋ', 'pigoŋ'), 'remote_past_3s': ('pigɔt', 'pigot'), 'recent_past_1s': ('pigɔm', 'pigom'), 'recent_past_2s': ('pigɔŋ', 'pigoŋ'), 'recent_past_1p': ('pigɔŋg', 'pigoŋg'), 'recent_past_3p': ('pigɔnd', 'pigond'), 'plural_imperative': ('pigas', 'pigwas')}
     
+
+def test_hansen_predict_many():
+    inputs = ["pigis", "tɛlis", "asis", "pigis"]
+    predictions = predict_many(inputs)
+    assert len(predictions) == 4
+    for f, p in zip(inputs, predictions):
+        assert p == HV(f).get_all_conjugations()
+
+def test_hansen_paradigm():
+    paradigm = hansen_paradigm("tɛlis")
+    assert type(paradigm) == tuple
+    assert len(paradigm) == 20
+    assert paradigm == HV("tɛlis").get_all_conjugations()
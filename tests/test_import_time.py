@@ -0,0 +1,85 @@
+# Import time budget, so short lived scripts don't pay for what they don't use
+import pathlib
+import runpy
+import subprocess
+import sys
+import types
+
+import kovol_language_tools
+
+# microseconds, generous for slow machines. Importing tabulate and running git on import
+# used to take around 40 ms
+import_budget = 25000
+# modules that should only load when they're used
+lazy_modules = ("tabulate", "subprocess", "multiprocessing", "kovol_language_tools._version")
+
+
+# the checkout the package is imported from, so the tests don't depend on the current directory
+root = pathlib.Path(kovol_language_tools.__file__).parents[1]
+
+
+def import_profile(module: str) -> tuple:
+    """Import a module in a fresh interpreter, returning the cumulative microseconds
+    python -X importtime gives it and the names of every module imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=root,
+    )
+    times = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times[module], set(times)
+
+
+def test_import_budget():
+    best = min(import_profile("kovol_language_tools.verbs.kovol_verb")[0] for _ in range(3))
+    assert best < import_budget
+
+
+def test_lazy_imports():
+    for module in (
+        "kovol_language_tools.verbs.kovol_verb",
+        "kovol_language_tools.verbs.csv_reader",
+        "kovol_language_tools.verbs.report",
+    ):
+        imported = import_profile(module)[1]
+        assert not imported.intersection(lazy_modules), module
+
+
+def test_version(monkeypatch):
+    frozen = types.ModuleType("kovol_language_tools._build_version")
+    frozen.version = "1.2.3"
+    monkeypatch.setitem(sys.modules, frozen.__name__, frozen)
+    assert kovol_language_tools.get_version() == "1.2.3"
+    # a checkout that was never built doesn't ask git unless told to
+    monkeypatch.setitem(sys.modules, frozen.__name__, None)
+    assert kovol_language_tools.get_version() == "0+unknown"
+
+
+def test_built_version_is_static(tmp_path):
+    # setup.py's build_py freezes the version into the built _build_version.py, so reading
+    # it in an installed copy doesn't ask git
+    subprocess.run(
+        [sys.executable, str(root / "setup.py"), "-q", "build_py", "--build-lib", str(tmp_path)],
+        capture_output=True,
+        check=True,
+        cwd=root,
+    )
+    frozen = runpy.run_path(str(tmp_path / "kovol_language_tools" / "_build_version.py"))
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, kovol_language_tools as k;"
+            "print(k.__version__, 'subprocess' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tmp_path,
+    )
+    assert result.stdout.split() == [frozen["version"], "False"]
@@ -0,0 +1,52 @@
+import shutil
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.form_index import FormIndex
+from kovol_language_tools.verbs.incremental import ChangeSet, IncrementalLexicon
+from kovol_language_tools.verbs.verb_store import VerbStore
+
+test_csv = "tests/test_data.csv"
+
+
+def test_incremental_lexicon_load():
+    lexicon = IncrementalLexicon(test_csv)
+    expected = get_data_from_csv(test_csv)
+    assert [vars(v) for v in lexicon.verbs()] == [vars(v) for v in expected]
+    assert lexicon.reload() == ChangeSet([], [], [])
+    assert lexicon.prediction("to put", "stanley")[0] == "pigɔm"
+
+
+def test_incremental_lexicon_reload(tmp_path):
+    csv_file = str(tmp_path / "lexicon.csv")
+    shutil.copy(test_csv, csv_file)
+    lexicon = IncrementalLexicon(csv_file)
+    index = FormIndex(lexicon.verbs())
+    store = VerbStore()
+    store.add_verbs(lexicon.verbs())
+    unchanged = lexicon.get_verb("to get")
+
+    with open(csv_file, encoding="utf-8") as f:
+        rows = f.read().splitlines()
+    rows = [r for r in rows if not r.endswith(",to throw")]  # remove a verb
+    rows = [r.replace("pigɔm", "pigɔmɔm") for r in rows]  # change a verb
+    rows.append("1s,future,,sɛlinim,to sell")  # add a verb
+    with open(csv_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(rows))
+
+    changes = lexicon.reload(force=True)
+    assert [v.english for v in changes.added] == ["to sell"]
+    assert [v.english for v in changes.changed] == ["to put"]
+    assert changes.removed == ["to throw"]
+    assert lexicon.get_verb("to get") is unchanged
+    assert [vars(v) for v in lexicon.verbs()] == [
+        vars(v) for v in get_data_from_csv(csv_file)
+    ]
+
+    index.apply_changes(changes)
+    assert [e.verb.english for e in index.lookup("sɛlinim")] == ["to sell"]
+    assert index.lookup("pigɔmɔm")[0].verb is lexicon.get_verb("to put")
+    assert not any(e.verb.english == "to throw" for e in index.lookup("tɔlɔm"))
+    store.apply_changes(changes)
+    assert store.get_verb("to throw") is None
+    assert store.get_verb("to sell").future_1s == "sɛlinim"
+    assert len(store) == len(lexicon)
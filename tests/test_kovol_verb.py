@@ -1,7 +1,13 @@
 # tests for csv reader, KovolVerb and PredictedVerb
 
-from kovol_language_tools.verbs.kovol_verb import KovolVerb as KV
-from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.kovol_verb import KovolVerb as KV, mismatch_matrix, slots
+from kovol_language_tools.verbs.stanley_predicted_verb import StanleyPredictedVerb as SV
+from kovol_language_tools.verbs import csv_reader
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv, iter_verbs_from_csv
+import bz2
+import gzip
+import lzma
+import pytest
 test_csv = "tests/test_data.csv"
 
 def test_get_data_from_csv():
@@ -16,6 +22,68 @@ def test_get_data_from_csv():
 def test_get_data_as_list():
     data = get_data_from_csv(test_csv, format="list")
     assert type(data[0]) == list
+    assert len(data) == 3
+    assert sum(len(d) for d in data) == 58
+    for d in data:
+        assert len(set(r["eng"] for r in d)) == 1
+
+
+def test_iter_verbs_from_csv(tmp_path):
+    expected = {v.english: vars(v) for v in get_data_from_csv(test_csv)}
+    verbs = list(iter_verbs_from_csv(test_csv))
+    assert {v.english: vars(v) for v in verbs} == expected
+
+    # interleave the verbs, keeping each verb's rows in order
+    with open(test_csv, encoding="utf-8") as f:
+        header, *rows = f.read().splitlines()
+    groups = {}
+    for r in rows:
+        groups.setdefault(r.split(",")[4], []).append(r)
+    interleaved = []
+    while any(groups.values()):
+        interleaved += [g.pop(0) for g in groups.values() if g]
+    ungrouped = tmp_path / "ungrouped.csv"
+    ungrouped.write_text("\n".join([header] + interleaved), encoding="utf-8")
+
+    verbs = list(iter_verbs_from_csv(str(ungrouped), grouped=False, run_size=10))
+    assert [v.english for v in verbs] == sorted(expected)
+    assert {v.english: vars(v) for v in verbs} == expected
+    # a verb's rows turning up again is found while streaming, not by reading ahead
+    streamed = iter_verbs_from_csv(str(ungrouped))
+    assert next(streamed).english == interleaved[0].split(",")[4]
+    with pytest.raises(ValueError):
+        list(streamed)
+
+    # blank lines don't make a grouped file look ungrouped, its verbs come in file order
+    blank_lines = tmp_path / "blank_lines.csv"
+    blank_lines.write_text("\n\n".join([header] + rows), encoding="utf-8")
+    verbs = list(iter_verbs_from_csv(str(blank_lines)))
+    assert [v.english for v in verbs] == list(dict.fromkeys(r.split(",")[4] for r in rows))
+    assert {v.english: vars(v) for v in verbs} == expected
+
+
+def test_get_data_from_csv_parallel(monkeypatch):
+    monkeypatch.setattr(csv_reader, "parallel_csv_bytes", 0)
+    # 8 chunks, so the verbs are split across chunks
+    verbs = csv_reader.get_data_from_csv_parallel(test_csv, workers=2)
+    assert [vars(v) for v in verbs] == [vars(v) for v in get_data_from_csv(test_csv)]
+
+
+@pytest.mark.parametrize("module", [gzip, bz2, lzma])
+def test_compressed_csv(tmp_path, monkeypatch, module):
+    compressed = str(tmp_path / "lexicon.csv.archive")  # detected without the extension
+    with open(test_csv, "rb") as f, module.open(compressed, "wb") as out:
+        out.write(f.read())
+    assert csv_reader.compression(compressed) == module.__name__
+    assert csv_reader.compression(test_csv) is None
+
+    expected = [vars(v) for v in get_data_from_csv(test_csv)]
+    assert [vars(v) for v in get_data_from_csv(compressed)] == expected
+    streamed = {v.english: vars(v) for v in iter_verbs_from_csv(compressed)}
+    assert streamed == {v["english"]: v for v in expected}
+    monkeypatch.setattr(csv_reader, "parallel_csv_bytes", 0)
+    verbs = csv_reader.get_data_from_csv_parallel(compressed, workers=2)
+    assert [vars(v) for v in verbs] == expected
 
 
 ###
@@ -149,3 +217,22 @@ def test_get_future_tense():
         "pigis",
     )
 
+
+
+def test_mismatch_matrix():
+    v3 = init_verb3()
+    p = SV(v3.remote_past_1s, v3.recent_past_1s)
+    v1 = init_verb1()
+    pairs = [
+        (p.get_all_conjugations(), v3.get_all_conjugations()),
+        (p.get_all_conjugations(), v1.get_all_conjugations()),
+    ]
+    matrix = mismatch_matrix(pairs)
+    assert len(matrix) == 2 * len(slots)
+    assert not any(matrix[: len(slots)])  # " ig" entries are ignored
+    errors = p.get_prediction_errors(v1)
+    assert [s for s, m in zip(slots, matrix[len(slots) :]) if m] == list(errors)
+    # a preallocated matrix is overwritten
+    out = bytearray(b"\x01" * len(matrix))
+    assert mismatch_matrix(pairs, out=out) is out
+    assert out == matrix
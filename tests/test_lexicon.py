@@ -0,0 +1,46 @@
+import pytest
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.lexicon import load_lexicon
+
+test_csv = "tests/test_data.csv"
+
+
+def write_lexicons(tmp_path):
+    """Split the test data between two authors, both with "to put" and one form differing."""
+    with open(test_csv, encoding="utf-8") as f:
+        header, *rows = f.read().splitlines()
+    ann = [r for r in rows if not r.endswith(",to throw")]
+    bob = [r for r in rows if r.endswith(",to throw") or r.endswith(",to put")]
+    bob = [r.replace("1s,remote past,,pigɔm", "1s,remote past,,pigom") for r in bob]
+    bob.append("2s,future,imperative,,to put")  # a blank cell doesn't override
+    paths = []
+    for name, lines in (("ann", ann), ("bob", bob)):
+        path = tmp_path / f"{name}.csv"
+        path.write_text("\n".join([header] + lines), encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def test_load_lexicon(tmp_path):
+    ann, bob = write_lexicons(tmp_path)
+    lexicon = load_lexicon([ann, bob, ann])
+    expected = get_data_from_csv(test_csv)
+    assert [v.english for v in lexicon.verbs] == [v.english for v in expected]
+    put = [v for v in lexicon.verbs if v.english == "to put"][0]
+    assert put.remote_past_1s == "pigɔm"
+    assert put.singular_imperative
+    assert put.author == "ann"  # none of bob's forms were kept
+    assert lexicon.provenance["to put"]["remote_past_1s"] == "ann"
+    assert set(lexicon.provenance["to throw"].values()) == {"bob"}
+
+    last = load_lexicon([ann, bob], conflict="last", authors={bob: "Bob"}, workers=1)
+    assert last.provenance["to put"]["remote_past_1s"] == "Bob"
+    assert [v.remote_past_1s for v in last.verbs if v.english == "to put"] == ["pigom"]
+    assert last.provenance["to put"]["remote_past_2s"] == "ann"
+    assert [v.author for v in last.verbs if v.english == "to put"] == ["ann, Bob"]
+
+    with pytest.raises(ValueError):
+        load_lexicon([ann, bob], conflict="error")
+    with pytest.raises(ValueError):
+        load_lexicon([ann, bob], conflict="newest")
@@ -0,0 +1,53 @@
+import os
+import shutil
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.lexicon_cache import get_cached_data_from_csv, load_cache
+
+test_csv = "tests/test_data.csv"
+
+
+def copy_csv(tmp_path):
+    csv_file = str(tmp_path / "data.csv")
+    shutil.copy(test_csv, csv_file)
+    return csv_file
+
+
+def test_cache_matches_csv(tmp_path):
+    csv_file = copy_csv(tmp_path)
+    expected = [vars(v) for v in get_data_from_csv(csv_file)]
+    assert [vars(v) for v in get_cached_data_from_csv(csv_file)] == expected
+    assert os.path.exists(csv_file + ".cache")
+    assert [vars(v) for v in load_cache(csv_file + ".cache", csv_file)] == expected
+
+
+def test_cache_rebuilt_on_change(tmp_path):
+    csv_file = copy_csv(tmp_path)
+    get_cached_data_from_csv(csv_file)
+    # a new mtime alone keeps the cache
+    os.utime(csv_file, ns=(0, 0))
+    assert load_cache(csv_file + ".cache", csv_file) is not None
+    with open(csv_file, "a", encoding="utf-8") as f:
+        f.write("\n1s,remote past,,asɔm,to jab\n")
+    assert load_cache(csv_file + ".cache", csv_file) is None
+    verbs = get_cached_data_from_csv(csv_file)
+    assert "to jab" in [v.english for v in verbs]
+    assert load_cache(csv_file + ".cache", csv_file) is not None
+
+
+def test_cache_not_saved_if_csv_changes_while_parsing(tmp_path, monkeypatch):
+    csv_file = copy_csv(tmp_path)
+
+    def parse_then_edit(path):
+        verbs = get_data_from_csv(path)
+        with open(csv_file, "a", encoding="utf-8") as f:
+            f.write("\n1s,remote past,,asɔm,to jab\n")
+        return verbs
+
+    monkeypatch.setattr(
+        "kovol_language_tools.verbs.lexicon_cache.get_data_from_csv", parse_then_edit
+    )
+    assert "to jab" not in [v.english for v in get_cached_data_from_csv(csv_file)]
+    assert load_cache(csv_file + ".cache", csv_file) is None
+    monkeypatch.undo()
+    assert "to jab" in [v.english for v in get_cached_data_from_csv(csv_file)]
@@ -0,0 +1,40 @@
+import contextlib
+import io
+
+import pytest
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.render import render_paradigms
+
+test_csv = "tests/test_data.csv"
+
+
+def test_render_matches_print_paradigm():
+    verbs = get_data_from_csv(test_csv)
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        for v in verbs:
+            v.print_paradigm()
+    f = io.StringIO()
+    assert render_paradigms(verbs, f, uniform=False) == 3
+    assert f.getvalue() == printed.getvalue()
+
+
+def test_render_formats(tmp_path):
+    verbs = get_data_from_csv(test_csv)
+    markers = {"rst": "====", "markdown": "| 1s", "html": "<td>pigɔm", "plain": "1s  pigɔm"}
+    for format, marker in markers.items():
+        path = str(tmp_path / f"book.{format}")
+        render_paradigms(verbs, path, format)
+        with open(path, encoding="utf-8") as f:
+            assert marker in f.read()
+
+    f = io.StringIO()
+    render_paradigms(verbs, f, "markdown")
+    lines = f.getvalue().splitlines()
+    assert lines[0] == '### piginim, "to put"'
+    # uniform widths line up every table in the book
+    rules = set(l for l in lines if l.startswith("|-"))
+    assert len(rules) == 1
+    with pytest.raises(ValueError):
+        render_paradigms(verbs, f, "latex")
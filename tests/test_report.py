@@ -0,0 +1,60 @@
+import csv
+import io
+import json
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.kovol_verb import KovolVerb
+from kovol_language_tools.verbs.report import prediction_report
+from kovol_language_tools.verbs.stanley_predicted_verb import StanleyPredictedVerb as SV
+
+test_csv = "tests/test_data.csv"
+
+
+def test_prediction_report():
+    verbs = get_data_from_csv(test_csv)
+    report = prediction_report(verbs)
+    assert report.verbs == 3
+    # the first verb is predicted perfectly
+    assert verbs[0].english not in [e for e, _, _ in report.verb_errors]
+    english, _, errors = report.worst_offenders(1)[0]
+    v = [v for v in verbs if v.english == english][0]
+    p = SV(v.remote_past_1s, v.recent_past_1s)
+    assert errors == p.get_prediction_errors(v)
+    assert sum(c[0] for c in report.signatures.values()) == 3
+
+
+def test_prediction_report_skips_missing_input():
+    report = prediction_report([KovolVerb("piginim", "to put")], rules="hansen")
+    assert report.verbs == 0
+    assert report.skipped == ["to put"]
+
+
+def test_prediction_report_blank_cells():
+    verbs = get_data_from_csv(test_csv)
+    v = verbs[0]  # predicted perfectly
+    v.future_1s = ""
+    report = prediction_report([v])
+    assert report.slots["future_1s"] == [0, 0]
+    assert report.verb_errors == []
+    assert list(report.signatures.values()) == [[1, 0, 0]]
+
+
+def test_prediction_report_parallel_matches_serial():
+    verbs = get_data_from_csv(test_csv) * 2000
+    serial = prediction_report(verbs, rules="hansen", workers=1)
+    parallel = prediction_report(verbs, rules="hansen", workers=2)
+    assert serial.to_dict() == parallel.to_dict()
+
+
+def test_prediction_report_export():
+    report = prediction_report(get_data_from_csv(test_csv))
+    data = json.loads(json.dumps(report.to_dict()))
+    assert data["verbs"] == 3
+    f = io.StringIO()
+    report.to_json(f)
+    assert json.loads(f.getvalue()) == data
+    f = io.StringIO()
+    report.to_csv(f, table="errors")
+    rows = list(csv.reader(io.StringIO(f.getvalue())))
+    assert rows[0] == ["english", "signature", "slot", "actual", "predicted"]
+    assert len(rows) - 1 == sum(len(e) for _, _, e in report.verb_errors)
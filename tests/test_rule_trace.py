@@ -0,0 +1,93 @@
+import random
+import threading
+
+import pytest
+
+from kovol_language_tools.verbs import hansen_predicted_verb, stanley_predicted_verb
+from kovol_language_tools.verbs import report, rule_trace
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.report import prediction_report
+from kovol_language_tools.verbs.rule_trace import RuleTracer
+from kovol_language_tools.verbs.stanley_predicted_verb import StanleyPredictedVerb as SV
+from kovol_language_tools.verbs.synthetic import random_root
+
+test_csv = "tests/test_data.csv"
+modules = (stanley_predicted_verb, hansen_predicted_verb)
+
+
+def test_tracer_covers_every_rule():
+    rng = random.Random(0)
+    roots = [random_root(rng) for _ in range(3000)]
+    expected = [[m.paradigm_from_root(r) for r in roots] for m in modules]
+    with RuleTracer() as tracer:
+        assert [[m.paradigm_from_root(r) for r in roots] for m in modules] == expected
+    assert tracer.unfired() == []
+    assert set(tracer.counts) == set(rule_trace.known_rules())
+    assert tracer.calls["stanley", "future"] == 3000
+    assert tracer.call_seconds["hansen", "recent past"] > 0
+    assert "stanley  recent past: m→ŋ assimilation" in tracer.report()
+
+
+def test_tracer_counts_branches():
+    with RuleTracer() as tracer:
+        SV("pigɔm", "pigɔm")
+        stanley_predicted_verb.paradigm_from_root("tɔl")
+    assert tracer.counts["stanley", "imperative: g-final root"] == 1
+    assert tracer.counts["stanley", "future: l-final root"] == 1
+    assert tracer.counts["stanley", "recent past: single syllable l-final root"] == 1
+    assert tracer.counts["stanley", "remote past: no special rule"] == 2
+    assert ("hansen", "future: ɛl root") not in tracer.unfired()
+    assert {r["rule"] for r in tracer.to_dict()["rules"]} >= {"future: l-final root"}
+
+
+def test_enable_disable():
+    functions = [vars(m).copy() for m in modules]
+    tracer = rule_trace.enable()
+    with pytest.raises(RuntimeError):
+        rule_trace.enable()
+    assert rule_trace.active() is tracer
+    assert rule_trace.disable() is tracer
+    assert rule_trace.active() is None
+    for m, before in zip(modules, functions):
+        for name in rule_trace.traced_functions:
+            assert getattr(m, name) is before[name]
+    SV("pigɔm", "pigɔm")
+    assert sum(tracer.calls.values()) == 0
+
+
+def test_tracer_is_thread_local():
+    traced = threading.Event()
+    done = threading.Event()
+
+    def untraced():
+        traced.wait()
+        for _ in range(50):
+            stanley_predicted_verb.paradigm_from_root("tɔl")
+        done.set()
+
+    thread = threading.Thread(target=untraced)
+    thread.start()
+    with RuleTracer() as tracer:
+        traced.set()
+        stanley_predicted_verb.paradigm_from_root("pigɔm")
+        done.wait()
+    thread.join()
+    assert tracer.calls["stanley", "future"] == 1
+    assert ("stanley", "future: l-final root") not in tracer.counts
+
+
+def test_tracer_counts_each_verb(monkeypatch):
+    verbs = get_data_from_csv(test_csv) * 2
+    with RuleTracer() as tracer:
+        prediction_report(verbs, workers=1)
+    assert tracer.calls["stanley", "future"] == len(verbs)
+    # a lexicon big enough for a process pool is still traced, in process
+    monkeypatch.setattr(report, "parallel_threshold", 0)
+    with RuleTracer() as tracer:
+        prediction_report(verbs, workers=2)
+    assert tracer.calls["stanley", "future"] == len(verbs)
+    with RuleTracer() as tracer:
+        stanley_predicted_verb.predict_many([("pigɔm", "pigɔm")] * 3)
+        hansen_predicted_verb.predict_many(["pigis"] * 2)
+    assert tracer.calls["stanley", "future"] == 3
+    assert tracer.calls["hansen", "future"] == 2
@@ -0,0 +1,96 @@
+import http.client
+import json
+import threading
+import urllib.request
+
+import pytest
+
+from kovol_language_tools.service import KovolService, make_server
+
+test_csv = "tests/test_data.csv"
+
+
+def test_service_endpoints():
+    service = KovolService(test_csv)
+    words = service.handle("orthography", {"words": ["pigɔm", "pigɔx"]})["results"]
+    assert words[0] == {"orthography": "pigom", "errors": []}
+    assert words[1]["errors"]
+
+    predicted = service.handle(
+        "predict",
+        {"verbs": [{"remote_past_1s": "pigɔm", "recent_past_1s": "pigɔm"}, {}]},
+    )["results"]
+    assert predicted[0]["paradigm"]["future_1s"] == "piginim"
+    assert "error" in predicted[1]
+    hansen = service.handle("predict", {"rules": "hansen", "verbs": [{"future_3p": "pigis"}]})
+    assert hansen["results"][0]["paradigm"]["future_3p"] == "pigis"
+
+    found = service.handle("lookup", {"forms": ["piginim", "nothing"]})["results"]
+    assert {"english": "to put", "slot": "future_1s", "source": "attested"} in found[0]
+    assert found[1] == []
+
+    compared = service.handle("compare", {"english": ["to put", "to fly"]})["results"]
+    assert isinstance(compared[0], dict)
+    assert "error" in compared[1]
+    pair = [["a"] * 20, ["a"] * 19 + ["b"]]
+    assert service.handle("compare", {"pairs": [pair]})["results"] == [
+        {"plural_imperative": ("b", "a")}
+    ]
+
+    with pytest.raises(ValueError):
+        service.handle("predict", {"rules": "newest", "verbs": []})
+    with pytest.raises(ValueError):
+        service.handle("compare", [])
+    with pytest.raises(ValueError):
+        service.handle("compare", {"pairs": [[["a"] * 21, ["a"] * 21]]})
+    with pytest.raises(ValueError):
+        service.handle("lookup", {"forms": "piginim"})
+    bad = service.handle("predict", {"verbs": [{"remote_past_1s": 1, "recent_past_1s": 2}]})
+    assert "error" in bad["results"][0]
+    status = service.status()
+    assert status["verbs"] == 3
+    assert status["endpoints"]["predict"]["requests"] == 4
+    assert status["endpoints"]["predict"]["errors"] == 1
+    assert status["endpoints"]["lookup"]["items"] == 2
+
+
+def test_service_http():
+    service = KovolService(test_csv)
+
+    def broken(request):
+        raise RuntimeError("broken")
+
+    service.endpoints["broken"] = broken
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        request = urllib.request.Request(
+            f"{url}/orthography", data=json.dumps({"words": ["pigɔm"]}).encode()
+        )
+        with urllib.request.urlopen(request) as response:
+            assert json.load(response)["results"][0]["orthography"] == "pigom"
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            assert json.load(response)["endpoints"]["orthography"]["requests"] == 1
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(urllib.request.Request(f"{url}/nothing", data=b"{}"))
+        assert error.value.code == 404
+        for path, body in (("compare", b"[]"), ("orthography", b'{"words": [1]}')):
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(urllib.request.Request(f"{url}/{path}", data=body))
+            assert error.value.code == 400
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(urllib.request.Request(f"{url}/broken", data=b"{}"))
+        assert error.value.code == 500
+        for length, status in (("abc", 400), ("-1", 400), (None, 411), ("99999999", 413)):
+            connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+            connection.putrequest("POST", "/orthography")
+            if length is not None:
+                connection.putheader("Content-Length", length)
+            connection.endheaders()
+            assert connection.getresponse().status == status
+            connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -1,6 +1,6 @@
 from kovol_language_tools.verbs.csv_reader import get_data_from_csv
 from kovol_language_tools.verbs.kovol_verb import KovolVerb
-from kovol_language_tools.verbs.stanley_predicted_verb import StanleyPredictedVerb as SV
+from kovol_language_tools.verbs.stanley_predicted_verb import StanleyPredictedVerb as SV, predict_many, stanley_paradigm
 test_csv = "tests/test_data.csv"
 
 def verb1():
@@ -21,3 +21,17 @@ def test_stanley_errors():
     v, p = verb1()
     assert p.get_prediction_errors(v) == {}
     assert p.get_prediction_errors(KovolVerb("piginim", "")) != {}
+
+def test_stanley_predict_many():
+    inputs = [("pigɔm", "pigɔm"), ("asɔm", "asogɔm"), ("pigɔm", "pigɔm")]
+    predictions = predict_many(inputs)
+    assert len(predictions) == 3
+    for (remote, recent), p in zip(inputs, predictions):
+        assert p == SV(remote, recent).get_all_conjugations()
+
+def test_stanley_paradigm():
+    v, p = verb1()
+    paradigm = stanley_paradigm("pigɔm", "pigɔm")
+    assert type(paradigm) == tuple
+    assert len(paradigm) == 20
+    assert paradigm == p.get_all_conjugations()
@@ -0,0 +1,48 @@
+import pytest
+
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv, iter_verbs_from_csv
+from kovol_language_tools.verbs.predictors import predict_paradigm
+from kovol_language_tools.verbs.synthetic import synthetic_verbs, write_synthetic_csv
+from kovol_language_tools.verbs.validation import validate_csv
+
+
+def conjugations(verbs):
+    return {v.english: v.get_all_conjugations() for v in verbs}
+
+
+def test_synthetic_verbs_follow_rules():
+    for rules in ("stanley", "hansen"):
+        verbs = list(synthetic_verbs(200, seed=1, rules=rules))
+        assert [v.english for v in verbs[:2]] == ["to verb 0", "to verb 1"]
+        assert all(predict_paradigm(v, rules) == v.get_all_conjugations() for v in verbs)
+    assert conjugations(synthetic_verbs(50, seed=2)) == conjugations(
+        synthetic_verbs(50, seed=2)
+    )
+    with pytest.raises(ValueError):
+        next(synthetic_verbs(1, rules="smith"))
+
+
+def test_synthetic_verbs_irregularity_and_noise():
+    verbs = list(synthetic_verbs(500, irregularity=0.2))
+    irregular = [v for v in verbs if predict_paradigm(v) != v.get_all_conjugations()]
+    assert 50 < len(irregular) < 150
+
+    noisy = list(synthetic_verbs(500, noise=0.05, kinds=("blank",)))
+    blanks = sum(f == "" for v in noisy for f in v.get_all_conjugations())
+    assert 250 < blanks < 750
+    ig = list(synthetic_verbs(500, noise=1, kinds=("ig",)))
+    assert all(v.future_2s.endswith(" ig") for v in ig)
+    assert not any(v.future_1s.endswith(" ig") for v in ig)
+
+
+def test_write_synthetic_csv(tmp_path):
+    options = dict(rules="mixed", irregularity=0.1, noise=0.02, short=0.5)
+    expected = conjugations(synthetic_verbs(300, seed=3, **options))
+    path = str(tmp_path / "lexicon.csv.gz")
+    assert write_synthetic_csv(path, 300, seed=3, **options) == 300
+    assert conjugations(get_data_from_csv(path)) == expected
+    assert list(validate_csv(path, workers=1)) == []
+
+    path = str(tmp_path / "shuffled.csv")
+    write_synthetic_csv(path, 300, seed=3, shuffle=True, **options)
+    assert conjugations(iter_verbs_from_csv(path, grouped=False, run_size=1000)) == expected
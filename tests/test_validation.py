@@ -0,0 +1,58 @@
+from kovol_language_tools.verbs import validation
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.validation import ValidationIssue, validate_csv
+
+test_csv = "tests/test_data.csv"
+
+
+def write_bad_csv(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text(
+        "\n".join(
+            [
+                "Actor,Tense,Mode,Kovol word,English",
+                "1s,future,,pigɔx,to put",
+                "2s,future,,pigɔx,to put",
+                "3s,future,,abstɔm,to put",
+                "1p,future,,,to put",
+                "2p,future,,pigɔm,to put",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+def test_validate_csv(tmp_path, monkeypatch):
+    assert list(validate_csv(test_csv)) == []
+
+    issues = list(validate_csv(write_bad_csv(tmp_path)))
+    assert [(i.row, i.column, i.kind) for i in issues] == [
+        (2, "kov", "character"),
+        (3, "kov", "character"),
+        (4, "kov", "ccc"),
+    ]
+    assert issues[0].detail == "Unexpected character: x, position 5"
+
+    # the pool gives the same issues
+    monkeypatch.setattr(validation, "parallel_threshold", 1)
+    assert list(validate_csv(write_bad_csv(tmp_path), workers=2)) == issues
+
+
+def test_get_data_from_csv_validate(tmp_path):
+    issues = []
+    verbs = get_data_from_csv(write_bad_csv(tmp_path), validate=issues.append)
+    assert len(verbs) == 1
+    assert issues[2] == ValidationIssue(
+        4, "kov", "ccc", "CCC cluster was found: bst"
+    )
+
+
+def test_validate_blank_lines(tmp_path):
+    path = tmp_path / "blank.csv"
+    rows = open(write_bad_csv(tmp_path), encoding="utf-8").read().split("\n")
+    path.write_text("\n".join(rows[:2] + ["", ""] + rows[2:]), encoding="utf-8")
+    issues = []
+    get_data_from_csv(str(path), validate=issues.append)
+    assert [i.row for i in issues] == [2, 5, 6]
+    assert list(validate_csv(str(path))) == issues
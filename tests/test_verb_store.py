@@ -0,0 +1,64 @@
+from kovol_language_tools.verbs.csv_reader import get_data_from_csv
+from kovol_language_tools.verbs.stanley_predicted_verb import StanleyPredictedVerb as SV
+from kovol_language_tools.verbs.verb_store import VerbStore
+
+test_csv = "tests/test_data.csv"
+
+
+def test_import_and_read_back():
+    verbs = get_data_from_csv(test_csv)
+    with VerbStore() as store:
+        assert store.import_csv(test_csv) == 3
+        assert len(store) == 3
+        assert [vars(v) for v in store.get_page(page_size=10)] == [vars(v) for v in verbs]
+        assert [vars(v) for v in store.iter_verbs(page_size=2)] == [vars(v) for v in verbs]
+        assert [v.english for v in store.get_page(1, page_size=2)] == [verbs[2].english]
+        assert vars(store.get_verb("to put")) == vars(verbs[0])
+        assert store.get_verb("to fly") is None
+
+
+def test_import_streams():
+    expected = [vars(v) for v in get_data_from_csv(test_csv)]
+    for grouped in (False, True):
+        with VerbStore() as store:
+            assert store.import_csv(test_csv, batch_size=2, grouped=grouped) == 3
+            assert [vars(v) for v in store.get_page(page_size=10)] == expected
+
+
+def test_lookups():
+    with VerbStore() as store:
+        store.import_csv(test_csv)
+        assert ("to put", "recent_past_1s", "attested") in store.find_form("pigɔm")
+        assert ("to put", "remote_past_1s", "hansen") in store.find_form("pigom")
+        assert [v.english for v in store.find_root("pig")] == ["to put"]
+        v = store.get_verb("to put")
+        assert store.get_prediction("to put") == SV(
+            v.remote_past_1s, v.recent_past_1s
+        ).get_all_conjugations()
+
+
+def test_update_and_remove(tmp_path):
+    path = str(tmp_path / "verbs.sqlite")
+    with VerbStore(path) as store:
+        store.import_csv(test_csv)
+        v = store.get_verb("to put")
+        v.author = "Steve"
+        v.remote_past_1s = "pigɔmɔm"
+        store.add_verb(v)
+    with VerbStore(path) as store:
+        assert len(store) == 3
+        assert store.get_verb("to put").author == "Steve"
+        assert ("to put", "remote_past_1s", "attested") in store.find_form("pigɔmɔm")
+        store.remove_verb("to put")
+        assert store.find_form("pigɔmɔm") == []
+        assert len(store) == 2
+
+
+def test_duplicate_english_in_batch():
+    first = SV("pigɔm", "pigɔm", "to put")
+    second = SV("tɔlɔm", "tɔlagɔm", "to put")
+    with VerbStore() as store:
+        assert store.add_verbs([first, second]) == 2
+        assert len(store) == 1
+        assert store.get_verb("to put").remote_past_1s == "tɔlɔm"
+        assert store.find_form("pigɔm") == []